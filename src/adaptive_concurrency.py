@@ -0,0 +1,74 @@
+"""
+Control adaptativo de concurrencia (AIMD) para el análisis de perfiles.
+Sube el número de peticiones en vuelo mientras todo va bien y lo recorta
+a la mitad ante timeouts, páginas "Sorry", redirecciones al login o HTTP 429.
+"""
+
+import asyncio  # Condición asíncrona. Usado en AdaptiveConcurrency.
+import time  # Marcas de tiempo. Usado en el historial y el enfriamiento.
+
+
+class AdaptiveConcurrency:
+    """
+    Límite de concurrencia AIMD:
+    - Aumento aditivo: +increase por cada ventana completa de éxitos (+increase/limit por éxito)
+    - Disminución multiplicativa: limit * decrease ante una señal de congestión,
+      como mucho una vez cada cooldown segundos para no desplomarse con una ráfaga de fallos
+    """
+
+    def __init__(self, initial, minimum=1, maximum=30, increase=1.0, decrease=0.5,
+                 latency_target=None, cooldown=2.0, on_change=None):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.on_change = on_change
+
+        self.in_flight = 0
+        self.last_decrease = 0.0
+        self.history = [(time.time(), int(self.limit), "inicio")]
+        self.condition = asyncio.Condition()
+
+    @property
+    def current(self):
+        return int(self.limit)
+
+    def saturated(self):
+        """True si no queda hueco bajo el límite actual: acquire() tendría que esperar"""
+        return self.in_flight >= self.current
+
+    async def acquire(self):
+        """Espera hasta que haya hueco bajo el límite actual"""
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.current)
+            self.in_flight += 1
+
+    async def release(self, congested, latency=None):
+        """Libera el hueco y ajusta el límite según el resultado observado"""
+        async with self.condition:
+            self.in_flight -= 1
+            previous = self.current
+            now = time.time()
+
+            if congested:
+                if now - self.last_decrease >= self.cooldown:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self.last_decrease = now
+                    reason = "congestión"
+                else:
+                    reason = None
+            elif self.latency_target and latency is not None and latency > self.latency_target:
+                # Latencia alta: mantener sin subir
+                reason = None
+            else:
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+                reason = "estable"
+
+            if reason and self.current != previous:
+                self.history.append((now, self.current, reason))
+                if self.on_change:
+                    self.on_change(previous, self.current, reason)
+            self.condition.notify_all()
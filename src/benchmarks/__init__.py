@@ -0,0 +1,4 @@
+"""
+Benchmarks offline contra un servidor local que imita Instagram.
+Ejecutar desde src/: python -m benchmarks.<nombre>
+"""
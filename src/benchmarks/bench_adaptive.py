@@ -0,0 +1,69 @@
+"""
+Benchmark: concurrencia fija vs adaptativa (AIMD) contra un servidor que limita.
+El servidor local responde HTTP 429 cuando hay más de --server-limit peticiones en vuelo.
+Usa el motor HTTP (no requiere navegador).
+
+Uso (desde src/):
+    python -m benchmarks.bench_adaptive --profiles 600 --server-limit 12 --fixed 5 25
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import asyncio  # Asincronía. Usado en run_mode.
+import os  # Rutas temporales. Usado en main.
+import tempfile  # Directorio temporal. Usado en main.
+import time  # Cronómetro. Usado en run_mode.
+
+from benchmarks.common import configure_env, write_dummy_cookies
+from benchmarks.mock_instagram import MockInstagramServer
+
+
+def run_mode(ig_scraper, server, cookies_file, usernames, workers, adaptive):
+    ig_scraper.ADAPTIVE_CONCURRENCY = adaptive
+    server.throttled = 0
+
+    start = time.perf_counter()
+    results = asyncio.run(ig_scraper.fetch_profiles_http(cookies_file, usernames, workers))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": f"{'adaptativa' if adaptive else 'fija'} ({workers})",
+        "profiles_per_min": len(usernames) / elapsed * 60,
+        "found": sum(1 for _, count, _ in results if count is not None),
+        "throttled": server.throttled,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=600)
+    parser.add_argument("--latency", type=float, default=0.05, help="Latencia por petición (s)")
+    parser.add_argument("--server-limit", type=int, default=12, help="Peticiones en vuelo antes de HTTP 429")
+    parser.add_argument("--fixed", type=int, nargs="+", default=[5, 25], help="Concurrencias fijas a comparar")
+    parser.add_argument("--initial", type=int, default=5, help="Concurrencia inicial del modo adaptativo")
+    args = parser.parse_args()
+
+    server = MockInstagramServer(latency=args.latency, max_in_flight=args.server_limit).start()
+    configure_env(server.base_url, ADAPTIVE_MAX_WORKERS=40, ADAPTIVE_COOLDOWN_S=0.5)
+
+    # Importar después de configurar el entorno (ig_scraper lee .env al importarse)
+    import ig_scraper
+
+    usernames = [f"user_{i}" for i in range(args.profiles)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cookies_file = write_dummy_cookies(os.path.join(tmp, "cookies.json"), server.base_url)
+        reports = [
+            run_mode(ig_scraper, server, cookies_file, usernames, workers, adaptive=False)
+            for workers in args.fixed
+        ]
+        reports.append(run_mode(ig_scraper, server, cookies_file, usernames, args.initial, adaptive=True))
+    server.stop()
+
+    print()
+    print(f"{'Concurrencia':<16} | {'Perfiles/min':>12} | {'Encontrados':>11} | {'HTTP 429':>8}")
+    print(f"{'-'*16}-+-{'-'*12}-+-{'-'*11}-+-{'-'*8}")
+    for r in reports:
+        print(f"{r['mode']:<16} | {r['profiles_per_min']:>12.1f} | {r['found']:>11} | {r['throttled']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: conteo de primeros dígitos para Benford.
+Compara el método anterior de benford_analyzer (pd.read_csv del fichero completo,
+First_Digit a lista de Python y list.count por dígito) con benford_counts
+(solo las columnas necesarias, por bloques, np.bincount) sobre un CSV generado.
+Mide tiempo, filas/s y memoria máxima asignada (tracemalloc).
+
+Uso (desde src/, no requiere navegador):
+    python -m benchmarks.bench_benford --rows 2000000 --chunksize 500000
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import os  # Ruta del CSV temporal. Usado en main.
+import tempfile  # Directorio temporal. Usado en main.
+import time  # Cronómetro. Usado en measure.
+import tracemalloc  # Memoria máxima asignada. Usado en measure.
+
+import numpy as np
+import pandas as pd
+
+from benford_counts import digit_histogram
+
+
+def legacy_histogram(csv_path):
+    """Copia del conteo anterior de benford_analyzer"""
+    dataset = pd.read_csv(csv_path)
+    numeros = dataset["Num_Followers"].dropna()  # noqa: F841 (el método anterior también la extraía)
+    primeros_digitos = dataset["First_Digit"].dropna().astype(int).tolist()
+    return [primeros_digitos.count(d) for d in range(1, 10)]
+
+
+def write_csv(path, rows, missing_digit_rate, seed=0):
+    """CSV como el de save_results con seguidores ~Benford y First_Digit vacío en una fracción de filas"""
+    rng = np.random.default_rng(seed)
+    counts = np.floor(10 ** rng.uniform(0, 8, rows)).astype(np.int64)
+    digits = counts // 10 ** np.floor(np.log10(counts)).astype(np.int64)
+    frame = pd.DataFrame({
+        "Username": "benchmark_target",
+        "Username_Follower": [f"fan{i}" for i in range(rows)],
+        "Num_Followers": counts,
+        "First_Digit": pd.array(digits, dtype="Int64"),
+    })
+    frame.loc[rng.random(rows) < missing_digit_rate, "First_Digit"] = pd.NA
+    frame.to_csv(path, index=False)
+    return np.bincount(digits, minlength=10)[1:10]
+
+
+def measure(name, function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    histogram = function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"method": name, "seconds": elapsed, "peak_mb": peak / 1024 / 1024, "histogram": list(histogram)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Filas del CSV generado")
+    parser.add_argument("--chunksize", type=int, default=500_000, help="Filas por bloque (benford_counts)")
+    parser.add_argument("--missing-digit-rate", type=float, default=0.0,
+                        help="Fracción de filas sin First_Digit (solo las recupera benford_counts)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "benford_benchmark.csv")
+        expected = write_csv(csv_path, args.rows, args.missing_digit_rate)
+        reports = [
+            measure("anterior", legacy_histogram, csv_path),
+            measure("benford_counts", digit_histogram, csv_path, args.chunksize),
+        ]
+
+    print()
+    print(f"{'Método':<16} | {'Tiempo (s)':>10} | {'Filas/s':>12} | {'Memoria máx (MB)':>16} | {'Correcto':>8}")
+    print(f"{'-'*16}-+-{'-'*10}-+-{'-'*12}-+-{'-'*16}-+-{'-'*8}")
+    for r in reports:
+        correct = "sí" if r["histogram"] == list(expected) else "no"
+        print(f"{r['method']:<16} | {r['seconds']:>10.2f} | {args.rows / r['seconds']:>12.0f} | "
+              f"{r['peak_mb']:>16.1f} | {correct:>8}")
+
+
+if __name__ == "__main__":
+    main()
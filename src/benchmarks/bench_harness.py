@@ -0,0 +1,213 @@
+"""
+Benchmark de extremo a extremo: ejecuta las fases de main() (login, extracción de la lista,
+análisis de perfiles y guardado) contra el servidor local y reporta perfiles/min,
+latencia por perfil (p50/p95/p99) y RSS máximo.
+Sirve como referencia repetible para comparar cualquier cambio de MAX_WORKERS, esperas o bloqueo.
+
+Uso (desde src/; --engine hybrid requiere Chrome, ambos motores requieren Chromium de Playwright):
+    python -m benchmarks.bench_harness --engine playwright --list-size 300 --target 200 --workers 10 \\
+        --latency 0.05 --error-rate 0.02 --missing-rate 0.05 --delay-scale 0
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import asyncio  # Asincronía. Usado en run_phases.
+import functools  # Envoltorios. Usado en instrument.
+import os  # Rutas temporales. Usado en run_phases.
+import resource  # RSS máximo del proceso Python. Usado en main.
+import statistics  # Mediana. Usado en main.
+import tempfile  # Directorio temporal. Usado en main.
+import threading  # Muestreo de RSS en segundo plano. Usado en RssSampler.
+import time  # Cronómetro. Usado en instrument y run_phases.
+
+from benchmarks.common import configure_env, chromium_rss_mb, percentile
+from benchmarks.mock_instagram import MockInstagramServer, follower_count_for
+
+
+class RssSampler:
+    """Muestrea el RSS de Chromium/Chrome en un hilo (la fase Selenium es síncrona)"""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.peak_mb = max(self.peak_mb, chromium_rss_mb())
+            self.stop_event.wait(self.interval)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+
+
+def instrument(ig_scraper, stats):
+    """
+    Envuelve las funciones de ig_scraper que marcan las fases:
+    latencia de cada perfil y momento en que termina la extracción de la lista
+    """
+    def timed_profile(original):
+        @functools.wraps(original)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                stats["latencies"].append(end - start)
+                stats["first_profile"] = min(stats.get("first_profile", start), start)
+                stats["last_profile"] = max(stats.get("last_profile", end), end)
+        return wrapper
+
+    def timed_list_sync(original):
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            try:
+                return original(*args, **kwargs)
+            finally:
+                stats["list_done"] = time.perf_counter()
+        return wrapper
+
+    def timed_list_async(original):
+        @functools.wraps(original)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                stats["list_done"] = time.perf_counter()
+        return wrapper
+
+    ig_scraper.get_follower_count_playwright = timed_profile(ig_scraper.get_follower_count_playwright)
+    ig_scraper.get_follower_count_http = timed_profile(ig_scraper.get_follower_count_http)
+    ig_scraper.extract_list_selenium = timed_list_sync(ig_scraper.extract_list_selenium)
+    ig_scraper.extract_list_playwright = timed_list_async(ig_scraper.extract_list_playwright)
+
+
+def scale_delays(ig_scraper, scale):
+    """Escala las pausas humanas (login, clics, scroll) para no medir tiempo de espera fijo"""
+    original_sleep = ig_scraper.sleep
+
+    def human_delay(min_seconds=1.0, max_seconds=3.0):
+        original_sleep(ig_scraper.random.uniform(min_seconds, max_seconds) * scale)
+
+    async def human_delay_async(min_seconds=1.0, max_seconds=3.0):
+        await asyncio.sleep(ig_scraper.random.uniform(min_seconds, max_seconds) * scale)
+
+    ig_scraper.human_delay = human_delay
+    ig_scraper.human_delay_async = human_delay_async
+    ig_scraper.sleep = lambda seconds: original_sleep(seconds * scale)
+
+
+def run_phases(ig_scraper, engine, account, target, workers, tmp):
+    """Fases 1-3 de main() con las salidas redirigidas a tmp. Devuelve (followers_list, results)"""
+    logger = ig_scraper.logger
+    logger.log_file = os.path.join(tmp, "harness_log.txt")
+    logger.session_file = os.path.join(tmp, "session.json")
+    logger.csv_file = os.path.join(tmp, f"{account}_stats.csv")
+    logger.txt_file = os.path.join(tmp, f"{account}_stats.txt")
+    logger.results_store_dir = os.path.join(tmp, "results_store")
+    ig_scraper.account, ig_scraper.page, ig_scraper.count = account, "followers", target
+    targets = [(account, "followers", target)]
+
+    cookies_file = logger.session_file
+    journal = ig_scraper.ResultJournal(os.path.join(tmp, "journal.csv"))
+    try:
+        if engine == "playwright":
+            target_lists, results = asyncio.run(
+                ig_scraper.run_playwright_only(cookies_file, targets, workers, None, journal)
+            )
+        else:
+            target_lists, results = ig_scraper.run_selenium_phase(cookies_file, None, journal, targets)
+        followers_list = ig_scraper.unique_usernames(target_lists or {})
+        if followers_list and results is None:
+            results = asyncio.run(
+                ig_scraper.analyze_profiles_parallel(cookies_file, followers_list, workers, None, journal)
+            )
+        if results:
+            ig_scraper.save_results(account, {username: count for username, count in results})
+    finally:
+        journal.close()
+    return followers_list or [], results or []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engine", choices=("hybrid", "playwright"), default="playwright")
+    parser.add_argument("--profile-engine", choices=("playwright", "http"), default="playwright")
+    parser.add_argument("--pipeline", action="store_true", help="Solapar extracción y análisis (PIPELINE=1)")
+    parser.add_argument("--list-extraction", choices=("dom", "api"), default="dom",
+                        help="Lista por scroll del diálogo o por la API paginada (LIST_EXTRACTION)")
+    parser.add_argument("--account", default="benchmark_target")
+    parser.add_argument("--list-size", type=int, default=300, help="Seguidores de la cuenta en el servidor")
+    parser.add_argument("--target", type=int, default=200, help="Seguidores a extraer y analizar")
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="Latencia por petición (s)")
+    parser.add_argument("--render-delay-ms", type=int, default=300, help="Retardo de hidratación del enlace")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracción de perfiles con HTTP 500")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="Fracción de seguidores inexistentes")
+    parser.add_argument("--server-limit", type=int, default=None, help="Peticiones en vuelo antes de HTTP 429")
+    parser.add_argument("--delay-scale", type=float, default=0.0,
+                        help="Factor de las pausas humanas (0 = sin pausas, 1 = como en producción)")
+    args = parser.parse_args()
+
+    server = MockInstagramServer(
+        latency=args.latency,
+        render_delay_ms=args.render_delay_ms,
+        max_in_flight=args.server_limit,
+        error_rate=args.error_rate,
+        list_size=args.list_size,
+        missing_rate=args.missing_rate,
+        reliable_accounts=[args.account],
+    ).start()
+    configure_env(
+        server.base_url,
+        SCRAPER_ENGINE=args.engine,
+        PROFILE_ENGINE=args.profile_engine,
+        PIPELINE="1" if args.pipeline else "0",
+        LIST_EXTRACTION=args.list_extraction,
+        SESSION_REUSE="0",
+    )
+
+    # Importar después de configurar el entorno (ig_scraper lee .env al importarse)
+    import ig_scraper
+
+    stats = {"latencies": []}
+    instrument(ig_scraper, stats)
+    scale_delays(ig_scraper, args.delay_scale)
+
+    with tempfile.TemporaryDirectory() as tmp, RssSampler() as sampler:
+        start = time.perf_counter()
+        followers_list, results = run_phases(ig_scraper, args.engine, args.account, args.target, args.workers, tmp)
+        total = time.perf_counter() - start
+    server.stop()
+
+    latencies = stats["latencies"]
+    analysis = stats.get("last_profile", start) - stats.get("first_profile", start)
+    found = [(username, count) for username, count in results if count is not None]
+    correct = sum(1 for username, count in found if count == follower_count_for(username))
+
+    print()
+    print("=" * 60)
+    print(f"Motor: {args.engine} (perfiles: {args.profile_engine}{', pipeline' if args.pipeline else ''})")
+    print(f"Lista extraída:       {len(followers_list)}/{args.target} usuarios")
+    if "list_done" in stats:
+        print(f"Login + lista:        {stats['list_done'] - start:.1f} s")
+    print(f"Tiempo total:         {total:.1f} s")
+    print(f"Perfiles analizados:  {len(results)} ({len(found)} encontrados, {correct} exactos)")
+    if latencies:
+        print(f"Perfiles/min:         {len(latencies) / max(analysis, 1e-9) * 60:.1f} (ventana de análisis)")
+        print(f"Latencia por perfil:  p50 {statistics.median(latencies):.3f} s | "
+              f"p95 {percentile(latencies, 95):.3f} s | p99 {percentile(latencies, 99):.3f} s")
+    print(f"Servidor:             {server.requests} peticiones, {server.errors} HTTP 500, {server.throttled} HTTP 429")
+    print(f"RSS máx Chromium:     {sampler.peak_mb:.1f} MB")
+    print(f"RSS máx Python:       {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: recolección de usernames del diálogo de seguidores.
+Compara el método anterior (find_elements + get_attribute por enlace en cada iteración)
+con HARVEST_USERNAMES_SCRIPT (un execute_script por iteración, solo enlaces nuevos).
+Cada iteración añade --batch enlaces al diálogo, como haría un scroll.
+
+Uso (desde src/, requiere Chrome):
+    python -m benchmarks.bench_harvest --sizes 1000 5000 20000 --batch 50 --legacy-max 5000
+
+Resultados (--sizes 1000 2000 5000 20000 --batch 50 --legacy-max 2000; ChromeDriver 141.0.7390.122,
+chrome-headless-shell 141, servidor mock local):
+    Usuarios | Anterior (s) | Incremental (s)
+        1000 |       235.34 |            0.47
+        2000 |       747.00 |            0.86
+        5000 |      omitido |            1.63
+       20000 |      omitido |            9.40
+El método anterior crece de forma cuadrática (relee todos los enlaces en cada iteración) y a partir
+de 2000 usuarios se omite: 5000 habría tardado más de una hora.
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import time  # Cronómetro. Usado en run_harvest.
+
+from benchmarks.common import configure_env
+from benchmarks.mock_instagram import MockInstagramServer
+
+# Crea un diálogo vacío o añade un lote de enlaces de usuario (arguments: inicio, cantidad)
+APPEND_BATCH_SCRIPT = """
+let dialog = document.querySelector('div[role="dialog"]');
+if (!dialog) {
+    dialog = document.createElement('div');
+    dialog.setAttribute('role', 'dialog');
+    document.body.appendChild(dialog);
+}
+const start = arguments[0], count = arguments[1];
+let html = '';
+for (let i = start; i < start + count; i++) {
+    html += `<div><a href="/user_${i}/"><img></a><a href="/user_${i}/">user_${i}</a></div>`;
+}
+dialog.insertAdjacentHTML('beforeend', html);
+"""
+
+
+def harvest_legacy(driver, seen, account_name, By):
+    """Método anterior: un round trip WebDriver por enlace, incluidos los ya vistos"""
+    new = []
+    for link in driver.find_elements(By.XPATH, "//div[@role='dialog']//a[contains(@href, '/')]"):
+        href = link.get_attribute('href')
+        username = href.rstrip('/').split('/')[-1]
+        if username and username not in seen and username != account_name:
+            seen.add(username)
+            new.append(username)
+    return new
+
+
+def run_harvest(driver, base_url, size, batch, harvest):
+    driver.get(f"{base_url}/")
+    start = time.perf_counter()
+    harvested = 0
+    for offset in range(0, size, batch):
+        driver.execute_script(APPEND_BATCH_SCRIPT, offset, min(batch, size - offset))
+        harvested += len(harvest())
+    elapsed = time.perf_counter() - start
+    assert harvested == size, f"{harvested} != {size}"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--batch", type=int, default=50, help="Enlaces añadidos por iteración")
+    parser.add_argument("--legacy-max", type=int, default=5000,
+                        help="Tamaño máximo para medir el método anterior (crece cuadráticamente)")
+    args = parser.parse_args()
+
+    server = MockInstagramServer().start()
+    configure_env(server.base_url)
+
+    # Importar después de configurar el entorno (ig_scraper lee .env al importarse)
+    import ig_scraper
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    driver = webdriver.Chrome(options=options)
+
+    rows = []
+    try:
+        for size in args.sizes:
+            incremental = run_harvest(
+                driver, server.base_url, size, args.batch,
+                lambda: driver.execute_script(
+                    ig_scraper.HARVEST_USERNAMES_SCRIPT, "benchmark", ig_scraper.INSTAGRAM_HOST
+                ),
+            )
+            legacy = None
+            if size <= args.legacy_max:
+                seen = set()
+                legacy = run_harvest(
+                    driver, server.base_url, size, args.batch,
+                    lambda: harvest_legacy(driver, seen, "benchmark", By),
+                )
+            rows.append((size, legacy, incremental))
+    finally:
+        driver.quit()
+        server.stop()
+
+    print()
+    print(f"{'Usuarios':>8} | {'Anterior (s)':>12} | {'Incremental (s)':>15}")
+    print(f"{'-'*8}-+-{'-'*12}-+-{'-'*15}")
+    for size, legacy, incremental in rows:
+        legacy_str = f"{legacy:.2f}" if legacy is not None else "omitido"
+        print(f"{size:>8} | {legacy_str:>12} | {incremental:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
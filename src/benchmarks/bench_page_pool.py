@@ -0,0 +1,81 @@
+"""
+Benchmark: página nueva por perfil vs página reutilizada por worker.
+Mide perfiles/minuto y RSS máximo de Chromium contra el servidor local.
+
+Uso (desde src/):
+    python -m benchmarks.bench_page_pool --profiles 200 --workers 10 --latency 0.05
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import asyncio  # Asincronía. Usado en run_mode.
+import os  # Rutas temporales. Usado en main.
+import tempfile  # Directorio temporal. Usado en main.
+import time  # Cronómetro. Usado en run_mode.
+
+from benchmarks.common import configure_env, write_dummy_cookies, chromium_rss_mb
+from benchmarks.mock_instagram import MockInstagramServer
+
+
+async def sample_rss(peak, stop_event, interval=0.2):
+    """Muestrea el RSS de Chromium hasta que se active stop_event"""
+    while not stop_event.is_set():
+        peak[0] = max(peak[0], chromium_rss_mb())
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_mode(ig_scraper, cookies_file, usernames, workers, reuse_pages):
+    peak = [0.0]
+    stop_event = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(peak, stop_event))
+
+    start = time.perf_counter()
+    results = await ig_scraper.fetch_profiles_playwright(cookies_file, usernames, workers, reuse_pages)
+    elapsed = time.perf_counter() - start
+
+    stop_event.set()
+    await sampler
+    found = sum(1 for _, count, _ in results if count is not None)
+    return {
+        "mode": "pool" if reuse_pages else "per-profile",
+        "profiles_per_min": len(usernames) / elapsed * 60,
+        "elapsed_s": elapsed,
+        "found": found,
+        "peak_rss_mb": peak[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="Latencia por petición (s)")
+    args = parser.parse_args()
+
+    server = MockInstagramServer(latency=args.latency).start()
+    configure_env(server.base_url)
+
+    # Importar después de configurar el entorno (ig_scraper lee .env al importarse)
+    import ig_scraper
+
+    usernames = [f"user_{i}" for i in range(args.profiles)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cookies_file = write_dummy_cookies(os.path.join(tmp, "cookies.json"), server.base_url)
+        reports = [
+            asyncio.run(run_mode(ig_scraper, cookies_file, usernames, args.workers, reuse_pages=False)),
+            asyncio.run(run_mode(ig_scraper, cookies_file, usernames, args.workers, reuse_pages=True)),
+        ]
+    server.stop()
+
+    print()
+    print(f"{'Modo':<12} | {'Perfiles/min':>12} | {'Tiempo (s)':>10} | {'Encontrados':>11} | {'RSS máx (MB)':>12}")
+    print(f"{'-'*12}-+-{'-'*12}-+-{'-'*10}-+-{'-'*11}-+-{'-'*12}")
+    for r in reports:
+        print(f"{r['mode']:<12} | {r['profiles_per_min']:>12.1f} | {r['elapsed_s']:>10.1f} | "
+              f"{r['found']:>11} | {r['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark: parser de número de seguidores.
+Compara el parser anterior (tres re.search sin compilar por texto y, en el método
+alternativo, una llamada por línea del body) con follower_parser (una expresión
+precompilada, una pasada) sobre un corpus de textos de perfil en varios idiomas.
+Mide parses/s y aciertos frente al valor esperado.
+
+Uso (desde src/, no requiere navegador):
+    python -m benchmarks.bench_parser --corpus 50000 --repeat 3
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import random  # Corpus reproducible. Usado en build_corpus.
+import re  # Parser anterior. Usado en legacy_parse.
+import time  # Cronómetro. Usado en run_parser.
+
+from follower_parser import parse_follower_count
+
+
+def legacy_parse(text):
+    """Copia del parse_follower_count anterior (solo inglés, K/M)"""
+    if not text:
+        return None
+    text = text.lower().strip()
+    patterns = [
+        (r'([\d,\.]+)\s*m\s*followers?', 'M'),
+        (r'([\d,\.]+)\s*k\s*followers?', 'K'),
+        (r'([\d,\.]+)\s*followers?', None),
+    ]
+    for pattern, unit in patterns:
+        match = re.search(pattern, text)
+        if match:
+            num_str = match.group(1)
+            if unit == 'M':
+                return int(float(num_str.replace(',', '.')) * 1_000_000)
+            elif unit == 'K':
+                return int(float(num_str.replace(',', '.')) * 1_000)
+            clean_num = num_str.replace(',', '').replace('.', '')
+            if clean_num.isdigit():
+                return int(clean_num)
+            try:
+                return int(float(clean_num))
+            except ValueError:
+                continue
+    return None
+
+
+def legacy_parse_body(text):
+    """Método alternativo anterior: una llamada por línea que contenga 'follower'"""
+    if 'followers' not in text.lower():
+        return None
+    for line in text.split('\n'):
+        if 'follower' in line.lower():
+            count = legacy_parse(line)
+            if count is not None:
+                return count
+    return None
+
+
+# Formatos de número por idioma: (separador de miles, separador decimal, sufijos K/M/B, palabra clave)
+LOCALE_FORMATS = {
+    "en": (",", ".", ("K", "M", "B"), "followers"),
+    "es": (".", ",", (" mil", " M", " mil millones"), "seguidores"),
+    "pt": (".", ",", (" mil", " mi", " bi"), "seguidores"),
+    "fr": (" ", ",", (" k", " M", " Md"), "abonnés"),
+    "de": (".", ",", (" Tsd.", " Mio.", " Mrd."), "Follower"),
+}
+
+
+def format_count(count, locale):
+    """Devuelve (texto como lo muestra Instagram, valor que representa) con un decimal truncado"""
+    thousands, decimal, suffixes, _ = LOCALE_FORMATS[locale]
+    if count < 10_000:
+        return f"{count:,}".replace(",", thousands), count
+    for scale, suffix in zip((1_000_000_000, 1_000_000, 1_000), reversed(suffixes)):
+        if count >= scale:
+            tenths = count * 10 // scale
+            whole, fraction = divmod(tenths, 10)
+            text = f"{whole}{decimal}{fraction}" if fraction else str(whole)
+            return text + suffix, tenths * scale // 10
+    return str(count), count
+
+
+def build_corpus(size, seed=0):
+    """Corpus de (tipo, texto, esperado): enlaces, og:description y body completo"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        locale = rng.choice(list(LOCALE_FORMATS))
+        keyword = LOCALE_FORMATS[locale][3]
+        count = int(10 ** rng.uniform(0, 9.5))
+        short, expected = format_count(count, locale)
+        kind = rng.choice(("link", "meta", "body"))
+        if kind == "link":
+            text = f"{short} {keyword}"
+        elif kind == "meta":
+            exact = f"{count:,}".replace(",", LOCALE_FORMATS[locale][0])
+            text = f"{exact} {keyword.capitalize()}, {rng.randint(0, 999)} Following, {rng.randint(0, 999)} Posts - " \
+                   f"See Instagram photos and videos from user (@user)"
+            expected = count
+        else:
+            lines = [f"Line {i} of navigation and bio text" for i in range(rng.randint(20, 60))]
+            lines.insert(rng.randint(0, len(lines)), f"{rng.randint(1, 999)} posts")
+            lines.insert(rng.randint(0, len(lines)), f"{short}\n{keyword}")
+            text = "\n".join(lines)
+        corpus.append((kind, text, expected))
+    return corpus
+
+
+def run_parser(name, corpus, parse, parse_body, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        values = [parse_body(text) if kind == "body" else parse(text) for kind, text, _ in corpus]
+        best = min(best, time.perf_counter() - start)
+    correct = sum(1 for value, (_, _, expected) in zip(values, corpus) if value == expected)
+    return {
+        "parser": name,
+        "parses_per_sec": len(corpus) / best,
+        "accuracy": correct / len(corpus) * 100,
+        "none": sum(1 for value in values if value is None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=int, default=50000, help="Número de textos del corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (se toma la mejor)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.corpus, args.seed)
+    reports = [
+        run_parser("anterior", corpus, legacy_parse, legacy_parse_body, args.repeat),
+        run_parser("follower_parser", corpus, parse_follower_count, parse_follower_count, args.repeat),
+    ]
+
+    print()
+    print(f"{'Parser':<16} | {'Parses/s':>10} | {'Aciertos (%)':>12} | {'None':>6}")
+    print(f"{'-'*16}-+-{'-'*10}-+-{'-'*12}-+-{'-'*6}")
+    for r in reports:
+        print(f"{r['parser']:<16} | {r['parses_per_sec']:>10.0f} | {r['accuracy']:>12.1f} | {r['none']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: espera fija (2 s + selectores) vs espera por eventos.
+Mide la latencia por perfil (p50/p95) contra el servidor local.
+
+Uso (desde src/):
+    python -m benchmarks.bench_readiness --profiles 100 --workers 10 --render-delay-ms 300
+"""
+
+import argparse  # Argumentos de línea de comandos. Usado en main.
+import asyncio  # Asincronía. Usado en run_mode.
+import os  # Rutas temporales. Usado en main.
+import statistics  # Mediana. Usado en run_mode.
+import tempfile  # Directorio temporal. Usado en main.
+import time  # Cronómetro. Usado en run_mode.
+
+from benchmarks.common import configure_env, write_dummy_cookies, percentile
+from benchmarks.mock_instagram import MockInstagramServer
+
+
+async def run_mode(ig_scraper, cookies_file, usernames, workers, readiness):
+    ig_scraper.PROFILE_READINESS = readiness
+    original = ig_scraper.get_follower_count_playwright
+    latencies = []
+
+    async def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    ig_scraper.get_follower_count_playwright = timed
+    try:
+        results = await ig_scraper.fetch_profiles_playwright(cookies_file, usernames, workers)
+    finally:
+        ig_scraper.get_follower_count_playwright = original
+
+    return {
+        "mode": readiness,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "found": sum(1 for _, count, _ in results if count is not None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="Latencia por petición (s)")
+    parser.add_argument("--render-delay-ms", type=int, default=300, help="Retardo de hidratación del enlace")
+    args = parser.parse_args()
+
+    server = MockInstagramServer(latency=args.latency, render_delay_ms=args.render_delay_ms).start()
+    configure_env(server.base_url)
+
+    # Importar después de configurar el entorno (ig_scraper lee .env al importarse)
+    import ig_scraper
+
+    usernames = [f"user_{i}" for i in range(args.profiles)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cookies_file = write_dummy_cookies(os.path.join(tmp, "cookies.json"), server.base_url)
+        reports = [
+            asyncio.run(run_mode(ig_scraper, cookies_file, usernames, args.workers, "fixed")),
+            asyncio.run(run_mode(ig_scraper, cookies_file, usernames, args.workers, "event")),
+        ]
+    server.stop()
+
+    print()
+    print(f"{'Modo':<8} | {'p50 (s)':>8} | {'p95 (s)':>8} | {'Encontrados':>11}")
+    print(f"{'-'*8}-+-{'-'*8}-+-{'-'*8}-+-{'-'*11}")
+    for r in reports:
+        print(f"{r['mode']:<8} | {r['p50']:>8.3f} | {r['p95']:>8.3f} | {r['found']:>11}")
+
+
+if __name__ == "__main__":
+    main()
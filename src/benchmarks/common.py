@@ -0,0 +1,61 @@
+"""
+Utilidades compartidas por los benchmarks
+"""
+
+import json  # Cookies ficticias. Usado en write_dummy_cookies.
+import os  # Variables entorno y /proc. Usado en configure_env y chromium_rss_mb.
+
+
+def configure_env(base_url, **overrides):
+    """
+    Prepara las variables de entorno que ig_scraper lee al importarse.
+    Debe llamarse ANTES de importar ig_scraper.
+    """
+    os.environ.setdefault("IG_USERNAME", "benchmark")
+    os.environ.setdefault("IG_PASSWORD", "benchmark")
+    os.environ["IG_BASE_URL"] = base_url
+    os.environ["PROFILE_CACHE"] = "0"
+    os.environ.setdefault("PROFILE_DELAY_MIN", "0")
+    os.environ.setdefault("PROFILE_DELAY_MAX", "0")
+    for key, value in overrides.items():
+        os.environ[key] = str(value)
+
+
+def write_dummy_cookies(path, base_url):
+    """Escribe un fichero de cookies en formato Selenium para el servidor local"""
+    host = base_url.split("://", 1)[-1].split(":")[0]
+    cookies = [{"name": "sessionid", "value": "benchmark", "domain": host, "path": "/"}]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cookies, f)
+    return path
+
+
+def chromium_rss_mb():
+    """Suma el RSS (MB) de todos los procesos Chromium/Chrome en ejecución"""
+    total_kb = 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+            if b"chrom" not in cmdline.lower():
+                continue
+            with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+
+def percentile(values, pct):
+    """Percentil por interpolación lineal (values no vacío)"""
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
@@ -0,0 +1,314 @@
+"""
+Servidor HTTP local que imita las páginas de Instagram que usa el scraper:
+login (con banner de cookies y diálogos "Not Now"), perfiles, página "Sorry"
+y el diálogo de seguidores con scroll que carga la lista por lotes, más la API
+paginada de la lista (/api/v1/friendships/<id>/<tipo>/ con cursor next_max_id).
+Los usuarios que empiezan por "missing" devuelven la página "Sorry".
+El enlace de seguidores se inserta por JavaScript tras render_delay_ms
+(como la hidratación de Instagram); el meta og:description viene en el HTML inicial.
+Con max_in_flight, las peticiones que superan esa concurrencia reciben HTTP 429.
+Con error_rate, esa fracción de peticiones de perfil recibe HTTP 500.
+Con list_counts, cada usuario de la API de la lista incluye su follower_count.
+"""
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler  # Servidor HTTP. Usado en MockInstagramServer.
+import threading  # Hilo del servidor. Usado en MockInstagramServer.start.
+import hashlib  # Conteos deterministas. Usado en follower_count_for.
+import json  # Respuestas de la API. Usado en route.
+import random  # Errores simulados. Usado en route.
+from urllib.parse import urlsplit, parse_qs, quote  # Parámetros de consulta. Usado en route.
+import time  # Latencia simulada. Usado en el handler.
+
+PROFILE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<title>{username} • Instagram</title>
+<meta property="og:description" content="{short} Followers, 150 Following, 12 Posts - See Instagram photos and videos from {username} (@{username})">
+</head>
+<body>
+<header id="profile">
+  <img src="/static/avatar_{username}.png">
+  <h2>{username}</h2>
+</header>
+<script>
+setTimeout(() => {{
+  document.getElementById('profile').insertAdjacentHTML('beforeend', `
+  <ul>
+    <li><span>12</span> posts</li>
+    <li><a href="/{username}/followers/"><span title="{exact}">{short}</span> followers</a></li>
+    <li><a href="/{username}/following/"><span>150</span> following</a></li>
+  </ul>`);
+}}, {render_delay_ms});
+</script>
+</body>
+</html>
+"""
+
+LOGIN_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>Login • Instagram</title></head>
+<body>
+<div id="cookies"><button onclick="document.getElementById('cookies').remove()">Allow essential and optional cookies</button></div>
+<form action="/accounts/login/submit/" method="get">
+  <input name="username" type="text">
+  <input name="password" type="password">
+  <button type="submit">Log in</button>
+</form>
+</body>
+</html>
+"""
+
+# Página de inicio con sesión: buscador (verificación del login) y dos diálogos "Not Now" encadenados
+HOME_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>Instagram</title></head>
+<body>
+<input placeholder="Search" aria-label="Search input">
+<div id="dialog-1"><button onclick="this.parentNode.remove(); document.getElementById('dialog-2').hidden = false">Not Now</button></div>
+<div id="dialog-2" hidden><button onclick="this.parentNode.remove()">Not Now</button></div>
+</body>
+</html>
+"""
+
+# Diálogo de seguidores: primer lote en el HTML, el resto por fetch al acercarse al final del scroll
+FOLLOWERS_DIALOG_TEMPLATE = """
+<div role="dialog">
+  <div id="followers-list" style="height: 400px; overflow-y: auto">{rows}</div>
+</div>
+<script>
+(() => {{
+  const list = document.getElementById('followers-list');
+  let offset = {loaded}, loading = false, done = offset >= {total};
+  list.addEventListener('scroll', async () => {{
+    if (loading || done || list.scrollTop + list.clientHeight < list.scrollHeight - 50) return;
+    loading = true;
+    const response = await fetch('/api/mock/followers/?account={account}&offset=' + offset);
+    const data = await response.json();
+    list.insertAdjacentHTML('beforeend', data.rows);
+    offset += data.count;
+    done = data.done;
+    loading = false;
+  }});
+}})();
+</script>
+"""
+
+FOLLOWER_ROW_TEMPLATE = (
+    '<div style="height: 60px"><a href="/{username}/"><img src="/static/avatar_{username}.png"></a>'
+    '<a href="/{username}/">{username}</a></div>'
+)
+
+SORRY_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>Page not found • Instagram</title></head>
+<body><h2>Sorry, this page isn't available.</h2></body>
+</html>
+"""
+
+
+def follower_count_for(username):
+    """Número de seguidores determinista para un usuario ficticio"""
+    digest = hashlib.md5(username.encode("utf-8")).digest()
+    # Distribución aproximadamente logarítmica (tipo Benford)
+    exponent = digest[0] % 7
+    mantissa = 1 + digest[1] / 256 * 9
+    return int(mantissa * 10 ** exponent)
+
+
+def user_id_for(username):
+    """Id numérico determinista (como texto, igual que los pk de Instagram)"""
+    return str(int(hashlib.sha256(f"id:{username}".encode()).hexdigest()[:12], 16))
+
+
+def follower_usernames(account, list_size, missing_rate=0.0):
+    """Lista determinista de seguidores de una cuenta; una fracción missing_rate no existe"""
+    usernames = []
+    for i in range(list_size):
+        username = f"{account}_fan{i}"
+        if missing_rate and hashlib.md5(username.encode("utf-8")).digest()[2] / 256 < missing_rate:
+            username = f"missing_{username}"
+        usernames.append(username)
+    return usernames
+
+
+def format_short(count):
+    """Formato corto estilo Instagram: 1,234 / 12.3K / 1.2M"""
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}".removesuffix(".0") + "M"
+    if count >= 10_000:
+        return f"{count / 1_000:.1f}".removesuffix(".0") + "K"
+    return f"{count:,}"
+
+
+class MockInstagramServer:
+    """
+    Servidor local configurable: latencia, retardo de renderizado, límite de concurrencia,
+    tasa de errores HTTP 500 en perfiles, tamaño de la lista de seguidores y fracción de
+    seguidores inexistentes. Las cuentas de reliable_accounts (las objetivo) nunca fallan.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, render_delay_ms=300, max_in_flight=None,
+                 error_rate=0.0, list_size=200, batch_size=12, missing_rate=0.0, reliable_accounts=(), seed=0,
+                 list_counts=False):
+        self.latency = latency
+        self.render_delay_ms = render_delay_ms
+        self.max_in_flight = max_in_flight
+        self.error_rate = error_rate
+        self.list_size = list_size
+        self.batch_size = batch_size
+        self.missing_rate = missing_rate
+        self.list_counts = list_counts
+        self.accounts_by_id = {}  # Ids entregados por web_profile_info, para la API de la lista
+        self.reliable_accounts = set(reliable_accounts)  # Cuentas objetivo: nunca reciben HTTP 500
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                    server.in_flight += 1
+                    throttled = server.max_in_flight is not None and server.in_flight > server.max_in_flight
+                    if throttled:
+                        server.throttled += 1
+                try:
+                    if server.latency:
+                        time.sleep(server.latency)
+                    if throttled:
+                        status, content_type, body = 429, "text/plain", "Please wait a few minutes"
+                    else:
+                        status, content_type, body, *extra = server.route(self.path, self.headers)
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                for name, value in (extra[0] if extra else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def followers_rows(self, account, offset):
+        """HTML del lote de seguidores que empieza en offset, y cuántos incluye"""
+        usernames = follower_usernames(account, self.list_size, self.missing_rate)[offset:offset + self.batch_size]
+        rows = "".join(FOLLOWER_ROW_TEMPLATE.format(username=username) for username in usernames)
+        return rows, len(usernames)
+
+    def friendships_page(self, user_id, max_id, page_size):
+        """Página JSON de la lista (mismo formato que /api/v1/friendships/) a partir del cursor max_id"""
+        account = self.accounts_by_id.get(user_id)
+        if account is None:
+            return 404, "application/json", json.dumps({"message": "user not found", "status": "fail"})
+        offset = int(max_id or 0)
+        usernames = follower_usernames(account, self.list_size, self.missing_rate)[offset:offset + page_size]
+        users = []
+        for username in usernames:
+            user = {"pk": user_id_for(username), "username": username, "full_name": "", "is_private": False}
+            if self.list_counts and not username.startswith("missing"):
+                user["follower_count"] = follower_count_for(username)
+            users.append(user)
+        data = {"users": users, "page_size": page_size, "big_list": self.list_size > page_size, "status": "ok"}
+        if offset + len(usernames) < self.list_size:
+            data["next_max_id"] = str(offset + len(usernames))
+        return 200, "application/json", json.dumps(data)
+
+    def fail_randomly(self):
+        """Decide si una petición de perfil recibe HTTP 500 (según error_rate)"""
+        if not self.error_rate:
+            return False
+        with self.lock:
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return failed
+
+    def route(self, path, headers=None):
+        """Devuelve (status, content_type, body) o (status, content_type, body, cabeceras) para una ruta"""
+        parts = urlsplit(path)
+        path = parts.path
+        query = parse_qs(parts.query)
+        logged_in = bool(headers and "sessionid=" in (headers.get("Cookie") or ""))
+        if path.startswith("/static/"):
+            return 200, "image/png", ""
+        if path == "/accounts/edit/":
+            # Sesión válida si llega la cookie sessionid
+            if logged_in:
+                return 200, "text/html; charset=utf-8", "<html><body>Edit profile</body></html>"
+            return 302, "text/html; charset=utf-8", ""
+        if path == "/accounts/login/":
+            return 200, "text/html; charset=utf-8", LOGIN_TEMPLATE
+        if path == "/accounts/login/submit/":
+            username = query.get("username", ["user"])[0]
+            cookie = f"sessionid=mock-{quote(username)}; Path=/; Max-Age=86400"
+            return 302, "text/html; charset=utf-8", "", {"Location": "/", "Set-Cookie": cookie}
+        if path == "/api/mock/followers/":
+            offset = int(query.get("offset", ["0"])[0])
+            rows, count = self.followers_rows(query.get("account", [""])[0], offset)
+            data = {"rows": rows, "count": count, "done": offset + count >= self.list_size}
+            return 200, "application/json", json.dumps(data)
+        if path.startswith("/api/v1/friendships/"):
+            segments = path.strip("/").split("/")
+            if len(segments) != 5 or segments[4] not in ("followers", "following"):
+                return 404, "application/json", json.dumps({"status": "fail"})
+            page_size = int(query.get("count", ["12"])[0])
+            return self.friendships_page(segments[3], query.get("max_id", [None])[0], page_size)
+        if path == "/api/v1/users/web_profile_info/":
+            username = parse_qs(parts.query).get("username", [""])[0]
+            if username not in self.reliable_accounts and self.fail_randomly():
+                return 500, "application/json", json.dumps({"status": "fail"})
+            if not username or username.startswith("missing"):
+                return 404, "application/json", json.dumps({"data": {"user": None}, "status": "ok"})
+            user_id = user_id_for(username)
+            self.accounts_by_id[user_id] = username
+            user = {"id": user_id, "username": username, "edge_followed_by": {"count": follower_count_for(username)}}
+            return 200, "application/json", json.dumps({"data": {"user": user}, "status": "ok"})
+        segments = path.strip("/").split("/")
+        username = segments[0]
+        if not username:
+            return 200, "text/html; charset=utf-8", HOME_TEMPLATE if logged_in else LOGIN_TEMPLATE
+        if username not in self.reliable_accounts and self.fail_randomly():
+            return 500, "text/html; charset=utf-8", "<html><body>Something went wrong</body></html>"
+        if username.startswith("missing"):
+            return 404, "text/html; charset=utf-8", SORRY_TEMPLATE
+        count = follower_count_for(username)
+        body = PROFILE_TEMPLATE.format(
+            username=username,
+            exact=f"{count:,}",
+            short=format_short(count),
+            render_delay_ms=self.render_delay_ms,
+        )
+        if len(segments) > 1 and segments[1] in ("followers", "following"):
+            rows, loaded = self.followers_rows(username, 0)
+            dialog = FOLLOWERS_DIALOG_TEMPLATE.format(
+                rows=rows, loaded=loaded, total=self.list_size, account=quote(username)
+            )
+            body = body.replace("</body>", dialog + "</body>")
+        return 200, "text/html; charset=utf-8", body
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
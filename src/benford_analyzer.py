@@ -1,140 +1,274 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+"""
+Análisis de la Ley de Benford sobre los CSV de resultados del scraper.
+Se puede importar (analizar_conteos, analizar_csv, analizar_histogramas) o usar como CLI con uno o
+varios ficheros, directorios o globs; cada CSV genera un informe JSON y un PNG.
+Los ficheros se reparten entre procesos y matplotlib solo se importa si hay que
+dibujar, con la API orientada a objetos (sin backend interactivo ni ventanas).
+
+Uso:
+    python benford_analyzer.py resultados.csv
+    python benford_analyzer.py logs/ "archivo/*_stats_*.csv" --output-dir informes --workers 4
+    python benford_analyzer.py datos.csv --no-plot --bootstrap 5000
+"""
+
+import argparse # Argumentos de línea de comandos. Usado en main.
+import glob # Expansión de patrones. Usado en expandir_entradas.
+import json # Informe por fichero. Usado en guardar_informe.
+import os # Rutas y número de CPUs. Usado en todo el módulo.
+import sys # Código de salida. Usado en main.
+from concurrent.futures import ProcessPoolExecutor # Un proceso por fichero. Usado en analizar_lote.
+from datetime import datetime # Fecha del informe. Usado en analizar_histogramas.
+from functools import partial # Opciones fijas para el pool. Usado en analizar_lote.
+
 import numpy as np
-import math
-import tkinter as tk # Importa la librería tkinter
-from tkinter import filedialog # Importa el módulo filedialog
-import sys
-import os 
-from datetime import datetime
 
+from benford_counts import DEFAULT_CHUNKSIZE, chunk_first_digits, histogram_from_digits, read_digit_columns
+from benford_stats import TEST_DIGITS, benford_test, digit_histogram_for
+
+PRUEBAS = ("first", "second", "first_two")
 
 
-def guardar_imagen(csv_path):
+### Conteo
+def histogramas_csv(csv_path, pruebas=PRUEBAS, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Histogramas de dígitos de cada prueba en una sola pasada por bloques del CSV.
+    El primer dígito sale de First_Digit (o de Num_Followers si falta); el segundo
+    y los dos primeros, de Num_Followers.
+    """
+    histogramas = {prueba: np.zeros(len(TEST_DIGITS[prueba]), dtype=np.int64) for prueba in pruebas}
+    for counts, digits in read_digit_columns(csv_path, chunksize):
+        for prueba in pruebas:
+            if prueba == "first":
+                histogramas[prueba] += histogram_from_digits(chunk_first_digits(counts, digits))
+            elif counts is not None:
+                histogramas[prueba] += digit_histogram_for(counts, prueba)
+    return histogramas
+
+
+### Gráfico
+def graficar_benford(frecuencias, ruta_png, titulo="Ley de Benford aplicada a número de seguidores"):
+    """
+    Barras y curva de los porcentajes reales frente a Benford, con la tabla de frecuencias.
+    matplotlib se importa aquí: solo cuando se pide un gráfico.
+    """
+    from matplotlib.figure import Figure # Figura sin pyplot: renderizado Agg, sin ventanas
+
+    frecuencias = np.asarray(frecuencias)
+    total = frecuencias.sum()
+    digitos = np.arange(1, 10)
+    porcentajes_reales = frecuencias / total * 100
+    porcentajes_benford = np.log10(1 + 1 / digitos) * 100
+
+    fig = Figure(figsize=(14, 6))
+    ax = fig.add_subplot()
+
+    # Barras para datos reales
+    ax.bar(digitos, porcentajes_reales, alpha=0.6, label="Datos reales: Num_Followers")
+
+    # Curva de Benford
+    ax.plot(digitos, porcentajes_benford, marker="o", linestyle="-", color="red", label="Ley de Benford (teórica)")
+    ax.plot(digitos, porcentajes_reales, marker="o", linestyle="-", color="black", label="Porcentaje real")
+
+    # Agregar porcentaje real encima de cada marcador
+    for digito, valor in zip(digitos, porcentajes_reales):
+        ax.text(digito, valor + 0.5, f"{valor:.2f}%", ha='center', va='bottom', fontsize=10, color='blue')
+
+    ax.set_xticks(digitos)
+    ax.set_xlabel("Primer dígito")
+    ax.set_ylabel("Porcentaje (%)")
+    ax.set_title(titulo)
+    ax.legend()
+    ax.grid(True)
+
+    # --- Tabla con frecuencia y porcentaje, más la fila Total ---
+    tabla_data = [
+        [digito, int(f), f"{real:.2f}%", f"{benford:.2f}%"]
+        for digito, f, real, benford in zip(digitos, frecuencias, porcentajes_reales, porcentajes_benford)
+    ]
+    tabla_data.append(["Total", int(total), f"{porcentajes_reales.sum():.2f}%", f"{porcentajes_benford.sum():.2f}%"])
+
+    # Añadir tabla al lado derecho del gráfico
+    column_labels = ["Dígito", "Frecuencia", "Porcentaje real", "Porcentaje Benford"]
+    table = ax.table(cellText=tabla_data,
+                     colLabels=column_labels,
+                     colColours=["lightblue"]*4,
+                     cellLoc="center",
+                     loc="right",
+                     bbox=[1.05, 0.1, 0.45, 0.8])  # [x, y, ancho, alto]
+    table.auto_set_font_size(False)
+    table.set_fontsize(7)
+    fig.tight_layout()
+
+    fig.savefig(ruta_png, dpi=300, bbox_inches="tight")
+    return ruta_png
+
+
+### Informe
+def analizar_histogramas(histogramas, ruta_base=None, plot=True, bootstrap=1000, seed=None, origen=None):
+    """
+    Ejecuta las pruebas de Benford sobre histogramas ya contados ({prueba: frecuencias}).
+    Con ruta_base escribe ruta_base.json y, si plot, ruta_base.png (primer dígito).
+    Devuelve el informe como dict.
+    """
+    informe = {
+        "origen": origen,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "pruebas": {},
+        "png": None,
+        "json": None,
+    }
+    for prueba, histograma in histogramas.items():
+        if np.sum(histograma):
+            informe["pruebas"][prueba] = benford_test(histograma, prueba, bootstrap=bootstrap, seed=seed).to_dict()
+
+    if ruta_base:
+        if plot and "first" in informe["pruebas"]:
+            informe["png"] = graficar_benford(histogramas["first"], f"{ruta_base}.png")
+        informe["json"] = guardar_informe(informe, f"{ruta_base}.json")
+    return informe
+
+
+def analizar_conteos(conteos, ruta_base=None, plot=True, bootstrap=1000, seed=None, pruebas=PRUEBAS,
+                     origen=None):
     """
-    Guarda la imagen generada en la misma carpeta del archivo CSV.
-    El nombre será benford_plot.png
+    Pruebas de Benford sobre números de seguidores ya en memoria (None = sin dato),
+    sin pasar por un CSV. Misma salida que analizar_csv.
     """
-    carpeta = os.path.dirname(csv_path)  # Obtiene la carpeta del CSV
-    
-    # Fecha y hora actual (ej: 2025-11-23_10-42-55)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    nombre_archivo = f"benford_{timestamp}.png"
-    ruta_guardado = os.path.join(carpeta, nombre_archivo)
+    valores = np.array([np.nan if conteo is None else conteo for conteo in conteos], dtype=np.float64)
+    histogramas = {prueba: digit_histogram_for(valores, prueba) for prueba in pruebas}
+    return analizar_histogramas(histogramas, ruta_base, plot, bootstrap, seed, origen)
 
-    plt.savefig(ruta_guardado, dpi=300, bbox_inches="tight")
-    print(f"\nImagen guardada en: {ruta_guardado}")
 
+def guardar_informe(informe, ruta_json):
+    with open(ruta_json, "w", encoding="utf-8") as f:
+        json.dump({**informe, "json": ruta_json}, f, ensure_ascii=False, indent=2)
+    return ruta_json
 
 
-### Dataset
-#dataset = pd.read_csv("teeli__peachmuffin_stats_hybrid_20251109-221258.csv")
+def ruta_informe(csv_path, output_dir=None):
+    """Ruta base del informe: <output_dir o carpeta del CSV>/<nombre del CSV>_benford"""
+    carpeta = output_dir or os.path.dirname(os.path.abspath(csv_path))
+    nombre = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(carpeta, f"{nombre}_benford")
 
-# Verificar si se pasó un path como argumento
-if len(sys.argv) > 1:
-    file_path = sys.argv[1]
-    print(f"Archivo proporcionado por argumento: {file_path}")
-else:
-    root = tk.Tk()
-    root.withdraw()
 
-    # Abre el diálogo para seleccionar el archivo
-    file_path = filedialog.askopenfilename(
-        title="Selecciona el archivo CSV de estadísticas",
-        filetypes=(("Archivos CSV", "*.csv"), ("Todos los archivos", "*.*"))
+def analizar_csv(csv_path, output_dir=None, plot=True, bootstrap=1000, seed=None, chunksize=DEFAULT_CHUNKSIZE,
+                 pruebas=PRUEBAS):
+    """Cuenta los dígitos de un CSV (por bloques), ejecuta las pruebas y escribe su informe JSON/PNG"""
+    histogramas = histogramas_csv(csv_path, pruebas, chunksize)
+    return analizar_histogramas(
+        histogramas, ruta_informe(csv_path, output_dir), plot, bootstrap, seed, origen=os.path.abspath(csv_path)
     )
 
-# Verifica si se seleccionó un archivo
-if file_path:
-    print(f"Archivo seleccionado: {file_path}")
-
-    ## 📊 Carga del Dataset
-    try:
-        dataset = pd.read_csv(file_path)
-    except Exception as e:
-        print(f"Error al leer el archivo: {e}")
-        # Termina el script si hay un error de lectura
-        exit()
-
-    print("\n¡Datos cargados y columna 'Num_Followers' extraída con éxito!")
-    # Puedes continuar con el resto de tu análisis usando 'dataset' y 'numeros'
 
-else:
-    print("No se seleccionó ningún archivo. El script ha terminado.")
-    exit()
+### Lote
+def expandir_entradas(entradas):
+    """Ficheros CSV de una lista de ficheros, directorios (sus *.csv) y globs, sin duplicados"""
+    rutas = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            rutas.extend(sorted(glob.glob(os.path.join(entrada, "*.csv"))))
+        elif glob.has_magic(entrada):
+            rutas.extend(sorted(glob.glob(entrada, recursive=True)))
+        else:
+            rutas.append(entrada)
+    return list(dict.fromkeys(os.path.abspath(ruta) for ruta in rutas))
 
-### Extraer columna Num_Followers
-numeros = dataset["Num_Followers"].dropna()  # eliminar NaN
 
-
-# --- Usar la columna "Primer_Digito" directamente ---
-primeros_digitos = dataset["First_Digit"].dropna().astype(int).tolist()
-
-
-### Calcular frecuencia y porcentaje reales
-total = len(primeros_digitos)
-frecuencias_reales = [primeros_digitos.count(d) for d in range(1, 10)]
-porcentajes_reales = [(f / total) * 100 for f in frecuencias_reales]
-
-### Ley de Benford (teórica)
-porcentajes_benford = [(math.log10(1 + 1/d)) * 100 for d in range(1, 10)]
-
-### Graficar
-digitos = np.arange(1, 10)
-plt.figure(figsize=(14, 6))
-
-# Barras para datos reales
-plt.bar(digitos, porcentajes_reales, alpha=0.6, label="Datos reales: Num_Followers")
-
-# Curva de Benford
-plt.plot(digitos, porcentajes_benford, marker="o", linestyle="-", color="red", label="Ley de Benford (teórica)")
-plt.plot(digitos, porcentajes_reales, marker="o", linestyle="-", color="black", label="Porcentaje real")
-
-# Agregar porcentaje real encima de cada marcador
-for i, valor in enumerate(porcentajes_reales):
-    plt.text(digitos[i], valor + 0.5, f"{valor:.2f}%", ha='center', va='bottom', fontsize=10, color='blue')
+def analizar_seguro(csv_path, **opciones):
+    """analizar_csv para el pool: devuelve (csv_path, informe, error) en lugar de lanzar"""
+    try:
+        return csv_path, analizar_csv(csv_path, **opciones), None
+    except Exception as e:
+        return csv_path, None, f"{type(e).__name__}: {e}"
 
 
-plt.xticks(digitos)
-plt.xlabel("Primer dígito")
-plt.ylabel("Porcentaje (%)")
-plt.title("Ley de Benford aplicada a número de seguidores")
-plt.legend()
-plt.grid(True)
+def analizar_lote(csv_paths, workers=None, **opciones):
+    """Analiza varios CSV repartidos entre procesos. Devuelve [(csv_path, informe, error)] en orden"""
+    workers = min(workers or os.cpu_count() or 1, len(csv_paths))
+    tarea = partial(analizar_seguro, **opciones)
+    if workers <= 1:
+        return [tarea(ruta) for ruta in csv_paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(tarea, csv_paths))
 
-# --- Crear tabla con frecuencia y porcentaje ---
-# Formatear los datos de la tabla
-tabla_data = []
-for i in range(9):
-    tabla_data.append([digitos[i], frecuencias_reales[i], f"{porcentajes_reales[i]:.2f}%", f"{porcentajes_benford[i]:.2f}%"])
 
-# --- Agregar fila Total ---
-total_frecuencia = sum(frecuencias_reales)
-total_porcentaje_real = sum(porcentajes_reales)
-total_porcentaje_benford = sum(porcentajes_benford)
+def resumen_informe(informe):
+    """Una línea por prueba: chi-cuadrado, MAD con su banda y KS"""
+    lineas = []
+    for prueba, r in informe["pruebas"].items():
+        lineas.append(
+            f"{prueba:<9} n={r['n']:<7} chi2={r['chi_square']:.2f} (p={r['chi_square_p_value']:.4f}) "
+            f"MAD={r['mad']:.4f} ({r['mad_conformity']}) KS={r['ks']:.4f} (crítico {r['ks_critical']:.4f})"
+        )
+    return lineas
 
-tabla_data.append([
-    "Total",                 # Columna Dígito
-    total_frecuencia,        # Suma de frecuencias
-    f"{total_porcentaje_real:.2f}%",   # Total porcentaje real
-    f"{total_porcentaje_benford:.2f}%" # Total porcentaje Benford
-])
 
-# Añadir tabla al lado derecho del gráfico
-column_labels = ["Dígito","Frecuencia", "Porcentaje real", "Porcentaje Benford"]
-table = plt.table(cellText=tabla_data,
-                  colLabels=column_labels,
-                  colColours=["lightblue"]*4,
-                  cellLoc="center",
-                  loc="right",
-                  bbox=[1.05, 0.1, 0.45, 0.8])  # [x, y, ancho, alto]
+def seleccionar_archivo():
+    """Diálogo de selección de archivo (solo si no se pasan rutas y hay entorno gráfico)"""
+    import tkinter as tk # Importa la librería tkinter
+    from tkinter import filedialog # Importa el módulo filedialog
 
+    root = tk.Tk()
+    root.withdraw()
+    return filedialog.askopenfilename(
+        title="Selecciona el archivo CSV de estadísticas",
+        filetypes=(("Archivos CSV", "*.csv"), ("Todos los archivos", "*.*"))
+    )
 
-# Aumentar tamaño de letra
-table.auto_set_font_size(False)
-table.set_fontsize(7) 
-plt.tight_layout()
 
-guardar_imagen(file_path)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entradas", nargs="*", help="CSV, directorios o globs (sin rutas: diálogo de selección)")
+    parser.add_argument("--output-dir", help="Carpeta de los informes (por defecto, la del CSV)")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos en paralelo (por defecto, CPUs)")
+    parser.add_argument("--no-plot", action="store_true", help="Solo informe JSON, sin PNG")
+    parser.add_argument("--bootstrap", type=int, default=1000, help="Remuestras bootstrap (0 = sin IC)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Filas por bloque al leer")
+    args = parser.parse_args(argv)
+
+    entradas = args.entradas
+    if not entradas:
+        try:
+            seleccionado = seleccionar_archivo()
+        except Exception as e:
+            parser.error(f"indica al menos un CSV (no hay entorno gráfico: {e})")
+        if not seleccionado:
+            print("No se seleccionó ningún archivo. El script ha terminado.")
+            return 1
+        entradas = [seleccionado]
+
+    csv_paths = expandir_entradas(entradas)
+    if not csv_paths:
+        print("No se encontraron archivos CSV.")
+        return 1
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    print(f"Analizando {len(csv_paths)} archivo(s)...")
+    resultados = analizar_lote(
+        csv_paths,
+        args.workers,
+        output_dir=args.output_dir,
+        plot=not args.no_plot,
+        bootstrap=args.bootstrap,
+        seed=args.seed,
+        chunksize=args.chunksize,
+    )
 
-plt.show()
+    errores = 0
+    for csv_path, informe, error in resultados:
+        print(f"\n{csv_path}")
+        if error:
+            errores += 1
+            print(f"  Error: {error}")
+            continue
+        for linea in resumen_informe(informe):
+            print(f"  {linea}")
+        print(f"  Informe: {informe['json']}" + (f" | Imagen: {informe['png']}" if informe["png"] else ""))
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
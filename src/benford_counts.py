@@ -0,0 +1,91 @@
+"""
+Conteo de primeros dígitos para la Ley de Benford con NumPy.
+Lee del CSV solo las columnas necesarias y por bloques (chunksize), obtiene el
+primer dígito de forma vectorizada y acumula el histograma con np.bincount,
+sin cargar el fichero entero ni recorrer las filas en Python.
+"""
+
+import numpy as np  # Cálculo vectorizado. Usado en leading_digits y digit_histogram.
+
+# Filas por bloque al leer el CSV
+DEFAULT_CHUNKSIZE = 1_000_000
+
+COUNT_COLUMN = "Num_Followers"
+DIGIT_COLUMN = "First_Digit"
+
+
+def leading_digits(values, count=1):
+    """
+    Los count primeros dígitos de cada valor como entero (p. ej. count=2: 1234 -> 12);
+    0 para valores no finitos o con menos de count dígitos.
+    Usa log10 para la magnitud y corrige con aritmética entera los errores de
+    redondeo cerca de las potencias de 10 (p. ej. 999_999_999_999_999).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.isfinite(values) & (values >= 10 ** (count - 1))
+    numbers = np.where(valid, values, 10 ** (count - 1)).astype(np.int64)
+
+    powers = 10 ** np.floor(np.log10(numbers)).astype(np.int64)
+    powers = np.where(powers > numbers, powers // 10, powers)
+    powers = np.where(numbers // powers >= 10, powers * 10, powers)
+    return np.where(valid, numbers // (powers // 10 ** (count - 1)), 0)
+
+
+def first_digits(values):
+    """Primer dígito (1-9) de cada valor; 0 para valores no positivos o no finitos"""
+    return leading_digits(values, 1).astype(np.int8)
+
+
+def histogram_from_digits(digits):
+    """Frecuencias de los dígitos 1-9 (array de 9 enteros); ignora 0 y valores fuera de rango"""
+    digits = np.asarray(digits)
+    digits = digits[(digits >= 1) & (digits <= 9)].astype(np.int64)
+    return np.bincount(digits, minlength=10)[1:10]
+
+
+def histogram_from_counts(counts):
+    """Frecuencias de los primeros dígitos 1-9 a partir de números de seguidores"""
+    return histogram_from_digits(first_digits(counts))
+
+
+def read_digit_columns(csv_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Recorre el CSV por bloques leyendo solo Num_Followers y First_Digit.
+    Genera (counts, digits) por bloque; cada uno es un array float64 o None si la columna no existe.
+    """
+    # pandas solo para leer el CSV: quien solo calcula dígitos (ig_scraper) no lo carga
+    import pandas as pd  # Lectura del CSV por bloques. Usado en read_digit_columns.
+
+    columns = set(pd.read_csv(csv_path, nrows=0).columns)
+    usecols = [column for column in (COUNT_COLUMN, DIGIT_COLUMN) if column in columns]
+    if not usecols:
+        raise ValueError(f"{csv_path}: faltan las columnas {COUNT_COLUMN} y {DIGIT_COLUMN}")
+
+    chunks = pd.read_csv(
+        csv_path, usecols=usecols, dtype={column: np.float64 for column in usecols}, chunksize=chunksize
+    )
+    for chunk in chunks:
+        counts = chunk[COUNT_COLUMN].to_numpy() if COUNT_COLUMN in chunk else None
+        digits = chunk[DIGIT_COLUMN].to_numpy() if DIGIT_COLUMN in chunk else None
+        yield counts, digits
+
+
+def chunk_first_digits(counts, digits):
+    """Primeros dígitos de un bloque: First_Digit y, donde falta, el calculado de Num_Followers"""
+    if digits is None:
+        return first_digits(counts)
+    if counts is not None:
+        digits = np.where(np.isnan(digits), first_digits(counts), digits)
+    return np.nan_to_num(digits)
+
+
+def digit_histogram(csv_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Frecuencias de los primeros dígitos 1-9 de un CSV de resultados.
+    Usa First_Digit y, donde falta (columna ausente o celda vacía), lo calcula
+    a partir de Num_Followers. Solo se leen esas dos columnas, por bloques.
+    """
+    histogram = np.zeros(9, dtype=np.int64)
+    for counts, digits in read_digit_columns(csv_path, chunksize):
+        histogram += histogram_from_digits(chunk_first_digits(counts, digits))
+    return histogram
@@ -0,0 +1,227 @@
+"""
+Pruebas de conformidad con la Ley de Benford.
+Para el primer dígito, el segundo dígito y los dos primeros dígitos calcula:
+chi-cuadrado (estadístico, p-valor y valor crítico), MAD con las bandas de
+conformidad de Nigrini y Kolmogorov-Smirnov, más intervalos de confianza
+bootstrap obtenidos con un único remuestreo multinomial vectorizado (sin bucles
+de Python). Solo depende de NumPy.
+"""
+
+import math  # Función gamma incompleta. Usado en chi_square_p_value.
+from dataclasses import dataclass, asdict  # Resultado estructurado. Usado en BenfordTestResult.
+
+import numpy as np  # Cálculo vectorizado. Usado en todo el módulo.
+
+from benford_counts import leading_digits  # Dígitos iniciales vectorizados. Usado en digit_histogram_for.
+
+# Dígitos posibles de cada prueba
+TEST_DIGITS = {
+    "first": np.arange(1, 10),
+    "second": np.arange(0, 10),
+    "first_two": np.arange(10, 100),
+}
+
+
+def expected_proportions(test):
+    """Proporciones teóricas de Benford para la prueba indicada"""
+    digits = TEST_DIGITS[test]
+    if test == "second":
+        first = np.arange(1, 10)[:, None]
+        return np.log10(1 + 1 / (10 * first + digits[None, :])).sum(axis=0)
+    return np.log10(1 + 1 / digits)
+
+
+# Bandas MAD de Nigrini (límite superior de cada banda); por encima: sin conformidad
+MAD_BANDS = {
+    "first": ((0.006, "conformidad cercana"), (0.012, "conformidad aceptable"), (0.015, "conformidad marginal")),
+    "second": ((0.008, "conformidad cercana"), (0.010, "conformidad aceptable"), (0.012, "conformidad marginal")),
+    "first_two": ((0.0012, "conformidad cercana"), (0.0018, "conformidad aceptable"),
+                  (0.0022, "conformidad marginal")),
+}
+NONCONFORMITY = "sin conformidad"
+
+# Valores críticos de chi-cuadrado por grados de libertad (8, 9 y 89) y nivel de significación
+CHI_SQUARE_CRITICAL = {
+    0.05: {8: 15.507, 9: 16.919, 89: 112.022},
+    0.01: {8: 20.090, 9: 21.666, 89: 122.942},
+}
+# Coeficiente del valor crítico de KS (c / sqrt(n)) por nivel de significación
+KS_COEFFICIENTS = {0.10: 1.22, 0.05: 1.36, 0.01: 1.63}
+
+
+@dataclass
+class BenfordTestResult:
+    """Resultado de una prueba de Benford sobre un histograma de dígitos"""
+    test: str
+    n: int
+    digits: list
+    counts: list
+    observed: list  # Proporciones observadas
+    expected: list  # Proporciones de Benford
+    chi_square: float
+    chi_square_dof: int
+    chi_square_p_value: float
+    chi_square_critical: float
+    chi_square_reject: bool
+    mad: float
+    mad_conformity: str
+    ks: float
+    ks_critical: float
+    ks_reject: bool
+    alpha: float
+    confidence: float
+    # Intervalos bootstrap (inferior, superior); None sin remuestreo
+    chi_square_ci: tuple = None
+    mad_ci: tuple = None
+    ks_ci: tuple = None
+    observed_ci: list = None  # Un intervalo por dígito
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def digit_histogram_for(values, test="first"):
+    """Histograma de los dígitos de la prueba a partir de números (ignora los que no tienen esos dígitos)"""
+    digits = TEST_DIGITS[test]
+    if test == "first":
+        observed = leading_digits(values, 1)
+    else:
+        observed = leading_digits(values, 2)
+        if test == "second":
+            observed = np.where(observed >= 10, observed % 10, -1)
+    observed = observed[(observed >= digits[0]) & (observed <= digits[-1])] - digits[0]
+    return np.bincount(observed, minlength=len(digits))
+
+
+def chi_square_p_value(statistic, dof):
+    """P-valor de chi-cuadrado: función gamma incompleta superior regularizada Q(dof/2, x/2)"""
+    a, x = dof / 2, statistic / 2
+    if x <= 0:
+        return 1.0
+    log_prefactor = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # Serie de la gamma inferior: P(a, x) = e^(-x) x^a / Γ(a+1) * Σ x^n / ((a+1)...(a+n))
+        term = total = 1 / a
+        denominator = a
+        while abs(term) > abs(total) * 1e-15:
+            denominator += 1
+            term *= x / denominator
+            total += term
+        return max(0.0, 1 - total * math.exp(log_prefactor))
+    # Fracción continua de Lentz para Q(a, x)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefactor) * h)
+
+
+def chi_square_critical(dof, alpha=0.05):
+    """Valor crítico tabulado o, si no está en la tabla, aproximación de Wilson-Hilferty"""
+    table = CHI_SQUARE_CRITICAL.get(alpha, {})
+    if dof in table:
+        return table[dof]
+    z = {0.10: 1.2816, 0.05: 1.6449, 0.01: 2.3263}[alpha]
+    return dof * (1 - 2 / (9 * dof) + z * math.sqrt(2 / (9 * dof))) ** 3
+
+
+def mad_conformity(mad, test):
+    for limit, label in MAD_BANDS[test]:
+        if mad <= limit:
+            return label
+    return NONCONFORMITY
+
+
+def statistics_matrix(counts, expected):
+    """
+    Chi-cuadrado, MAD y KS de una o varias filas de frecuencias a la vez.
+    counts: (k,) o (B, k). Devuelve tres arrays con un valor por fila.
+    """
+    counts = np.atleast_2d(counts).astype(np.float64)
+    n = counts.sum(axis=1, keepdims=True)
+    observed = counts / n
+    chi_square = (n[:, 0] * ((observed - expected) ** 2 / expected).sum(axis=1))
+    mad = np.abs(observed - expected).mean(axis=1)
+    ks = np.abs(np.cumsum(observed, axis=1) - np.cumsum(expected)).max(axis=1)
+    return chi_square, mad, ks
+
+
+def benford_test(histogram, test="first", bootstrap=1000, confidence=0.95, alpha=0.05, seed=None):
+    """
+    Prueba de Benford sobre un histograma de dígitos (uno por dígito de TEST_DIGITS[test]).
+    bootstrap: número de remuestras para los intervalos de confianza (0 = sin intervalos).
+    """
+    counts = np.asarray(histogram, dtype=np.int64)
+    digits = TEST_DIGITS[test]
+    if counts.shape != digits.shape:
+        raise ValueError(f"La prueba '{test}' necesita {len(digits)} frecuencias, recibidas {counts.size}")
+    n = int(counts.sum())
+    if n == 0:
+        raise ValueError("Histograma vacío: no hay valores para la prueba")
+
+    expected = expected_proportions(test)
+    observed = counts / n
+    (chi_square,), (mad,), (ks,) = statistics_matrix(counts, expected)
+    dof = len(digits) - 1
+    critical = chi_square_critical(dof, alpha)
+    ks_critical = KS_COEFFICIENTS[alpha] / math.sqrt(n)
+
+    result = BenfordTestResult(
+        test=test,
+        n=n,
+        digits=digits.tolist(),
+        counts=counts.tolist(),
+        observed=observed.tolist(),
+        expected=expected.tolist(),
+        chi_square=float(chi_square),
+        chi_square_dof=dof,
+        chi_square_p_value=chi_square_p_value(float(chi_square), dof),
+        chi_square_critical=critical,
+        chi_square_reject=bool(chi_square > critical),
+        mad=float(mad),
+        mad_conformity=mad_conformity(mad, test),
+        ks=float(ks),
+        ks_critical=ks_critical,
+        ks_reject=bool(ks > ks_critical),
+        alpha=alpha,
+        confidence=confidence,
+    )
+
+    if bootstrap:
+        # Todas las remuestras de una vez: matriz (bootstrap, k) de frecuencias multinomiales
+        rng = np.random.default_rng(seed)
+        samples = rng.multinomial(n, observed, size=bootstrap)
+        quantiles = [(1 - confidence) / 2 * 100, (1 + confidence) / 2 * 100]
+        chi_squares, mads, kss = statistics_matrix(samples, expected)
+        result.chi_square_ci = tuple(np.percentile(chi_squares, quantiles).tolist())
+        result.mad_ci = tuple(np.percentile(mads, quantiles).tolist())
+        result.ks_ci = tuple(np.percentile(kss, quantiles).tolist())
+        result.observed_ci = np.percentile(samples / n, quantiles, axis=0).T.tolist()
+
+    return result
+
+
+def run_benford_tests(values, tests=("first", "second", "first_two"), **options):
+    """
+    Ejecuta las pruebas indicadas sobre números (p. ej. seguidores).
+    Devuelve {prueba: BenfordTestResult}; omite las pruebas sin valores válidos.
+    """
+    results = {}
+    for test in tests:
+        histogram = digit_histogram_for(values, test)
+        if histogram.sum():
+            results[test] = benford_test(histogram, test, **options)
+    return results
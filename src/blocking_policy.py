@@ -0,0 +1,278 @@
+"""
+Política declarativa de bloqueo de recursos y contabilidad de tráfico.
+Una política permite o deniega peticiones por tipo de recurso, dominio y patrón de URL.
+Se aplica una vez por contexto de Playwright y a Selenium por CDP (Network.setBlockedURLs).
+En Playwright la ruta solo recibe las URL que alguna regla de denegación puede bloquear:
+el filtro se evalúa en el navegador y el resto de peticiones no pasa por Python.
+BandwidthStats cuenta peticiones y bytes permitidos y bloqueados.
+"""
+
+import collections  # Contadores por tipo de recurso. Usado en BandwidthStats.
+import fnmatch  # Patrones de URL estilo glob. Usado en BlockingPolicy.
+import json  # Política desde fichero. Usado en BlockingPolicy.from_file.
+import re  # Patrones precompilados. Usado en BlockingPolicy.
+from urllib.parse import urlsplit  # Dominio de la URL. Usado en BlockingPolicy.decide.
+
+# Tipos de recurso de Playwright (request.resource_type)
+RESOURCE_TYPES = (
+    "document", "stylesheet", "image", "media", "font", "script", "texttrack", "xhr", "fetch",
+    "eventsource", "websocket", "manifest", "other",
+)
+
+# Extensiones por tipo, para traducir los tipos a patrones de URL en CDP (Network.setBlockedURLs no filtra por tipo)
+TYPE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "svg", "webp", "ico", "heic"),
+    "media": ("mp4", "webm", "m4a", "m4v", "mp3", "ogg"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "stylesheet": ("css",),
+}
+
+# Política por defecto: lo que ya se bloqueaba (imágenes, vídeo y /static/) más fuentes y telemetría.
+# Las hojas de estilo se permiten: el scroll del diálogo de seguidores depende de su overflow.
+DEFAULT_POLICY = {
+    "default": "allow",
+    "deny_types": ["image", "media", "font"],
+    "deny_domains": [
+        "connect.facebook.net",
+        "doubleclick.net",
+        "google-analytics.com",
+        "googletagmanager.com",
+    ],
+    "deny_patterns": [
+        "*/static/*",
+        "*/logging_client_events*",
+        "*/ajax/bz*",
+    ],
+    "allow_types": [],
+    "allow_domains": [],
+    "allow_patterns": [],
+}
+
+
+def compile_patterns(patterns):
+    """Une los patrones glob en una sola expresión regular (None si no hay patrones)"""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def domain_matches(host, domains):
+    """True si host es alguno de los dominios o un subdominio suyo"""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class BlockingPolicy:
+    """
+    Decide si una petición se permite. Orden de evaluación (gana la primera regla que coincide):
+    allow_patterns, deny_patterns, deny_domains, allow_domains (si hay lista, el resto se deniega),
+    allow_types, deny_types y, por último, default ("allow" o "deny").
+    """
+
+    def __init__(self, deny_types=(), allow_types=(), deny_domains=(), allow_domains=(),
+                 deny_patterns=(), allow_patterns=(), default="allow"):
+        if default not in ("allow", "deny"):
+            raise ValueError(f"default debe ser 'allow' o 'deny', no '{default}'")
+        for resource_type in (*deny_types, *allow_types):
+            if resource_type not in RESOURCE_TYPES:
+                raise ValueError(f"Tipo de recurso desconocido: '{resource_type}'")
+        self.deny_types = frozenset(deny_types)
+        self.allow_types = frozenset(allow_types)
+        self.deny_domains = tuple(domain.lower().lstrip(".") for domain in deny_domains)
+        self.allow_domains = tuple(domain.lower().lstrip(".") for domain in allow_domains)
+        self.deny_patterns = tuple(deny_patterns)
+        self.allow_patterns = tuple(allow_patterns)
+        self.deny_re = compile_patterns(self.deny_patterns)
+        self.allow_re = compile_patterns(self.allow_patterns)
+        self.default_allow = default == "allow"
+        # Decisión por dominio en caché: una página de perfil repite los mismos pocos hosts
+        self.host_decisions = {}
+
+    @classmethod
+    def from_dict(cls, policy):
+        known = {"deny_types", "allow_types", "deny_domains", "allow_domains", "deny_patterns", "allow_patterns",
+                 "default"}
+        unknown = set(policy) - known
+        if unknown:
+            raise ValueError(f"Claves desconocidas en la política: {', '.join(sorted(unknown))}")
+        return cls(**policy)
+
+    @classmethod
+    def from_file(cls, path):
+        """Carga una política JSON; las claves ausentes toman el valor de DEFAULT_POLICY"""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict({**DEFAULT_POLICY, **json.load(f)})
+
+    def host_decision(self, host):
+        """Regla de dominio para host: "deny_domain", "domain_not_allowed" o None (sin regla)"""
+        decision = self.host_decisions.get(host, False)
+        if decision is False:
+            decision = None
+            if domain_matches(host, self.deny_domains):
+                decision = "deny_domain"
+            elif self.allow_domains and not domain_matches(host, self.allow_domains):
+                decision = "domain_not_allowed"
+            self.host_decisions[host] = decision
+        return decision
+
+    def decide(self, url, resource_type="other"):
+        """Devuelve (permitida, motivo)"""
+        if self.allow_re and self.allow_re.match(url):
+            return True, "allow_pattern"
+        if self.deny_re and self.deny_re.match(url):
+            return False, "deny_pattern"
+        host_decision = self.host_decision((urlsplit(url).hostname or "").lower())
+        if host_decision:
+            return False, host_decision
+        if resource_type in self.allow_types:
+            return True, "allow_type"
+        if resource_type in self.deny_types:
+            return False, "deny_type"
+        return self.default_allow, "default"
+
+    def route_filter(self):
+        """
+        Expresión regular (válida en Python y en JavaScript) con las URL que pueden bloquearse:
+        patrones y dominios denegados y extensiones de los tipos denegados. Playwright la evalúa
+        en el navegador; la decisión final la toma decide() con el tipo de recurso real.
+        None si hace falta ver todas las peticiones: allow_domains, default="deny", tipos sin
+        extensiones conocidas o patrones con clases [..] de fnmatch.
+        """
+        deny_types_without_extensions = [t for t in self.deny_types if t not in TYPE_EXTENSIONS]
+        if (self.allow_domains or not self.default_allow or deny_types_without_extensions
+                or any("[" in pattern for pattern in self.deny_patterns)):
+            return None
+        alternatives = [
+            "^" + "".join(".*" if char == "*" else "." if char == "?" else re.escape(char) for char in pattern) + "$"
+            for pattern in self.deny_patterns
+        ]
+        if self.deny_domains:
+            domains = "|".join(re.escape(domain) for domain in self.deny_domains)
+            alternatives.append(rf"^[a-z][a-z0-9+.\-]*://(?:[^/?#]*@)?(?:[^/?#]*\.)?(?:{domains})(?::\d+)?(?:[/?#]|$)")
+        extensions = sorted({ext for t in self.deny_types for ext in TYPE_EXTENSIONS[t]})
+        if extensions:
+            alternatives.append(rf"\.(?:{'|'.join(extensions)})(?:[?#].*)?$")
+        if not alternatives:
+            return re.compile("(?!)")  # Nada que bloquear
+        # Sin distinguir mayúsculas: un filtro más amplio solo hace que decide() vea alguna URL más
+        return re.compile("|".join(alternatives), re.IGNORECASE)
+
+    def cdp_blocked_urls(self):
+        """
+        Patrones para Network.setBlockedURLs de CDP (comodín *): patrones y dominios denegados
+        y las extensiones de los tipos denegados. CDP no admite excepciones: las reglas allow_*
+        y default="deny" solo se aplican en Playwright.
+        """
+        urls = list(self.deny_patterns)
+        for domain in self.deny_domains:
+            urls += [f"*://{domain}/*", f"*://*.{domain}/*"]
+        for resource_type in sorted(self.deny_types):
+            for extension in TYPE_EXTENSIONS.get(resource_type, ()):
+                urls += [f"*.{extension}", f"*.{extension}?*"]
+        return urls
+
+
+class BandwidthStats:
+    """
+    Peticiones y bytes por acción (allowed/blocked) y tipo de recurso.
+    Los bytes permitidos son los recibidos (cabeceras y cuerpo codificado, como viajan por la red);
+    las respuestas sin tamaño conocido se cuentan aparte en unsized. De las bloqueadas solo se
+    cuenta la petición.
+    """
+
+    def __init__(self):
+        self.requests = collections.Counter()
+        self.bytes = collections.Counter()
+        self.unsized = 0
+
+    def reset(self):
+        self.requests.clear()
+        self.bytes.clear()
+        self.unsized = 0
+
+    def record(self, action, resource_type, size=0):
+        self.requests[(action, resource_type)] += 1
+        if size:
+            self.bytes[(action, resource_type)] += size
+
+    async def record_finished(self, request):
+        """
+        Manejador de context.on('requestfinished'): cuenta la petición con los bytes recibidos.
+        No depende de Content-Length, que falta en casi todas las respuestas comprimidas o HTTP/2
+        """
+        try:
+            sizes = await request.sizes()
+            size = sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except Exception:  # Respuesta sin tamaño (caché, redirección) o contexto ya cerrado
+            size = 0
+        if size <= 0:
+            self.unsized += 1
+        self.record("allowed", request.resource_type, max(size, 0))
+
+    def total(self, action, counter=None):
+        counter = self.requests if counter is None else counter
+        return sum(value for (key_action, _), value in counter.items() if key_action == action)
+
+    def as_dict(self):
+        """Forma serializable (para devolverla desde un proceso shard)"""
+        return {
+            "requests": [[action, resource_type, value] for (action, resource_type), value in self.requests.items()],
+            "bytes": [[action, resource_type, value] for (action, resource_type), value in self.bytes.items()],
+            "unsized": self.unsized,
+        }
+
+    def merge(self, data):
+        for action, resource_type, value in data["requests"]:
+            self.requests[(action, resource_type)] += value
+        for action, resource_type, value in data["bytes"]:
+            self.bytes[(action, resource_type)] += value
+        self.unsized += data.get("unsized", 0)
+
+    def summary_lines(self):
+        """Líneas de resumen: totales y desglose por tipo de recurso"""
+        if not self.requests:
+            return []
+        allowed, blocked = self.total("allowed"), self.total("blocked")
+        lines = [
+            f"{allowed} peticiones permitidas ({self.total('allowed', self.bytes) / 1024 / 1024:.2f} MB), "
+            f"{blocked} bloqueadas ({blocked / max(allowed + blocked, 1) * 100:.1f}%)"
+            + (f", {self.unsized} respuestas sin tamaño" if self.unsized else "")
+        ]
+        resource_types = sorted({resource_type for _, resource_type in self.requests})
+        for resource_type in resource_types:
+            lines.append(
+                f"{resource_type:<11} permitidas {self.requests[('allowed', resource_type)]:>6} "
+                f"({self.bytes[('allowed', resource_type)] / 1024:>9.1f} KB) | "
+                f"bloqueadas {self.requests[('blocked', resource_type)]:>6}"
+            )
+        return lines
+
+
+async def apply_policy(context, policy, stats=None):
+    """
+    Aplica la política a todas las páginas del contexto con una sola ruta, registrada con
+    policy.route_filter() para que solo lleguen a Python las peticiones que pueden bloquearse
+    ("**/*" si la política necesita verlas todas). Con stats cuenta cada petición terminada
+    y cada bloqueada
+    """
+    async def handle(route):
+        request = route.request
+        allowed, _ = policy.decide(request.url, request.resource_type)
+        if allowed:
+            await route.continue_()
+            return
+        if stats:
+            stats.record("blocked", request.resource_type)
+        await route.abort("blockedbyclient")
+
+    route_filter = policy.route_filter()
+    await context.route("**/*" if route_filter is None else route_filter, handle)
+    if stats:
+        context.on("requestfinished", stats.record_finished)
+
+
+def apply_policy_selenium(driver, policy):
+    """Aplica la parte de URL de la política al driver de Chrome por CDP. Devuelve los patrones"""
+    urls = policy.cdp_blocked_urls()
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    return urls
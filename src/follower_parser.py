@@ -0,0 +1,177 @@
+"""
+Parser del número de seguidores en textos de perfil de Instagram.
+Localiza la palabra clave con str.find y lee el número inmediatamente anterior
+con expresiones precompiladas, en una sola pasada por el texto. Palabras clave
+("followers", "seguidores"...), sufijos multiplicadores ("K", "mil", "M",
+"mill.", "mil millones", "B"...) y conectores entre sufijo y palabra clave
+("millones de seguidores") salen de una tabla de idiomas.
+"""
+
+import re  # Expresiones regulares. Usado en FollowerCountParser.
+
+# Tabla de idiomas: palabras clave de "seguidores", sufijos con su multiplicador y, opcionalmente,
+# conectores que pueden ir entre un sufijo y la palabra clave ("2 mil millones de seguidores").
+# Añadir un idioma es añadir una entrada (o pasar una tabla propia a FollowerCountParser).
+LOCALES = {
+    "en": {
+        "keywords": ("followers", "follower"),
+        "suffixes": {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000, "bn": 1_000_000_000},
+    },
+    "es": {
+        "keywords": ("seguidores", "seguidor"),
+        "suffixes": {
+            "mil": 1_000,
+            "mill.": 1_000_000,
+            "mill": 1_000_000,
+            "millones": 1_000_000,
+            "millón": 1_000_000,
+            "mil millones": 1_000_000_000,
+        },
+        "connectors": ("de",),
+    },
+    "pt": {
+        "keywords": ("seguidores", "seguidor"),
+        "suffixes": {
+            "mil": 1_000,
+            "mi": 1_000_000,
+            "milhão": 1_000_000,
+            "milhões": 1_000_000,
+            "mil milhões": 1_000_000_000,
+            "bi": 1_000_000_000,
+        },
+        "connectors": ("de",),
+    },
+    "fr": {
+        "keywords": ("abonnés", "abonné", "abonnes", "abonne"),
+        "suffixes": {"k": 1_000, "m": 1_000_000, "md": 1_000_000_000},
+    },
+    "de": {
+        "keywords": ("follower",),
+        "suffixes": {"tsd.": 1_000, "mio.": 1_000_000, "mrd.": 1_000_000_000},
+    },
+    "it": {
+        "keywords": ("follower",),
+        "suffixes": {"k": 1_000, "mln": 1_000_000, "mld": 1_000_000_000},
+    },
+}
+
+# Número con separadores de miles (coma, punto, espacio o espacio fino) y parte decimal opcional
+NUMBER_PATTERN = r"\d{1,3}(?:[., \u00a0\u202f]\d{3})+(?:[.,]\d+)?|\d+(?:[.,]\d+)?"
+SEPARATORS_RE = re.compile(r"[., \u00a0\u202f]")
+# Caracteres que se miran antes de la palabra clave para encontrar el número y su sufijo
+NUMBER_WINDOW = 32
+# Hasta esta longitud se usa un único patrón completo; por encima, búsqueda por palabra clave
+SHORT_TEXT_LENGTH = 256
+
+
+class FollowerCountParser:
+    """
+    Extrae el número de seguidores de un texto en cualquiera de los idiomas de la tabla.
+    Ejemplos:
+        "1,234 followers" -> 1234
+        "3.223 seguidores" -> 3223
+        "10.5K followers" -> 10500
+        "1,2 mil seguidores" -> 1200
+        "3 M seguidores" -> 3000000
+        "2 mil millones de seguidores" -> 2000000000
+        "1.2B followers" -> 1200000000
+    """
+
+    def __init__(self, locales=None):
+        locales = LOCALES if locales is None else locales
+        self.suffixes = {}
+        keywords = set()
+        connectors = set()
+        for name, locale in locales.items():
+            keywords.update(keyword.lower() for keyword in locale["keywords"])
+            connectors.update(connector.lower() for connector in locale.get("connectors", ()))
+            for suffix, multiplier in locale["suffixes"].items():
+                suffix = suffix.lower()
+                if self.suffixes.get(suffix, multiplier) != multiplier:
+                    raise ValueError(f"Sufijo '{suffix}' con multiplicadores distintos ({name})")
+                self.suffixes[suffix] = multiplier
+
+        # Alternativas más largas primero para que "mil millones" gane a "mil" y "mil" a "mi"
+        suffix_alternatives = "|".join(
+            re.escape(suffix).replace(r"\ ", r"\s+") for suffix in sorted(self.suffixes, key=len, reverse=True)
+        )
+        keyword_alternatives = "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+        # Conector opcional, solo detrás de un sufijo ("millones de seguidores", no "1.234 de seguidores")
+        connector = ""
+        if connectors:
+            connector_alternatives = "|".join(re.escape(word) for word in sorted(connectors, key=len, reverse=True))
+            connector = rf"(?:(?:{connector_alternatives})\s+)?"
+        # Número (y sufijo opcional) seguido de la palabra clave
+        number = (
+            rf"(?<![\d.,])(?P<number>{NUMBER_PATTERN})\s*"
+            rf"(?:(?P<suffix>{suffix_alternatives})(?!\w)\s*{connector})?"
+        )
+        keyword = rf"(?<![^\W\d_])(?:{keyword_alternatives})(?!\w)"
+        # Los textos se pasan a minúsculas una vez: sin re.IGNORECASE, que es varias veces más lento
+        self.full_re = re.compile(number + keyword)
+        self.number_re = re.compile(number + r"\Z")
+        self.keyword_re = re.compile(keyword)
+        # Prefijos mínimos para localizar candidatos con str.find (mucho más rápido que un regex sobre el body)
+        self.keyword_stems = tuple(
+            keyword for keyword in keywords
+            if not any(other != keyword and keyword.startswith(other) for other in keywords)
+        )
+
+    def parse(self, text):
+        """Devuelve el primer número seguido de una palabra clave de seguidores, o None"""
+        if not text:
+            return None
+        lowered = text.lower()
+
+        # Textos cortos (enlace, título, og:description): una sola búsqueda con el patrón completo
+        if len(lowered) <= SHORT_TEXT_LENGTH:
+            return self.to_int(self.full_re.search(lowered))
+
+        # Textos largos (body): saltar de palabra clave en palabra clave sin evaluar cada dígito
+        start = 0
+        while True:
+            index = -1
+            for stem in self.keyword_stems:
+                end = len(lowered) if index < 0 else index + len(stem)
+                found = lowered.find(stem, start, end)
+                if found >= 0:
+                    index = found
+            if index < 0:
+                return None
+
+            if self.keyword_re.match(lowered, index):
+                match = self.number_re.search(lowered, max(0, index - NUMBER_WINDOW), index)
+                if match:
+                    return self.to_int(match)
+            start = index + 1
+
+    def to_int(self, match):
+        if not match:
+            return None
+        suffix = match.group("suffix")
+        multiplier = self.suffixes[" ".join(suffix.split())] if suffix else 1
+        return number_to_int(match.group("number"), multiplier)
+
+
+def number_to_int(number, multiplier=1):
+    """
+    Convierte el número del texto a entero con aritmética exacta.
+    Con sufijo, el último separador es decimal ("1,2 mil", "10.5K").
+    Sin sufijo, un separador seguido de 3 dígitos es de miles ("1,234", "3.223")
+    y cualquier otro es decimal (se trunca).
+    """
+    parts = SEPARATORS_RE.split(number)
+    decimals = ""
+    if len(parts) > 1 and (multiplier > 1 or len(parts[-1]) != 3):
+        decimals = parts.pop()
+    integer = int("".join(parts))
+    return integer * multiplier + int(decimals or 0) * multiplier // 10 ** len(decimals)
+
+
+# Parser por defecto con todos los idiomas de LOCALES
+DEFAULT_PARSER = FollowerCountParser()
+
+
+def parse_follower_count(text):
+    """Extrae el número de seguidores de un texto con el parser por defecto"""
+    return DEFAULT_PARSER.parse(text)
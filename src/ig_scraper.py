@@ -4,29 +4,55 @@ Selenium para login + extracción inicial
 Playwright paralelo para análisis de perfiles (10x más rápido)
 """
 
-from selenium import webdriver  # Webdriver Selenium. Usado en login y extracción.
-#from selenium.webdriver.common.keys import Keys  # Teclas especiales. Usado en type_like_human.
-#from selenium.webdriver.chrome.options import Options  # Opciones Chrome. Usado en setup_selenium_driver.
-from selenium.webdriver.support.ui import WebDriverWait  # Espera elementos. Usado en login y extracción.
-from selenium.webdriver.support import expected_conditions as EC  # Condiciones esperadas. Usado con WebDriverWait.
-from selenium.webdriver.common.by import By  # Localización elementos. Usado en find_elements.
-from selenium.common.exceptions import NoSuchElementException  # Excepciones Selenium. Usado en try-except.
-
-from webdriver_manager.chrome import ChromeDriverManager  # Gestor driver Chrome. Usado en setup_selenium_driver.
-from selenium.webdriver.chrome.service import Service  # Servicio Chrome. Usado en webdriver.Chrome.
-
 from playwright.async_api import async_playwright  # Playwright asíncrono. Usado en análisis paralelo.
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError  # Timeout Playwright. Usado en read_profile_when_ready.
 import asyncio  # Asincronía. Usado en analyze_profiles_parallel.
+from concurrent.futures import ProcessPoolExecutor  # Procesos paralelos. Usado en fetch_profiles_sharded.
 
 from time import sleep  # Pausas. Usado en delays humanos.
+import time  # Cronómetro de alta resolución. Usado en la latencia por perfil.
 import os  # Sistema operativo. Usado en rutas y variables entorno.
 import datetime  # Fechas y horas. Usado en logs y timestamps.
 import random  # Números aleatorios. Usado en delays y selecciones.
-import csv  # CSV. Usado en save_results.
-import re  # Expresiones regulares. Usado en parse_follower_count.
+import csv  # CSV. Usado en save_results y ResultJournal.
+import io  # Buffers en memoria. Usado en ResultJournal.
+import sys  # Argumentos de línea de comandos. Usado en --resume.
+import re  # Expresiones regulares. Usado en OG_DESCRIPTION_RE.
 import json  # JSON. Usado en cookies.
+import atexit  # Cierre ordenado. Usado para vaciar el log al salir.
+import hashlib  # Huella de la lista de objetivos. Usado en el nombre del diario del modo job.
+import threading  # Hilo del bucle de eventos. Usado en run_pipeline.
+from urllib.parse import quote  # Parámetros de URL. Usado en la extracción de la lista por API.
+import httpx  # Cliente HTTP asíncrono. Usado en el motor HTTP de perfiles.
 from dotenv import load_dotenv  # Variables entorno. Usado al inicio.
 
+from profile_cache import (  # Caché persistente de perfiles. Usado en analyze_profiles_parallel.
+    ProfileCache,
+    OUTCOME_FOUND,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_PARSE_ERROR,
+    OUTCOME_ERROR,
+    OUTCOME_THROTTLED,
+    OUTCOME_TIMEOUT,
+)
+from adaptive_concurrency import AdaptiveConcurrency  # Control AIMD de concurrencia. Usado en los workers.
+from follower_parser import parse_follower_count  # Parser multidioma de seguidores. Usado al leer perfiles.
+from metrics import Metrics  # Spans de tiempo por fase y perfil. Usado en todo el flujo.
+from benford_counts import first_digits  # Primer dígito vectorizado. Usado en save_results.
+from results_store import ResultsStore  # Almacén Parquet particionado (pyarrow opcional). Usado en save_results.
+from log_writer import LogWriter  # Escritura de logs en segundo plano con rotación. Usado en Logger.
+from blocking_policy import (  # Política de bloqueo de recursos y tráfico. Usado en contextos y driver.
+    DEFAULT_POLICY,
+    BandwidthStats,
+    BlockingPolicy,
+    apply_policy,
+    apply_policy_selenium,
+)
+
+# Selenium y webdriver-manager se importan en import_selenium(), solo en el modo híbrido:
+# con SCRAPER_ENGINE=playwright el scraper funciona sin tenerlos instalados
+webdriver = WebDriverWait = EC = By = NoSuchElementException = ChromeDriverManager = Service = None
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -38,10 +64,142 @@ account = os.getenv("TARGET_ACCOUNT", "teeli__peachmuffin")  # Cuenta objetivo
 page = os.getenv("PAGE_TYPE", "followers")  # "followers" o "following"
 count = int(os.getenv("FOLLOWER_COUNT", "50"))  # Número de seguidores a analizar
 
+# Modo job: varios objetivos en una sola sesión, "cuenta[:tipo[:cantidad]]" separados por comas
+# (tipo y cantidad por defecto: PAGE_TYPE y FOLLOWER_COUNT). Vacío = solo TARGET_ACCOUNT
+def parse_targets(spec):
+    """
+    Devuelve [(cuenta, tipo, cantidad)] sin objetivos repetidos, en orden de aparición.
+    Una misma cuenta y tipo con cantidades distintas es un solo objetivo con la mayor
+    (sus ficheros de salida tendrían el mismo nombre)
+    """
+    parsed = []
+    for item in filter(None, (item.strip() for item in spec.split(","))):
+        parts = [part.strip() for part in item.split(":")]
+        if len(parts) > 3 or not parts[0] or (len(parts) > 1 and parts[1] not in ("followers", "following")):
+            raise ValueError(f"Objetivo no válido: '{item}' (formato cuenta[:followers|following[:cantidad]])")
+        target_page = parts[1] if len(parts) > 1 else page
+        target_count = int(parts[2]) if len(parts) > 2 else count
+        parsed.append((parts[0], target_page, target_count))
+    largest = {}
+    for target_account, target_page, target_count in parsed:
+        key = (target_account, target_page)
+        largest[key] = max(largest.get(key, target_count), target_count)
+    return [(target_account, target_page, target_count) for (target_account, target_page), target_count in largest.items()]
+
+JOB_MODE = bool(os.getenv("TARGETS", "").strip())
+try:
+    targets = parse_targets(os.getenv("TARGETS", "")) if JOB_MODE else [(account, page, count)]
+except ValueError as e:
+    print(f"❌ ERROR en TARGETS: {e}")
+    exit(1)
+
+# URL base de Instagram (modificable para pruebas contra un servidor local)
+INSTAGRAM_BASE_URL = os.getenv("IG_BASE_URL", "https://www.instagram.com").rstrip("/")
+INSTAGRAM_HOST = INSTAGRAM_BASE_URL.split("://", 1)[-1].split("/")[0]
+
 # Configuración de paralelización
 MAX_CONCURRENT_WORKERS = int(os.getenv("MAX_WORKERS", "10"))
 # Recomendado: 5-10 (seguro), 15-20 (arriesgado pero rápido)
 
+# Motor de la ejecución completa: "hybrid" (Selenium para login y lista + Playwright para perfiles)
+# o "playwright" (un único navegador Playwright para login, lista y perfiles)
+SCRAPER_ENGINE = os.getenv("SCRAPER_ENGINE", "hybrid")
+
+# Motor para el análisis de perfiles: "playwright" (navegador) o "http" (sin navegador, con respaldo Playwright)
+PROFILE_ENGINE = os.getenv("PROFILE_ENGINE", "playwright")
+
+# Pipeline: los workers de perfiles empiezan mientras la lista aún se está extrayendo
+PIPELINE_MODE = os.getenv("PIPELINE", "0") == "1"
+
+# Extracción de la lista: "dom" (scroll del diálogo y lectura de enlaces) o "api" (páginas JSON
+# de /api/v1/friendships/ siguiendo su cursor, sin renderizar; si falla se vuelve a "dom")
+LIST_EXTRACTION = os.getenv("LIST_EXTRACTION", "dom")
+LIST_API_PAGE_SIZE = int(os.getenv("LIST_API_PAGE_SIZE", "25"))
+LIST_API_MAX_ERRORS = int(os.getenv("LIST_API_MAX_ERRORS", "3"))  # Fallos seguidos antes de abandonar
+# Tope de scrolls del modo "dom"; 0 = automático (el mayor entre 200 y el objetivo)
+LIST_MAX_SCROLLS = int(os.getenv("LIST_MAX_SCROLLS", "0"))
+
+# Número de procesos (cada uno con su navegador) para repartir el análisis de perfiles
+PROCESS_SHARDS = int(os.getenv("PROCESS_SHARDS", "1"))
+
+# Concurrencia adaptativa (AIMD): arranca en MAX_WORKERS y se mueve entre el mínimo y el máximo
+ADAPTIVE_CONCURRENCY = os.getenv("ADAPTIVE_CONCURRENCY", "0") == "1"
+ADAPTIVE_MIN_WORKERS = int(os.getenv("ADAPTIVE_MIN_WORKERS", "2"))
+ADAPTIVE_MAX_WORKERS = int(os.getenv("ADAPTIVE_MAX_WORKERS", "30"))
+ADAPTIVE_LATENCY_TARGET_S = float(os.getenv("ADAPTIVE_LATENCY_TARGET_S", "8"))
+ADAPTIVE_COOLDOWN_S = float(os.getenv("ADAPTIVE_COOLDOWN_S", "2"))  # Mínimo entre recortes
+
+# Reintento final de los fallos transitorios (clases de RETRY_OUTCOMES): pasadas con menos workers
+# y backoff exponencial con jitter antes de cada una (BASE * 2^(pasada-1), con tope en MAX)
+RETRY_OUTCOMES = tuple(outcome.strip() for outcome in os.getenv("RETRY_OUTCOMES", "error,timeout,throttled").split(",")
+                       if outcome.strip())
+RETRY_MAX_PASSES = int(os.getenv("RETRY_MAX_PASSES", "2"))
+RETRY_MAX_WORKERS = int(os.getenv("RETRY_MAX_WORKERS", "3"))
+RETRY_BACKOFF_BASE_S = float(os.getenv("RETRY_BACKOFF_BASE_S", "10"))
+RETRY_BACKOFF_MAX_S = float(os.getenv("RETRY_BACKOFF_MAX_S", "120"))
+
+# Reutilizar una página por worker en lugar de abrir una nueva por perfil
+PAGE_POOL_ENABLED = os.getenv("PAGE_POOL", "1") == "1"
+
+# Espera de carga del perfil: "event" (en cuanto aparece el número) o "fixed" (2 s + selectores)
+PROFILE_READINESS = os.getenv("PROFILE_READINESS", "event")
+PROFILE_READY_TIMEOUT_MS = int(os.getenv("PROFILE_READY_TIMEOUT_MS", "8000"))
+
+# Pausa aleatoria (segundos) entre perfiles del mismo worker
+PROFILE_DELAY_MIN = float(os.getenv("PROFILE_DELAY_MIN", "0.5"))
+PROFILE_DELAY_MAX = float(os.getenv("PROFILE_DELAY_MAX", "1.5"))
+
+# Reutilizar la sesión guardada (cookies) mientras siga siendo válida, evitando el login
+SESSION_REUSE = os.getenv("SESSION_REUSE", "1") == "1"
+SESSION_FILE = os.getenv("SESSION_FILE", "")  # Vacío = logs/session_<IG_USERNAME>.json
+
+# Diario de resultados (checkpoint). Con --resume o RESUME=1 se omiten los usuarios ya resueltos
+# y, si el diario guardó la lista extraída, también la FASE 1 (login y extracción)
+RESUME = "--resume" in sys.argv or os.getenv("RESUME", "0") == "1"
+JOURNAL_FLUSH_EVERY = int(os.getenv("JOURNAL_FLUSH_EVERY", "10"))
+
+# Salidas de resultados: almacén Parquet particionado por cuenta y fecha ("parquet" u "off")
+# y el informe TXT de ancho fijo (el CSV se escribe siempre)
+RESULTS_STORE = os.getenv("RESULTS_STORE", "parquet")
+RESULTS_STORE_DIR = os.getenv("RESULTS_STORE_DIR", "")  # Vacío = src/results_store
+WRITE_TXT = os.getenv("WRITE_TXT", "1") == "1"
+
+# FASE 4 (Benford): gráfico PNG además del informe JSON, y remuestras bootstrap de los intervalos
+BENFORD_PLOT = os.getenv("BENFORD_PLOT", "1") == "1"
+BENFORD_BOOTSTRAP = int(os.getenv("BENFORD_BOOTSTRAP", "1000"))
+
+# Logs: nivel mínimo (DEBUG, INFO, SUCCESS, WARNING, ERROR) y rotación del fichero
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_MAX_MB = float(os.getenv("LOG_MAX_MB", "10"))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+
+# Bloqueo de recursos (Playwright por contexto, Selenium por CDP): "default", "off"
+# o la ruta de una política JSON (claves de DEFAULT_POLICY en blocking_policy.py; las ausentes, por defecto)
+BLOCKING_POLICY = os.getenv("BLOCKING_POLICY", "default")
+try:
+    if BLOCKING_POLICY == "off":
+        blocking_policy = None
+    elif BLOCKING_POLICY == "default":
+        blocking_policy = BlockingPolicy.from_dict(DEFAULT_POLICY)
+    else:
+        blocking_policy = BlockingPolicy.from_file(BLOCKING_POLICY)
+except (OSError, ValueError, TypeError) as e:
+    print(f"❌ ERROR en BLOCKING_POLICY: {e}")
+    exit(1)
+
+# Métricas de tiempo (spans): "jsonl", "prometheus" u "off"
+METRICS_FORMAT = os.getenv("METRICS_FORMAT", "jsonl")
+METRICS_FILE = os.getenv("METRICS_FILE", "")  # Vacío = logs/metrics_<timestamp>.jsonl|.prom
+
+# Configuración de caché de perfiles (SQLite)
+PROFILE_CACHE_ENABLED = os.getenv("PROFILE_CACHE", "1") == "1"
+PROFILE_CACHE_DB = os.getenv("PROFILE_CACHE_DB", "")  # Vacío = logs/profile_cache.sqlite3
+PROFILE_CACHE_TTLS = {
+    OUTCOME_FOUND: float(os.getenv("CACHE_TTL_FOUND_HOURS", "24")) * 3600,
+    OUTCOME_NOT_FOUND: float(os.getenv("CACHE_TTL_NOT_FOUND_HOURS", "72")) * 3600,
+    OUTCOME_PARSE_ERROR: float(os.getenv("CACHE_TTL_PARSE_ERROR_HOURS", "1")) * 3600,
+}
+
 # Validación de credenciales
 if not yourusername or not yourpassword:
     print("❌ ERROR: Credenciales no configuradas")
@@ -62,23 +220,50 @@ class Logger:
             os.makedirs(self.logs_dir)
         
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-        self.log_file = os.path.join(self.logs_dir, f"hybrid_log_{self.timestamp}.txt")
-        self.csv_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), 
-            f"{account}_stats_hybrid_{self.timestamp}.csv"
-        )
-        self.txt_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), 
-            f"{account}_stats_hybrid_{self.timestamp}.txt"
+        # Fichero abierto durante toda la ejecución; las escrituras las hace un hilo aparte
+        self.writer = LogWriter(
+            os.path.join(self.logs_dir, f"hybrid_log_{self.timestamp}.txt"),
+            LOG_LEVEL,
+            int(LOG_MAX_MB * 1024 * 1024),
+            LOG_BACKUP_COUNT,
         )
+        self.csv_file, self.txt_file = self.result_files(account)
         self.cookies_file = os.path.join(self.logs_dir, f"cookies_{self.timestamp}.json")
+        self.session_file = SESSION_FILE or os.path.join(self.logs_dir, f"session_{yourusername}.json")
+        self.results_store_dir = RESULTS_STORE_DIR or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "results_store"
+        )
+        self.cache_file = PROFILE_CACHE_DB or os.path.join(self.logs_dir, "profile_cache.sqlite3")
+        metrics_extension = "prom" if METRICS_FORMAT == "prometheus" else "jsonl"
+        self.metrics_file = METRICS_FILE or os.path.join(self.logs_dir, f"metrics_{self.timestamp}.{metrics_extension}")
+        # Nombre estable por cuenta y tipo (o por lista de objetivos) para poder reanudar entre ejecuciones
+        if JOB_MODE:
+            job_id = hashlib.sha1(repr(sorted(targets)).encode()).hexdigest()[:10]
+            self.journal_file = os.path.join(self.logs_dir, f"journal_job_{job_id}.csv")
+        else:
+            self.journal_file = os.path.join(self.logs_dir, f"journal_{account}_{page}.csv")
         
+    def result_files(self, account_name, page_type=None):
+        """Rutas (CSV, TXT) de los resultados de una cuenta; con page_type (modo job) lo incluyen en el nombre"""
+        name = f"{account_name}_{page_type}" if page_type else account_name
+        base = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}_stats_hybrid_{self.timestamp}")
+        return f"{base}.csv", f"{base}.txt"
+    
+    @property
+    def log_file(self):
+        return self.writer.path
+    
+    @log_file.setter
+    def log_file(self, path):
+        self.writer.reopen(path)
+    
     def log(self, message, level="INFO"):
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        formatted_message = f"[{timestamp}] [{level}] {message}"
-        print(formatted_message)
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(formatted_message + "\n")
+        # Solo encola: no bloquea el bucle de eventos de los workers
+        self.writer.write(message, level)
+    
+    def close(self):
+        """Escribe los mensajes pendientes y cierra el fichero de log"""
+        self.writer.close()
     
     def error(self, message):
         self.log(message, "ERROR")
@@ -93,78 +278,48 @@ class Logger:
         self.log(message, "DEBUG")
 
 logger = Logger()
+atexit.register(logger.close)
+metrics = Metrics(enabled=METRICS_FORMAT != "off")
+bandwidth = BandwidthStats()
 
 # ====================== UTILIDADES ======================
 # Humanización de delays y tipeo
 def human_delay(min_seconds=1.0, max_seconds=3.0):
-    sleep(random.uniform(min_seconds, max_seconds))
+    with metrics.span("sleep"):
+        sleep(random.uniform(min_seconds, max_seconds))
 
 def type_like_human(element, text):
     for char in text:
         element.send_keys(char)
         sleep(random.uniform(0.05, 0.15))
 
-def parse_follower_count(text):
+# ====================== SELENIUM: LOGIN Y EXTRACCIÓN DE LISTA ======================
+def import_selenium():
     """
-    Extrae el número de seguidores de un texto con máxima precisión
-    Ejemplos: 
-        "1,234 followers" -> 1234
-        "3,223 followers" -> 3223
-        "1.2M followers" -> 1200000
-        "10.5K followers" -> 10500
-        "1333 followers" -> 1333
+    Importa la pila de Selenium en los nombres del módulo la primera vez que hace falta.
+    Todas las funciones de Selenium reciben el driver de setup_selenium_driver, que la llama
     """
-    if not text:
-        return None
-    # Normalizar texto
-    text = text.lower().strip()
-    
-    # Patrones en orden de especificidad
-    patterns = [
-        (r'([\d,\.]+)\s*m\s*followers?', 'M'),  # Millones
-        (r'([\d,\.]+)\s*k\s*followers?', 'K'),  # Miles
-        (r'([\d,\.]+)\s*followers?', None),     # Número exacto
-    ]
-    
-    for pattern, unit in patterns:
-        match = re.search(pattern, text)
-        if match:
-            num_str = match.group(1)
-            
-            if unit == 'M':
-                # Para millones: "1.2M" -> 1200000
-                num = float(num_str.replace(',', '.'))
-                return int(num * 1_000_000)
-            
-            elif unit == 'K':
-                # Para miles: "10.5K" -> 10500
-                num = float(num_str.replace(',', '.'))
-                return int(num * 1_000)
-            
-            else:
-                # Para números exactos sin K/M
-                # Eliminar TODAS las comas y puntos (separadores de miles)
-                # "1,234" -> "1234"
-                # "3.223" (formato europeo) -> "3223"
-                # "1,333" -> "1333"
-                clean_num = num_str.replace(',', '').replace('.', '')
-                
-                # Validar que solo contenga dígitos
-                if clean_num.isdigit():
-                    return int(clean_num)
-                else:
-                    # Si no es un número válido, intentar parsearlo de todos modos
-                    try:
-                        return int(float(clean_num))
-                    except ValueError:
-                        continue
-    
-    return None
+    global webdriver, WebDriverWait, EC, By, NoSuchElementException, ChromeDriverManager, Service
+    if webdriver is not None:
+        return
+    try:
+        from selenium import webdriver  # Webdriver Selenium. Usado en login y extracción.
+        from selenium.webdriver.support.ui import WebDriverWait  # Espera elementos. Usado en login y extracción.
+        from selenium.webdriver.support import expected_conditions as EC  # Condiciones esperadas. Usado con WebDriverWait.
+        from selenium.webdriver.common.by import By  # Localización elementos. Usado en find_elements.
+        from selenium.common.exceptions import NoSuchElementException  # Excepciones Selenium. Usado en try-except.
+        from webdriver_manager.chrome import ChromeDriverManager  # Gestor driver Chrome. Usado en setup_selenium_driver.
+        from selenium.webdriver.chrome.service import Service  # Servicio Chrome. Usado en webdriver.Chrome.
+    except ImportError as e:
+        raise ImportError(
+            "El modo híbrido necesita Selenium (pip install selenium webdriver-manager) "
+            "o usa SCRAPER_ENGINE=playwright"
+        ) from e
 
-# ====================== SELENIUM: LOGIN Y EXTRACCIÓN DE LISTA ======================
 #Para configuración del driver Selenium
 def setup_selenium_driver():
     """Configura driver de Selenium"""
+    import_selenium()
     options = webdriver.ChromeOptions()
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--window-size=1920,1080')
@@ -176,6 +331,9 @@ def setup_selenium_driver():
     driver = webdriver.Chrome(service=service, options=options)
     driver.maximize_window()
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if blocking_policy:
+        blocked_urls = apply_policy_selenium(driver, blocking_policy)
+        logger.debug(f"🚫 {len(blocked_urls)} patrones de bloqueo aplicados por CDP")
     
     return driver
 #Para manejo de cookies
@@ -200,7 +358,7 @@ def selenium_login(driver):
     """Login con Selenium"""
     try:
         logger.log("🔐 Iniciando login con Selenium...")
-        driver.get('https://www.instagram.com/')
+        driver.get(f'{INSTAGRAM_BASE_URL}/')
         human_delay(5, 7)
         
         handle_cookies(driver)
@@ -256,34 +414,34 @@ def handle_post_login_dialogs(driver):
             except Exception:
                 continue
 
+# JavaScript que busca automáticamente el div scrolleable correcto (compartido por Selenium y Playwright)
+SCROLL_MODAL_SCRIPT = """
+const dialog = document.querySelector('div[role="dialog"]');
+if (!dialog) return false;
+
+// Buscar el div que realmente scrollea
+const divs = dialog.querySelectorAll('div');
+for (let div of divs) {
+    // Si el div tiene contenido scrolleable (20% más alto que visible)
+    if (div.scrollHeight > div.clientHeight * 1.2) {
+        div.scrollTop = div.scrollHeight;
+        return true;
+    }
+}
+return false;
+"""
+
 def scroll_modal_smart(driver):
     """
     Hace scroll inteligente buscando el div correcto que scrollea
     Basado en técnica probada que busca divs con scrollHeight > clientHeight
     """
     try:
-        # JavaScript que busca automáticamente el div scrolleable correcto
-        scroll_script = """
-        const dialog = document.querySelector('div[role="dialog"]');
-        if (!dialog) return false;
-        
-        // Buscar el div que realmente scrollea
-        const divs = dialog.querySelectorAll('div');
-        for (let div of divs) {
-            // Si el div tiene contenido scrolleable (20% más alto que visible)
-            if (div.scrollHeight > div.clientHeight * 1.2) {
-                div.scrollTop = div.scrollHeight;
-                return true;
-            }
-        }
-        return false;
-        """
-        
-        result = driver.execute_script(scroll_script)
+        result = driver.execute_script(SCROLL_MODAL_SCRIPT)
         
         if result:
             # Pausa para que Instagram cargue más datos
-            sleep(random.uniform(1.5, 2.5))
+            human_delay(1.5, 2.5)
             return True
         else:
             logger.debug("  ⚠ No se encontró div scrolleable")
@@ -293,13 +451,107 @@ def scroll_modal_smart(driver):
         logger.debug(f"  ✗ Error en scroll: {str(e)}")
         return False
 
-def extract_followers_list_selenium(driver, account_name, page_type, target_count):
-    """Extrae lista de seguidores con Selenium y autoscroll mejorado"""
+# Recolección incremental de usernames dentro del navegador.
+# La primera llamada recorre los enlaces existentes del diálogo e instala un MutationObserver;
+# las siguientes solo procesan los enlaces añadidos desde la llamada anterior.
+# Devuelve únicamente usernames nuevos y ya filtrados (arguments: cuenta objetivo, host de Instagram).
+HARVEST_USERNAMES_SCRIPT = """
+const account = arguments[0];
+const host = arguments[1];
+const dialog = document.querySelector('div[role="dialog"]');
+if (!dialog) return [];
+
+let state = window.__igHarvest;
+if (!state || state.dialog !== dialog) {
+    if (state && state.observer) state.observer.disconnect();
+    state = window.__igHarvest = {dialog: dialog, seen: new Set(), buffer: []};
+    state.buffer.push(...dialog.querySelectorAll('a[href]'));
+    state.observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches('a[href]')) state.buffer.push(node);
+                state.buffer.push(...node.querySelectorAll('a[href]'));
+            }
+        }
+    });
+    state.observer.observe(dialog, {childList: true, subtree: true});
+}
+
+const anchors = state.buffer;
+state.buffer = [];
+const usernames = [];
+for (const a of anchors) {
+    if (a.host !== host) continue;
+    const username = a.pathname.replace(/^\\/+|\\/+$/g, '').split('/')[0];
+    if (!username || username === account || state.seen.has(username)) continue;
+    if (username === 'p' || username.startsWith('explore') || username.startsWith('direct')) continue;
+    state.seen.add(username);
+    usernames.push(username);
+}
+return usernames;
+"""
+
+def max_list_scrolls(target_count):
+    """Tope de scrolls: LIST_MAX_SCROLLS o, en automático, uno por usuario objetivo (mínimo 200)"""
+    return LIST_MAX_SCROLLS or max(200, target_count)
+
+def log_extraction_progress(extracted, target_count, new_users, consecutive_no_progress, max_no_progress):
+    """Registra el progreso de una iteración y devuelve el contador de intentos sin progreso"""
+    if new_users > 0:
+        logger.log(f"  ✓ Progreso: {extracted}/{target_count} (+{new_users} nuevos)")
+        return 0  # Reset si hay progreso
+    
+    consecutive_no_progress += 1
+    if consecutive_no_progress <= 2:
+        logger.debug(f"  ⏳ Esperando carga... ({consecutive_no_progress}/{max_no_progress})")
+    elif consecutive_no_progress <= 5:
+        logger.warning(f"  ⚠ Sin nuevos usuarios ({consecutive_no_progress}/{max_no_progress})")
+    else:
+        logger.warning(f"  🛑 Sin progreso ({consecutive_no_progress}/{max_no_progress})")
+    return consecutive_no_progress
+
+def log_stalled_extraction(extracted, target_count, page_type, consecutive_no_progress):
+    """Advertencia cada 5 intentos sin progreso"""
+    if consecutive_no_progress > 0 and consecutive_no_progress % 5 == 0:
+        logger.warning(f"  📊 Estado: {extracted}/{target_count} extraídos")
+        logger.warning(f"     {consecutive_no_progress} intentos sin progreso")
+        if consecutive_no_progress == 5:
+            logger.warning("     Posibles causas:")
+            logger.warning("     - Fin real de la lista")
+            logger.warning("     - Instagram limitando carga")
+            logger.warning(f"     - Cuenta tiene pocos {page_type}")
+
+def log_extraction_summary(extracted, target_count, page_type, consecutive_no_progress, max_no_progress,
+                           scroll_attempts):
+    """Resumen final de la extracción de la lista (común a Selenium y Playwright)"""
+    logger.log("="*60)
+    if extracted >= target_count:
+        logger.success(f"✅ ÉXITO: {extracted} usuarios extraídos")
+    elif extracted > 0:
+        logger.warning(f"⚠️ PARCIAL: {extracted}/{target_count} usuarios")
+        if consecutive_no_progress >= max_no_progress:
+            logger.warning(f"   Razón: {max_no_progress} intentos consecutivos sin progreso")
+            logger.warning(f"   Probable: La cuenta solo tiene {extracted} {page_type} accesibles")
+        else:
+            logger.warning(f"   Razón: Límite de {scroll_attempts} scrolls alcanzado")
+    else:
+        logger.error("❌ FALLO: No se extrajeron usuarios")
+        logger.error("   Revisa los logs y screenshots generados")
+    
+    logger.log(f"   Total scrolls realizados: {scroll_attempts}")
+    logger.log("="*60)
+
+def extract_followers_list_selenium(driver, account_name, page_type, target_count, on_username=None):
+    """
+    Extrae lista de seguidores con Selenium y autoscroll mejorado
+    Si se pasa on_username, se llama con cada usuario nuevo en cuanto se extrae
+    """
     try:
         logger.log(f"📋 Extrayendo lista de {page_type} de {account_name}...")
         logger.log(f"🎯 Objetivo: {target_count} usuarios")
         
-        url = f'https://www.instagram.com/{account_name}/'
+        url = f'{INSTAGRAM_BASE_URL}/{account_name}/'
         driver.get(url)
         human_delay(5, 7)
         
@@ -324,26 +576,29 @@ def extract_followers_list_selenium(driver, account_name, page_type, target_coun
         except Exception:
             pass
         
-        driver.execute_script("arguments[0].click();", link)
-        logger.log("👆 Clic realizado, esperando modal...")
-        human_delay(6, 8)
-        
-        # Buscar modal con múltiples estrategias
-        modal = None
-        modal_selectors = [
-            (By.CSS_SELECTOR, "div[role='dialog']"),
-            (By.XPATH, "//div[@role='dialog']"),
-        ]
-        
-        for by, selector in modal_selectors:
-            try:
-                modal = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((by, selector))
-                )
-                logger.success(f"✓ Modal encontrado: {selector}")
-                break
-            except Exception:
-                continue
+        # Espera del diálogo: desde el clic hasta que aparece el modal
+        with metrics.span("dialog_wait") as labels:
+            driver.execute_script("arguments[0].click();", link)
+            logger.log("👆 Clic realizado, esperando modal...")
+            human_delay(6, 8)
+            
+            # Buscar modal con múltiples estrategias
+            modal = None
+            modal_selectors = [
+                (By.CSS_SELECTOR, "div[role='dialog']"),
+                (By.XPATH, "//div[@role='dialog']"),
+            ]
+            
+            for by, selector in modal_selectors:
+                try:
+                    modal = WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((by, selector))
+                    )
+                    logger.success(f"✓ Modal encontrado: {selector}")
+                    break
+                except Exception:
+                    continue
+            labels["found"] = modal is not None
         
         if not modal:
             logger.error("❌ No se encontró el modal")
@@ -359,7 +614,7 @@ def extract_followers_list_selenium(driver, account_name, page_type, target_coun
         consecutive_no_progress = 0  # Cambio de nombre para claridad
         max_no_progress = 10  # Intentos consecutivos sin progreso
         scroll_attempts = 0
-        max_scroll_attempts = 200  # Aumentado siguiendo el ejemplo compartido
+        max_scroll_attempts = max_list_scrolls(target_count)
         
         logger.log("🔄 Iniciando extracción con scroll inteligente...")
         logger.log(f"   Max intentos sin progreso: {max_no_progress}")
@@ -367,100 +622,67 @@ def extract_followers_list_selenium(driver, account_name, page_type, target_coun
         logger.log("   Técnica: Búsqueda automática de div scrolleable")
         
         while len(followers_list) < target_count and consecutive_no_progress < max_no_progress and scroll_attempts < max_scroll_attempts:
-            # Encontrar todos los enlaces de usuarios visibles
-            user_links = driver.find_elements(By.XPATH, "//div[@role='dialog']//a[contains(@href, '/')]")
-            
-            new_users_in_iteration = 0
-            
-            
-            for link in user_links:
-                try:
-                    href = link.get_attribute('href')
-                    if href and 'instagram.com/' in href:
-                        username = href.split('instagram.com/')[-1].strip('/').split('/')[0]
-                        
-                        # Filtrar usernames válidos
-                        if (username and 
-                            username not in scraped and 
-                            username != account_name and
-                            not username.startswith('explore') and
-                            not username.startswith('p/') and
-                            not username.startswith('direct')):
-                            
-                            scraped.add(username)
-                            followers_list.append(username)
-                            new_users_in_iteration += 1
-                            
-                            if len(followers_list) >= target_count:
-                                logger.success(f"🎯 ¡Objetivo alcanzado! {len(followers_list)} usuarios")
-                                break
-                except Exception :
-                    continue
-            
-            # Gestión de progreso
-            if new_users_in_iteration > 0:
-                consecutive_no_progress = 0  # Reset si hay progreso
-                logger.log(f"  ✓ Progreso: {len(followers_list)}/{target_count} (+{new_users_in_iteration} nuevos)")
-            else:
-                consecutive_no_progress += 1
-                if consecutive_no_progress <= 2:
-                    logger.debug(f"  ⏳ Esperando carga... ({consecutive_no_progress}/{max_no_progress})")
-                elif consecutive_no_progress <= 5:
-                    logger.warning(f"  ⚠ Sin nuevos usuarios ({consecutive_no_progress}/{max_no_progress})")
-                else:
-                    logger.warning(f"  🛑 Sin progreso ({consecutive_no_progress}/{max_no_progress})")
-            
-            # Si ya alcanzamos el objetivo, salir
-            if len(followers_list) >= target_count:
-                break
-            
-            # Hacer scroll inteligente
-            scroll_attempts += 1
-            
-            # Logging cada 10 scrolls o cuando hay progreso
-            if scroll_attempts % 10 == 1 or new_users_in_iteration > 0:
-                logger.debug(f"  📜 Scroll #{scroll_attempts}")
-            
-            # Usar el nuevo método de scroll inteligente
-            scroll_success = scroll_modal_smart(driver)
-            
-            if not scroll_success and consecutive_no_progress > 3:
-                logger.warning("  ⚠ Scroll no encontró div scrolleable y sin progreso")
-                # Intentar método de respaldo
+            with metrics.span("scroll_iteration") as labels:
+                # Un solo viaje al navegador: solo usernames nuevos y ya filtrados
                 try:
-                    modal = driver.find_element(By.CSS_SELECTOR, "div[role='dialog']")
-                    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", modal)
-                    sleep(2)
-                except Exception:
-                    pass
-            
-            # Advertencia cada 5 intentos sin progreso
-            if consecutive_no_progress > 0 and consecutive_no_progress % 5 == 0:
-                logger.warning(f"  📊 Estado: {len(followers_list)}/{target_count} extraídos")
-                logger.warning(f"     {consecutive_no_progress} intentos sin progreso")
-                if consecutive_no_progress == 5:
-                    logger.warning("     Posibles causas:")
-                    logger.warning("     - Fin real de la lista")
-                    logger.warning("     - Instagram limitando carga")
-                    logger.warning(f"     - Cuenta tiene pocos {page_type}")
+                    new_usernames = driver.execute_script(HARVEST_USERNAMES_SCRIPT, account_name, INSTAGRAM_HOST)
+                except Exception as e:
+                    logger.debug(f"  ✗ Error extrayendo usernames: {str(e)}")
+                    new_usernames = []
+                
+                new_users_in_iteration = 0
+                
+                for username in new_usernames:
+                    if username in scraped:
+                        continue
+                    
+                    scraped.add(username)
+                    followers_list.append(username)
+                    new_users_in_iteration += 1
+                    if on_username:
+                        on_username(username)
+                    
+                    if len(followers_list) >= target_count:
+                        logger.success(f"🎯 ¡Objetivo alcanzado! {len(followers_list)} usuarios")
+                        break
+                
+                # Gestión de progreso
+                labels["new_users"] = new_users_in_iteration
+                consecutive_no_progress = log_extraction_progress(
+                    len(followers_list), target_count, new_users_in_iteration, consecutive_no_progress, max_no_progress
+                )
+                
+                # Si ya alcanzamos el objetivo, salir
+                if len(followers_list) >= target_count:
+                    break
+                
+                # Hacer scroll inteligente
+                scroll_attempts += 1
+                
+                # Logging cada 10 scrolls o cuando hay progreso
+                if scroll_attempts % 10 == 1 or new_users_in_iteration > 0:
+                    logger.debug(f"  📜 Scroll #{scroll_attempts}")
+                
+                # Usar el nuevo método de scroll inteligente
+                scroll_success = scroll_modal_smart(driver)
+                
+                if not scroll_success and consecutive_no_progress > 3:
+                    logger.warning("  ⚠ Scroll no encontró div scrolleable y sin progreso")
+                    # Intentar método de respaldo
+                    try:
+                        modal = driver.find_element(By.CSS_SELECTOR, "div[role='dialog']")
+                        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", modal)
+                        human_delay(2, 2)
+                    except Exception:
+                        pass
+                
+                # Advertencia cada 5 intentos sin progreso
+                log_stalled_extraction(len(followers_list), target_count, page_type, consecutive_no_progress)
         
         # Resumen final
-        logger.log("="*60)
-        if len(followers_list) >= target_count:
-            logger.success(f"✅ ÉXITO: {len(followers_list)} usuarios extraídos")
-        elif len(followers_list) > 0:
-            logger.warning(f"⚠️ PARCIAL: {len(followers_list)}/{target_count} usuarios")
-            if consecutive_no_progress >= max_no_progress:
-                logger.warning(f"   Razón: {max_no_progress} intentos consecutivos sin progreso")
-                logger.warning(f"   Probable: La cuenta solo tiene {len(followers_list)} {page_type} accesibles")
-            else:
-                logger.warning(f"   Razón: Límite de {scroll_attempts} scrolls alcanzado")
-        else:
-            logger.error("❌ FALLO: No se extrajeron usuarios")
-            logger.error("   Revisa los logs y screenshots generados")
-        
-        logger.log(f"   Total scrolls realizados: {scroll_attempts}")
-        logger.log("="*60)
+        log_extraction_summary(
+            len(followers_list), target_count, page_type, consecutive_no_progress, max_no_progress, scroll_attempts
+        )
         
         return followers_list
         
@@ -482,216 +704,1674 @@ def save_selenium_cookies(driver, filepath):
         logger.error(f"Error guardando cookies: {str(e)}")
         return False
 
-# ====================== PLAYWRIGHT: ANÁLISIS PARALELO ======================
-async def get_follower_count_playwright(context, username, worker_id):
+# ====================== LISTA POR API: PAGINACIÓN CON CURSOR ======================
+# LIST_EXTRACTION=api: en lugar de hacer scroll en el diálogo y leer sus enlaces, se piden las mismas
+# páginas JSON que carga el diálogo (/api/v1/friendships/<id>/<tipo>/) siguiendo su cursor next_max_id.
+# Las peticiones salen del navegador ya autenticado (fetch en Selenium, page.request en Playwright)
+
+# Seguidores de cada usuario si el payload de la lista los trae: esos perfiles no se visitan en la FASE 2
+list_counts = {}
+
+# fetch con la sesión de la página (arguments: URL, X-IG-App-ID y el callback de execute_async_script)
+FETCH_JSON_SCRIPT = """
+const done = arguments[arguments.length - 1];
+fetch(arguments[0], {
+    credentials: 'include',
+    headers: {'X-IG-App-ID': arguments[1], 'X-Requested-With': 'XMLHttpRequest'},
+})
+    .then((response) => response.text().then((body) => done({status: response.status, body: body})))
+    .catch((error) => done({status: 0, body: String(error)}));
+"""
+
+class FollowerListPaginator:
     """
-    Obtiene el número de seguidores de un usuario usando Playwright
+    Estado de la extracción por API de una lista: primero resuelve el id de la cuenta
+    (web_profile_info) y después pide páginas de friendships siguiendo next_max_id hasta el
+    objetivo o el final de la lista, sin tope de páginas.
+    El transporte lo pone quien la usa: next_url() da la siguiente URL (None al terminar)
+    y accept(status, body) procesa su respuesta.
     """
-    page = None
-    try:
-        page = await context.new_page()
-        
-        # Bloquear recursos innecesarios para mayor velocidad
-        await page.route("**/*.{png,jpg,jpeg,gif,svg,mp4,webm}", lambda route: route.abort())
-        await page.route("**/static/**", lambda route: route.abort())
-        
-        url = f'https://www.instagram.com/{username}/'
-        await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-        
-        # Esperar un poco para que cargue
-        await page.wait_for_timeout(2000)
-        
-        # Verificar si existe
+    
+    def __init__(self, account_name, page_type, target_count, on_username=None):
+        self.account_name = account_name
+        self.page_type = page_type
+        self.target_count = target_count
+        self.on_username = on_username
+        self.user_id = None
+        self.cursor = None
+        self.exhausted = False  # Fin de la lista (o cuenta inexistente)
+        self.failed = False  # LIST_API_MAX_ERRORS fallos seguidos: hay que volver al modo dom
+        self.errors = 0
+        self.pages = 0
+        self.followers_list = []
+        self.scraped = set()
+    
+    def next_url(self):
+        if self.failed or self.exhausted or len(self.followers_list) >= self.target_count:
+            return None
+        if self.user_id is None:
+            return f"{INSTAGRAM_BASE_URL}/api/v1/users/web_profile_info/?username={quote(self.account_name)}"
+        url = f"{INSTAGRAM_BASE_URL}/api/v1/friendships/{self.user_id}/{self.page_type}/?count={LIST_API_PAGE_SIZE}"
+        return url + (f"&max_id={quote(str(self.cursor))}" if self.cursor else "")
+    
+    def accept(self, status, body):
+        """Procesa la respuesta de next_url(). Devuelve los usuarios nuevos de la página"""
+        # Solo un 404 o un perfil sin usuario significan que la cuenta no existe
+        if status == 404 and self.user_id is None:
+            return self.not_found()
         try:
-            error = await page.query_selector("h2:has-text('Sorry')")
-            if error:
-                logger.warning(f"  [Worker {worker_id}] ⚠ {username} no existe/privado")
-                return username, None
-        except Exception:
-            pass
+            if status != 200:
+                raise ValueError(f"HTTP {status}")
+            data = json.loads(body)
+            if self.user_id is None:
+                user = data["data"]["user"]
+                if user is None:
+                    return self.not_found()
+                self.user_id = user["id"]
+                logger.debug(f"✓ Id de {self.account_name}: {self.user_id}")
+                return []
+            # Una página sin users (checkpoint_required, otro esquema) es un fallo, no el fin de la lista
+            users = data["users"]
+            if not isinstance(users, list):
+                raise TypeError(f"users no es una lista: {type(users).__name__}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.errors += 1
+            logger.warning(f"  ⚠ Respuesta de la lista no válida: {e} ({self.errors}/{LIST_API_MAX_ERRORS})")
+            self.failed = self.errors >= LIST_API_MAX_ERRORS
+            return []
         
-        # Buscar número de seguidores
-        selectors = [
-            f'a[href="/{username}/followers/"]',
-            'a[href*="/followers/"]',
-        ]
-        # Para cada selector posible intentar extraer el número
-        for selector in selectors:
-            try:
-                element = await page.wait_for_selector(selector, timeout=5000)
-                if element:
-                    text = await element.inner_text()
-                    count = parse_follower_count(text)
-                    
-                    if count is not None:
-                        logger.success(f"  [Worker {worker_id}] ✓ {username}: {count:,}")
-                        return username, count
-                    
-                    # Intentar con title
-                    title = await element.get_attribute('title')
-                    if title:
-                        count = parse_follower_count(title)
-                        if count is not None:
-                            logger.success(f"  [Worker {worker_id}] ✓ {username}: {count:,}")
-                            return username, count
-            except Exception:
+        self.errors = 0
+        self.pages += 1
+        new_usernames = []
+        for user in users:
+            username = user.get("username")
+            if not username or username == self.account_name or username in self.scraped:
                 continue
+            self.scraped.add(username)
+            self.followers_list.append(username)
+            new_usernames.append(username)
+            if isinstance(user.get("follower_count"), int):
+                list_counts[username] = user["follower_count"]
+            if self.on_username:
+                self.on_username(username)
+            if len(self.followers_list) >= self.target_count:
+                logger.success(f"🎯 ¡Objetivo alcanzado! {len(self.followers_list)} usuarios")
+                break
         
-        # Método alternativo: buscar en todo el texto
-        try:
-            body_text = await page.inner_text('body')
-            if 'followers' in body_text.lower():
-                lines = body_text.split('\n')
-                for line in lines:
-                    if 'follower' in line.lower():
-                        count = parse_follower_count(line)
-                        if count is not None:
-                            logger.success(f"  [Worker {worker_id}] ✓ {username}: {count:,} (alt)")
-                            return username, count
-        except Exception:
-            pass
-        
-        logger.warning(f"  [Worker {worker_id}] ⚠ No se pudo obtener de {username}")
-        return username, None
-        
+        # Sin cursor (o el mismo que ya se pidió) no hay más páginas
+        cursor = data.get("next_max_id")
+        self.exhausted = not cursor or cursor == self.cursor
+        self.cursor = cursor
+        logger.log(
+            f"  ✓ Página {self.pages}: {len(self.followers_list)}/{self.target_count} (+{len(new_usernames)} nuevos)"
+        )
+        return new_usernames
+    
+    def not_found(self):
+        logger.error("❌ Cuenta no existe")
+        self.exhausted = True
+        return []
+    
+    def delay(self):
+        """Pausa (mín, máx) antes de la siguiente petición: la normal o un backoff exponencial tras un fallo"""
+        if self.errors:
+            backoff = 5 * 2 ** (self.errors - 1)
+            return backoff, backoff * 1.5
+        return 1.0, 2.0
+    
+    def result(self):
+        """Registra el resumen y devuelve la lista, o None si la API falló (para volver al modo dom)"""
+        extracted = len(self.followers_list)
+        logger.log("="*60)
+        if extracted >= self.target_count:
+            logger.success(f"✅ ÉXITO: {extracted} usuarios extraídos")
+        elif self.failed:
+            logger.error(f"❌ API de la lista fallida tras {LIST_API_MAX_ERRORS} intentos ({extracted} usuarios)")
+        elif extracted > 0:
+            logger.warning(f"⚠️ PARCIAL: {extracted}/{self.target_count} usuarios")
+            logger.warning(f"   Razón: fin de la lista (la cuenta solo tiene {extracted} {self.page_type} accesibles)")
+        else:
+            logger.error("❌ FALLO: No se extrajeron usuarios")
+        logger.log(f"   Páginas JSON: {self.pages}")
+        logger.log("="*60)
+        return None if self.failed else self.followers_list
+
+def extract_followers_list_api_selenium(driver, account_name, page_type, target_count, on_username=None):
+    """
+    Extrae la lista por API con la sesión de Selenium (fetch desde una página de Instagram)
+    Devuelve la lista, o None si la API falló
+    """
+    logger.log(f"📋 Extrayendo lista de {page_type} de {account_name} por API...")
+    logger.log(f"🎯 Objetivo: {target_count} usuarios")
+    paginator = FollowerListPaginator(account_name, page_type, target_count, on_username)
+    try:
+        # fetch necesita el origen de Instagram para enviar las cookies de la sesión
+        if not driver.current_url.startswith(INSTAGRAM_BASE_URL):
+            driver.get(f"{INSTAGRAM_BASE_URL}/")
+        url = paginator.next_url()
+        while url:
+            with metrics.span("list_page") as labels:
+                response = driver.execute_async_script(FETCH_JSON_SCRIPT, url, IG_APP_ID)
+                labels["new_users"] = len(paginator.accept(response["status"], response["body"]))
+            url = paginator.next_url()
+            if url:
+                human_delay(*paginator.delay())
     except Exception as e:
-        logger.debug(f"  [Worker {worker_id}] ✗ Error en {username}: {str(e)}")
-        return username, None
-    finally:
-        if page:
-            await page.close()
+        logger.error(f"❌ Error extrayendo lista por API: {str(e)}")
+        paginator.failed = True
+    return paginator.result()
 
-async def process_batch(context, batch, worker_id, semaphore):
-    """Procesa un lote de usuarios con un worker"""
-    async with semaphore:
-        results = []
-        for username in batch:
-            result = await get_follower_count_playwright(context, username, worker_id)
-            results.append(result)
-            # Pequeña pausa entre perfiles del mismo worker
-            await asyncio.sleep(random.uniform(0.5, 1.5))
-        return results
+async def extract_followers_list_api_playwright(page, account_name, page_type, target_count, on_username=None):
+    """
+    Extrae la lista por API con page.request (comparte las cookies del contexto, sin renderizar nada)
+    Devuelve la lista, o None si la API falló
+    """
+    logger.log(f"📋 Extrayendo lista de {page_type} de {account_name} por API...")
+    logger.log(f"🎯 Objetivo: {target_count} usuarios")
+    paginator = FollowerListPaginator(account_name, page_type, target_count, on_username)
+    headers = {'X-IG-App-ID': IG_APP_ID, 'X-Requested-With': 'XMLHttpRequest'}
+    try:
+        url = paginator.next_url()
+        while url:
+            with metrics.span("list_page") as labels:
+                response = await page.request.get(url, headers=headers)
+                labels["new_users"] = len(paginator.accept(response.status, await response.text()))
+            url = paginator.next_url()
+            if url:
+                await human_delay_async(*paginator.delay())
+    except Exception as e:
+        logger.error(f"❌ Error extrayendo lista por API: {str(e)}")
+        paginator.failed = True
+    return paginator.result()
 
-async def analyze_profiles_parallel(cookies_file, followers_list, max_workers):
+def extract_list_selenium(driver, account_name, page_type, target_count, on_username=None):
+    """Lista de un objetivo según LIST_EXTRACTION (api, con respaldo en el diálogo si falla)"""
+    if LIST_EXTRACTION == "api":
+        followers_list = extract_followers_list_api_selenium(driver, account_name, page_type, target_count, on_username)
+        if followers_list is not None:
+            return followers_list
+        logger.warning("↩️  Extracción por API fallida, usando el diálogo")
+    return extract_followers_list_selenium(driver, account_name, page_type, target_count, on_username)
+
+async def extract_list_playwright(page, account_name, page_type, target_count, on_username=None):
+    """Equivalente de extract_list_selenium con Playwright"""
+    if LIST_EXTRACTION == "api":
+        followers_list = await extract_followers_list_api_playwright(
+            page, account_name, page_type, target_count, on_username
+        )
+        if followers_list is not None:
+            return followers_list
+        logger.warning("↩️  Extracción por API fallida, usando el diálogo")
+    return await extract_followers_list_playwright(page, account_name, page_type, target_count, on_username)
+
+# ====================== MODO JOB: VARIOS OBJETIVOS ======================
+# Las listas de cuentas relacionadas se solapan: cada usuario se visita una vez por ejecución
+# y sus resultados se reparten después entre los objetivos que lo contienen
+def log_target_start(position, total, target):
+    if total > 1:
+        account_name, page_type, target_count = target
+        logger.log(f"\n🎯 Objetivo {position}/{total}: {account_name} ({page_type}, {target_count} usuarios)")
+
+def unique_callback(on_username):
+    """Envuelve on_username para que un usuario compartido entre objetivos se entregue una sola vez"""
+    if on_username is None:
+        return None
+    seen = set()
+    
+    def callback(username):
+        if username not in seen:
+            seen.add(username)
+            on_username(username)
+    return callback
+
+def unique_usernames(target_lists):
+    """Usuarios de todas las listas sin repetir, en orden de primera aparición"""
+    return list(dict.fromkeys(username for usernames in target_lists.values() for username in usernames))
+
+def log_deduplication(target_lists):
+    if len(target_lists) < 2:
+        return
+    total = sum(len(usernames) for usernames in target_lists.values())
+    unique = len(unique_usernames(target_lists))
+    logger.log(
+        f"🔗 {total} usuarios en {len(target_lists)} objetivos → {unique} únicos "
+        f"({total - unique} repetidos no se vuelven a visitar)"
+    )
+
+def fan_out_results(target_lists, results):
+    """Reparte [(username, count)] de los usuarios únicos entre objetivos: {objetivo: {username: count}}"""
+    counts = dict(results)
+    return {
+        target: {username: counts.get(username) for username in usernames}
+        for target, usernames in target_lists.items()
+    }
+
+def extract_targets_selenium(driver, targets, on_username=None):
     """
-    Analiza perfiles en paralelo usando Playwright
+    Extrae la lista de cada objetivo con la misma sesión de Selenium
+    Devuelve {(cuenta, tipo, cantidad): [usernames]}; on_username recibe cada usuario una sola vez
     """
-    logger.log("="*80)
-    logger.log(f"🚀 INICIANDO ANÁLISIS PARALELO CON {max_workers} WORKERS")
-    logger.log("="*80)
+    on_username = unique_callback(on_username)
+    target_lists = {}
+    for position, target in enumerate(targets, 1):
+        log_target_start(position, len(targets), target)
+        target_lists[target] = extract_list_selenium(driver, *target, on_username)
+    log_deduplication(target_lists)
+    return target_lists
+
+# ====================== SESIÓN: REUTILIZAR LOGIN ======================
+def load_valid_session(session_file):
+    """
+    Devuelve las cookies de la sesión guardada si siguen siendo válidas, o None.
+    Comprobación barata: cookie sessionid no expirada y una petición HTTP a /accounts/edit/
+    que no redirija al login.
+    """
+    if not os.path.exists(session_file):
+        logger.log("🔑 No hay sesión guardada")
+        return None
     
-    # Cargar cookies
-    with open(cookies_file, 'r', encoding='utf-8') as f:
-        selenium_cookies = json.load(f)
+    try:
+        with open(session_file, 'r', encoding='utf-8') as f:
+            cookies = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Sesión guardada ilegible: {str(e)}")
+        return None
     
-    # Dividir la lista en lotes para cada worker
-    batch_size = len(followers_list) // max_workers
-    if batch_size == 0:
-        batch_size = 1
+    session_cookie = next((cookie for cookie in cookies if cookie.get('name') == 'sessionid'), None)
+    if not session_cookie:
+        logger.log("🔑 La sesión guardada no contiene sessionid")
+        return None
+    if session_cookie.get('expiry') and session_cookie['expiry'] < time.time():
+        logger.log("🔑 La sesión guardada ha expirado")
+        return None
     
-    batches = [followers_list[i:i+batch_size] for i in range(0, len(followers_list), batch_size)]
+    try:
+        with httpx.Client(
+            cookies=load_http_cookies(session_file),
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            timeout=10.0,
+            follow_redirects=False,
+        ) as client:
+            response = client.get(f"{INSTAGRAM_BASE_URL}/accounts/edit/")
+    except httpx.HTTPError as e:
+        logger.warning(f"No se pudo comprobar la sesión guardada: {str(e)}")
+        return None
     
-    logger.log(f"📦 {len(followers_list)} usuarios divididos en {len(batches)} lotes")
+    if response.status_code != 200:
+        logger.log(f"🔑 La sesión guardada ya no es válida (HTTP {response.status_code})")
+        return None
     
-    results = []
+    logger.success(f"✓ Sesión guardada válida: {session_file}")
+    return cookies
+
+def restore_selenium_session(driver, cookies):
+    """Carga en Selenium las cookies de una sesión válida en lugar de hacer login"""
+    driver.get(f'{INSTAGRAM_BASE_URL}/')
+    allowed_keys = ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite')
+    for cookie in cookies:
+        try:
+            driver.add_cookie({key: value for key, value in cookie.items() if key in allowed_keys})
+        except Exception as e:
+            logger.debug(f"Cookie {cookie.get('name')} no restaurada: {str(e)}")
+    logger.success("✓ Sesión restaurada sin login")
+
+# ====================== PLAYWRIGHT: LOGIN Y EXTRACCIÓN DE LISTA ======================
+# Equivalentes asíncronos de las funciones de Selenium para el modo SCRAPER_ENGINE=playwright
+async def human_delay_async(min_seconds=1.0, max_seconds=3.0):
+    with metrics.span("sleep"):
+        await asyncio.sleep(random.uniform(min_seconds, max_seconds))
+
+def playwright_script(body):
+    """
+    Adapta un script de execute_script (cuerpo con return y arguments[i]) a page.evaluate,
+    que recibe los argumentos como una única lista
+    """
+    return f"(args) => (function () {{ {body} }}).apply(null, args)"
+
+async def handle_cookies_playwright(page):
+    """Maneja cookies"""
+    cookie_selectors = [
+        "button:has-text('Allow essential and optional cookies')",
+        "button:has-text('Accept')",
+    ]
     
-    async with async_playwright() as p:
-        # Lanzar navegador
-        browser = await p.chromium.launch(
-            headless=True,  # Cambiar a False para ver el proceso
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        
-        # Crear contexto con cookies
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        
-        # Añadir cookies de Selenium a Playwright
-        playwright_cookies = []
-        for cookie in selenium_cookies:
-            playwright_cookie = {
-                'name': cookie['name'],
-                'value': cookie['value'],
-                'domain': cookie['domain'],
-                'path': cookie['path'],
-            }
-            if 'expiry' in cookie:
-                playwright_cookie['expires'] = cookie['expiry']
-            if 'secure' in cookie:
-                playwright_cookie['secure'] = cookie['secure']
-            if 'httpOnly' in cookie:
-                playwright_cookie['httpOnly'] = cookie['httpOnly']
-            
-            playwright_cookies.append(playwright_cookie)
-        
-        await context.add_cookies(playwright_cookies)
-        logger.success("✓ Cookies cargadas en Playwright")
-        
-        # Semáforo para limitar concurrencia
-        semaphore = asyncio.Semaphore(max_workers)
-        
-        # Crear tareas para cada lote
-        tasks = []
-        for worker_id, batch in enumerate(batches, 1):
-            task = process_batch(context, batch, worker_id, semaphore)
-            tasks.append(task)
-        
-        # Ejecutar todas las tareas en paralelo
-        logger.log(f"⏱️  Tiempo estimado: ~{len(followers_list) * 2 / max_workers / 60:.1f} minutos")
-        start_time = datetime.datetime.now()
+    for selector in cookie_selectors:
+        try:
+            await page.locator(selector).first.click(timeout=3000)
+            await human_delay_async(1, 2)
+            return True
+        except Exception:
+            continue
+    return False
+
+async def playwright_login(page):
+    """Login con Playwright"""
+    try:
+        logger.log("🔐 Iniciando login con Playwright...")
+        await page.goto(f'{INSTAGRAM_BASE_URL}/')
+        await human_delay_async(5, 7)
         
-        batch_results = await asyncio.gather(*tasks)
+        await handle_cookies_playwright(page)
         
-        end_time = datetime.datetime.now()
-        elapsed = (end_time - start_time).total_seconds()
+        # Buscar campos de login
+        username_input = page.locator("input[name='username']")
+        await username_input.wait_for(timeout=15000)
+        password_input = page.locator("input[name='password']")
         
-        # Consolidar resultados
-        for batch_result in batch_results:
-            results.extend(batch_result)
+        await username_input.press_sequentially(yourusername, delay=random.uniform(50, 150))
+        await human_delay_async(0.5, 1)
+        await password_input.press_sequentially(yourpassword, delay=random.uniform(50, 150))
+        await human_delay_async(1, 2)
         
-        await browser.close()
+        await page.locator("button[type='submit']").click(timeout=10000)
+        logger.log("Esperando respuesta del login...")
+        await human_delay_async(10, 15)
         
-        logger.log("="*80)
-        logger.success("✅ ANÁLISIS PARALELO COMPLETADO")
-        logger.log(f"⏱️  Tiempo real: {elapsed/60:.1f} minutos")
-        logger.log(f"🚀 Velocidad: {len(results)/(elapsed/60):.1f} perfiles/minuto")
-        logger.log("="*80)
-    
-    return results
-
-# ====================== GUARDAR RESULTADOS ======================
-def save_results(account_name, results_dict):
-    """Guarda resultados en CSV y TXT"""
-    
-# --- Nueva función auxiliar ---
-    def get_first_digit(number):
-        """Devuelve el primer dígito del número de seguidores."""
+        # Verificar login
         try:
-            return int(str(abs(int(number)))[0])
+            await page.locator("input[placeholder='Search'], input[aria-label='Search input']").first.wait_for(
+                timeout=10000
+            )
+            logger.success("✓ Login exitoso")
+            return True
         except Exception:
-            return None
-
-    # --- Preparar lista de resultados con First_Digit ---
-    results_list = []
-    for username, count in results_dict.items():
-        first_digit = get_first_digit(count)
-        results_list.append([account_name, username, count, first_digit])
-
-    # --- Guardar en CSV ---
-    try:
-        with open(logger.csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+            logger.warning("Continuando sin verificación definitiva...")
+            return True
+    
+    except Exception as e:
+        logger.error(f"Error en login: {str(e)}")
+        return False
+
+async def handle_post_login_dialogs_playwright(page):
+    """Cerrar diálogos post-login"""
+    dialog_buttons = [
+        "button:has-text('Not Now')",
+        "button:has-text('Ahora no')",
+    ]
+    
+    for _ in range(2):
+        await human_delay_async(2, 3)
+        for selector in dialog_buttons:
+            try:
+                await page.locator(selector).first.click(timeout=5000)
+                logger.debug("Diálogo cerrado")
+                break
+            except Exception:
+                continue
+
+async def scroll_modal_smart_playwright(page):
+    """Scroll inteligente del diálogo (mismo script que scroll_modal_smart)"""
+    try:
+        result = await page.evaluate(playwright_script(SCROLL_MODAL_SCRIPT), [])
+        
+        if result:
+            # Pausa para que Instagram cargue más datos
+            await human_delay_async(1.5, 2.5)
+            return True
+        else:
+            logger.debug("  ⚠ No se encontró div scrolleable")
+            return False
+    
+    except Exception as e:
+        logger.debug(f"  ✗ Error en scroll: {str(e)}")
+        return False
+
+async def extract_followers_list_playwright(page, account_name, page_type, target_count, on_username=None):
+    """
+    Extrae lista de seguidores con Playwright (misma estrategia que extract_followers_list_selenium)
+    Si se pasa on_username, se llama con cada usuario nuevo en cuanto se extrae
+    """
+    try:
+        logger.log(f"📋 Extrayendo lista de {page_type} de {account_name}...")
+        logger.log(f"🎯 Objetivo: {target_count} usuarios")
+        
+        await page.goto(f'{INSTAGRAM_BASE_URL}/{account_name}/')
+        await human_delay_async(5, 7)
+        
+        # Verificar cuenta existe
+        if await page.locator("h2:has-text('Sorry')").count():
+            logger.error("❌ Cuenta no existe")
+            return []
+        logger.debug("✓ Cuenta accesible")
+        
+        # Click en followers
+        logger.log(f"🔍 Buscando enlace de {page_type}...")
+        link = page.locator(f'a[href*="/{page_type}"]').first
+        await link.wait_for(timeout=10000)
+        
+        # Obtener el número total de followers (si es visible)
+        try:
+            logger.log(f"📊 Información: {await link.inner_text()}")
+        except Exception:
+            pass
+        
+        # Espera del diálogo: desde el clic hasta que aparece el modal
+        with metrics.span("dialog_wait") as labels:
+            await link.evaluate("element => element.click()")
+            logger.log("👆 Clic realizado, esperando modal...")
+            await human_delay_async(6, 8)
+            
+            try:
+                await page.wait_for_selector("div[role='dialog']", timeout=10000)
+                labels["found"] = True
+                logger.success("✓ Modal encontrado: div[role='dialog']")
+            except PlaywrightTimeoutError:
+                labels["found"] = False
+                logger.error("❌ No se encontró el modal")
+                return []
+        
+        # Esperar a que carguen los primeros elementos
+        logger.log("⏳ Esperando carga inicial de usuarios...")
+        await human_delay_async(2, 3)
+        
+        followers_list = []
+        scraped = set()
+        consecutive_no_progress = 0
+        max_no_progress = 10
+        scroll_attempts = 0
+        max_scroll_attempts = max_list_scrolls(target_count)
+        harvest_script = playwright_script(HARVEST_USERNAMES_SCRIPT)
+        
+        logger.log("🔄 Iniciando extracción con scroll inteligente...")
+        
+        while len(followers_list) < target_count and consecutive_no_progress < max_no_progress and scroll_attempts < max_scroll_attempts:
+            with metrics.span("scroll_iteration") as labels:
+                # Un solo viaje al navegador: solo usernames nuevos y ya filtrados
+                try:
+                    new_usernames = await page.evaluate(harvest_script, [account_name, INSTAGRAM_HOST])
+                except Exception as e:
+                    logger.debug(f"  ✗ Error extrayendo usernames: {str(e)}")
+                    new_usernames = []
+                
+                new_users_in_iteration = 0
+                
+                for username in new_usernames:
+                    if username in scraped:
+                        continue
+                    
+                    scraped.add(username)
+                    followers_list.append(username)
+                    new_users_in_iteration += 1
+                    if on_username:
+                        on_username(username)
+                    
+                    if len(followers_list) >= target_count:
+                        logger.success(f"🎯 ¡Objetivo alcanzado! {len(followers_list)} usuarios")
+                        break
+                
+                labels["new_users"] = new_users_in_iteration
+                consecutive_no_progress = log_extraction_progress(
+                    len(followers_list), target_count, new_users_in_iteration, consecutive_no_progress, max_no_progress
+                )
+                
+                if len(followers_list) >= target_count:
+                    break
+                
+                scroll_attempts += 1
+                if scroll_attempts % 10 == 1 or new_users_in_iteration > 0:
+                    logger.debug(f"  📜 Scroll #{scroll_attempts}")
+                
+                scroll_success = await scroll_modal_smart_playwright(page)
+                
+                if not scroll_success and consecutive_no_progress > 3:
+                    logger.warning("  ⚠ Scroll no encontró div scrolleable y sin progreso")
+                    # Método de respaldo: scroll del propio diálogo
+                    try:
+                        await page.locator("div[role='dialog']").first.evaluate("el => el.scrollTop = el.scrollHeight")
+                        await human_delay_async(2, 2)
+                    except Exception:
+                        pass
+                
+                log_stalled_extraction(len(followers_list), target_count, page_type, consecutive_no_progress)
+        
+        log_extraction_summary(
+            len(followers_list), target_count, page_type, consecutive_no_progress, max_no_progress, scroll_attempts
+        )
+        
+        return followers_list
+    
+    except Exception as e:
+        logger.error(f"❌ Error extrayendo lista: {str(e)}")
+        import traceback
+        logger.debug(f"Traceback: {traceback.format_exc()}")
+        return []
+
+async def extract_targets_playwright(page, targets, on_username=None):
+    """Equivalente de extract_targets_selenium con Playwright (misma página para todos los objetivos)"""
+    on_username = unique_callback(on_username)
+    target_lists = {}
+    for position, target in enumerate(targets, 1):
+        log_target_start(position, len(targets), target)
+        target_lists[target] = await extract_list_playwright(page, *target, on_username)
+    log_deduplication(target_lists)
+    return target_lists
+
+async def save_playwright_cookies(context, filepath):
+    """Guarda las cookies del contexto en formato Selenium (el mismo fichero de sesión para ambos motores)"""
+    try:
+        cookies = playwright_to_selenium_cookies(await context.cookies())
+        with open(filepath, 'w') as f:
+            json.dump(cookies, f)
+        logger.success(f"✓ Cookies guardadas: {filepath}")
+        return True
+    except Exception as e:
+        logger.error(f"Error guardando cookies: {str(e)}")
+        return False
+
+async def run_playwright_only(cookies_file, targets, max_workers, cache=None, journal=None):
+    """
+    Ejecución completa con un único navegador Playwright: login (o sesión guardada),
+    extracción de la lista de cada objetivo y análisis de perfiles sobre el mismo contexto,
+    sin lanzar Chrome/Selenium ni pasar las cookies por un fichero intermedio.
+    targets: [(cuenta, tipo, cantidad)]; los usuarios repetidos entre objetivos se analizan una vez.
+    Devuelve (target_lists, [(username, count)] de los usuarios únicos);
+    target_lists es None si el login falla y results None si no se extrajo ningún usuario
+    """
+    async with async_playwright() as p:
+        browser, context = await launch_playwright_context(p)
+        try:
+            page = await context.new_page()
+            
+            session_cookies = load_valid_session(logger.session_file) if SESSION_REUSE else None
+            if session_cookies:
+                with metrics.span("session_restore"):
+                    await context.add_cookies(selenium_to_playwright_cookies(session_cookies))
+                logger.success("✓ Sesión restaurada sin login")
+            else:
+                with metrics.span("login") as labels:
+                    labels["ok"] = await playwright_login(page)
+                if not labels["ok"]:
+                    logger.error("❌ Login fallido")
+                    return None, None
+                
+                with metrics.span("post_login_dialogs"):
+                    await handle_post_login_dialogs_playwright(page)
+            
+            # El fichero de cookies solo lo necesitan los consumidores fuera de este navegador
+            # (sesión guardada, motor HTTP y la FASE 2 de un --resume)
+            if SESSION_REUSE or PROFILE_ENGINE == "http" or journal:
+                await save_playwright_cookies(context, cookies_file)
+            
+            # Bloqueo de recursos desde aquí: la lista y los perfiles no necesitan imágenes ni fuentes
+            await block_resources(context)
+            
+            if PIPELINE_MODE:
+                logger.log("\n" + "="*80)
+                logger.log("FASE 1 + 2: EXTRACCIÓN Y ANÁLISIS SOLAPADOS (PIPELINE)")
+                logger.log("="*80)
+                
+                target_lists = {}
+                
+                async def extract(on_username):
+                    target_lists.update(await extract_targets_playwright(page, targets, on_username))
+                    if journal:
+                        journal.save_lists(target_lists, cookies_file)
+                
+                _, results = await run_pipeline(extract, cookies_file, max_workers, cache, journal, context)
+                return target_lists, results
+            
+            target_lists = await extract_targets_playwright(page, targets)
+            await page.close()
+            followers_list = unique_usernames(target_lists)
+            if not followers_list:
+                return target_lists, None
+            if journal:
+                journal.save_lists(target_lists, cookies_file)
+            
+            logger.success(f"✓ FASE 1 COMPLETADA: {len(followers_list)} usuarios extraídos")
+            logger.log("\n" + "="*80)
+            logger.log("FASE 2: PLAYWRIGHT - ANÁLISIS PARALELO DE PERFILES")
+            logger.log("="*80)
+            
+            results = await analyze_profiles_parallel(
+                cookies_file, followers_list, max_workers, cache, journal, context
+            )
+            return target_lists, results
+        finally:
+            await browser.close()
+
+# ====================== PLAYWRIGHT: ANÁLISIS PARALELO ======================
+async def launch_playwright_context(p):
+    """Lanza Chromium y crea el contexto con la misma huella que usa el scraper"""
+    browser = await p.chromium.launch(
+        headless=True,  # Cambiar a False para ver el proceso
+        args=['--disable-blink-features=AutomationControlled']
+    )
+    context = await browser.new_context(
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        viewport={'width': 1920, 'height': 1080}
+    )
+    return browser, context
+
+def selenium_to_playwright_cookies(selenium_cookies):
+    """Convierte cookies en formato Selenium (expiry) al formato de Playwright (expires)"""
+    playwright_cookies = []
+    for cookie in selenium_cookies:
+        playwright_cookie = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie['domain'],
+            'path': cookie['path'],
+        }
+        if 'expiry' in cookie:
+            playwright_cookie['expires'] = cookie['expiry']
+        if 'secure' in cookie:
+            playwright_cookie['secure'] = cookie['secure']
+        if 'httpOnly' in cookie:
+            playwright_cookie['httpOnly'] = cookie['httpOnly']
+        
+        playwright_cookies.append(playwright_cookie)
+    return playwright_cookies
+
+def playwright_to_selenium_cookies(playwright_cookies):
+    """Convierte cookies de Playwright al formato Selenium usado en los ficheros de sesión"""
+    selenium_cookies = []
+    for cookie in playwright_cookies:
+        selenium_cookie = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')}
+        # Playwright usa -1 para cookies de sesión
+        if cookie.get('expires', -1) > 0:
+            selenium_cookie['expiry'] = int(cookie['expires'])
+        selenium_cookies.append(selenium_cookie)
+    return selenium_cookies
+
+async def block_resources(context):
+    """
+    Aplica la política de bloqueo una sola vez a nivel de contexto (una ruta para todas las páginas)
+    y cuenta peticiones y bytes permitidos/bloqueados en bandwidth
+    """
+    if blocking_policy:
+        await apply_policy(context, blocking_policy, bandwidth)
+    else:
+        context.on("requestfinished", bandwidth.record_finished)
+
+def log_bandwidth():
+    """Resumen del tráfico de perfiles (Playwright y motor HTTP): peticiones y bytes por tipo de recurso"""
+    lines = bandwidth.summary_lines()
+    if not lines:
+        return
+    logger.log(f"📶 Tráfico: {lines[0]}")
+    for line in lines[1:]:
+        logger.log(f"   - {line}")
+
+# Script que detecta el primer indicador disponible del perfil:
+# página "Sorry", enlace de seguidores ya renderizado o meta og:description del HTML inicial
+PROFILE_READY_SCRIPT = """
+() => {
+    for (const h2 of document.querySelectorAll('h2')) {
+        if (h2.textContent.includes('Sorry')) return {kind: 'sorry'};
+    }
+    const link = document.querySelector('a[href*="/followers/"]');
+    if (link && link.innerText.trim()) {
+        const titled = link.querySelector('[title]') || link;
+        return {kind: 'link', text: link.innerText, title: titled.getAttribute('title')};
+    }
+    const meta = document.querySelector('meta[property="og:description"]');
+    if (meta && /follower|seguidor|abonn/i.test(meta.content || '')) {
+        return {kind: 'meta', text: meta.content};
+    }
+    return null;
+}
+"""
+
+async def read_profile_when_ready(page, worker_id=None):
+    """
+    Modo por eventos: devuelve en cuanto hay un indicador disponible,
+    acotado por PROFILE_READY_TIMEOUT_MS. Devuelve (outcome, count)
+    """
+    with metrics.span("selector_wait", worker_id, mode="event") as labels:
+        try:
+            handle = await page.wait_for_function(PROFILE_READY_SCRIPT, timeout=PROFILE_READY_TIMEOUT_MS)
+            data = await handle.json_value()
+        except PlaywrightTimeoutError:
+            labels["timeout"] = True
+            return OUTCOME_TIMEOUT, None
+    
+    if data['kind'] == 'sorry':
+        return OUTCOME_NOT_FOUND, None
+    
+    with metrics.span("parse", worker_id):
+        # El title del enlace contiene el número exacto (sin K/M)
+        count = parse_follower_count(f"{data['title']} followers") if data.get('title') else None
+        if count is None:
+            count = parse_follower_count(data.get('text'))
+    if count is not None:
+        return OUTCOME_FOUND, count
+    return OUTCOME_PARSE_ERROR, None
+
+async def read_profile_fixed_wait(page, username, worker_id=None):
+    """
+    Modo fijo: espera 2 s y prueba cada selector con timeout de 5 s.
+    Devuelve (outcome, count); timeout si ningún selector apareció a tiempo
+    """
+    # Esperar un poco para que cargue
+    with metrics.span("sleep", worker_id):
+        await page.wait_for_timeout(2000)
+    
+    # Verificar si existe
+    try:
+        error = await page.query_selector("h2:has-text('Sorry')")
+        if error:
+            return OUTCOME_NOT_FOUND, None
+    except Exception:
+        pass
+    
+    # Buscar número de seguidores
+    selectors = [
+        f'a[href="/{username}/followers/"]',
+        'a[href*="/followers/"]',
+    ]
+    # Para cada selector posible intentar extraer el número
+    timeouts = 0
+    for selector in selectors:
+        try:
+            with metrics.span("selector_wait", worker_id, mode="fixed") as labels:
+                try:
+                    element = await page.wait_for_selector(selector, timeout=5000)
+                except PlaywrightTimeoutError:
+                    labels["timeout"] = True
+                    timeouts += 1
+                    raise
+            if element:
+                text = await element.inner_text()
+                with metrics.span("parse", worker_id):
+                    count = parse_follower_count(text)
+                
+                if count is not None:
+                    return OUTCOME_FOUND, count
+                
+                # Intentar con title
+                title = await element.get_attribute('title')
+                if title:
+                    count = parse_follower_count(title)
+                    if count is not None:
+                        return OUTCOME_FOUND, count
+        except Exception:
+            continue
+    
+    if timeouts == len(selectors):
+        return OUTCOME_TIMEOUT, None
+    return OUTCOME_PARSE_ERROR, None
+
+async def get_follower_count_playwright(context, username, worker_id, page=None):
+    """
+    Obtiene el número de seguidores de un usuario usando Playwright
+    Si se pasa una página se reutiliza y no se cierra; si no, se abre una nueva
+    Devuelve (username, count, outcome)
+    """
+    owns_page = page is None
+    try:
+        if owns_page:
+            with metrics.span("page_create", worker_id):
+                page = await context.new_page()
+        
+        url = f'{INSTAGRAM_BASE_URL}/{username}/'
+        with metrics.span("goto", worker_id):
+            response = await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        
+        # Límite de peticiones: HTTP 429 o redirección al login
+        if (response and response.status == 429) or '/accounts/login' in page.url:
+            logger.warning(f"  [Worker {worker_id}] 🚦 {username}: limitado por Instagram")
+            return username, None, OUTCOME_THROTTLED
+        
+        if PROFILE_READINESS == "event":
+            outcome, count = await read_profile_when_ready(page, worker_id)
+        else:
+            outcome, count = await read_profile_fixed_wait(page, username, worker_id)
+        
+        if outcome == OUTCOME_NOT_FOUND:
+            logger.warning(f"  [Worker {worker_id}] ⚠ {username} no existe/privado")
+            return username, None, OUTCOME_NOT_FOUND
+        
+        if count is not None:
+            logger.success(f"  [Worker {worker_id}] ✓ {username}: {count:,}")
+            return username, count, OUTCOME_FOUND
+        
+        # Método alternativo: buscar en todo el texto (una sola pasada del parser)
+        try:
+            body = await page.inner_text('body')
+            with metrics.span("parse", worker_id, source="body"):
+                count = parse_follower_count(body)
+            if count is not None:
+                logger.success(f"  [Worker {worker_id}] ✓ {username}: {count:,} (alt)")
+                return username, count, OUTCOME_FOUND
+        except Exception:
+            pass
+        
+        if outcome == OUTCOME_TIMEOUT:
+            logger.warning(f"  [Worker {worker_id}] ⏱ {username}: la página no cargó a tiempo")
+            return username, None, OUTCOME_TIMEOUT
+        
+        logger.warning(f"  [Worker {worker_id}] ⚠ No se pudo obtener de {username}")
+        return username, None, OUTCOME_PARSE_ERROR
+        
+    except PlaywrightTimeoutError:
+        logger.debug(f"  [Worker {worker_id}] ⏱ Timeout al cargar {username}")
+        return username, None, OUTCOME_TIMEOUT
+    except Exception as e:
+        logger.debug(f"  [Worker {worker_id}] ✗ Error en {username}: {str(e)}")
+        return username, None, OUTCOME_ERROR
+    finally:
+        if owns_page and page:
+            with metrics.span("page_close", worker_id):
+                await page.close()
+
+# Resultados tras los que la página reutilizada puede haber quedado a medias (navegación colgada,
+# diálogo abierto, frame caído): se cierra y el siguiente perfil abre una nueva
+PAGE_RESET_OUTCOMES = (OUTCOME_ERROR, OUTCOME_TIMEOUT)
+
+async def profile_worker(context, queue, results, worker_id, reuse_page=True, journal=None, controller=None):
+    """
+    Worker de larga duración: toma usuarios de la cola compartida de uno en uno
+    hasta recibir el centinela None. Guarda cada resultado en su posición original
+    (y en el diario, si se pasa uno, en cuanto termina).
+    Con reuse_page mantiene una página caliente durante toda su vida y la sustituye
+    tras un resultado de PAGE_RESET_OUTCOMES.
+    Con controller, cada visita espera hueco bajo el límite adaptativo; un worker que
+    tiene que esperar cierra antes su página, así solo hay abiertas las de los admitidos.
+    """
+    page = None
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                queue.task_done()
+                return
+            index, username = item
+            try:
+                if controller:
+                    if page and controller.saturated():
+                        with metrics.span("page_close", worker_id):
+                            await close_quietly(page)
+                        page = None
+                    await controller.acquire()
+                started = time.perf_counter()
+                try:
+                    with metrics.span("profile", worker_id) as labels:
+                        # Recrear la página si se cerró o se colgó
+                        if reuse_page and (page is None or page.is_closed()):
+                            with metrics.span("page_create", worker_id):
+                                page = await context.new_page()
+                        results[index] = await get_follower_count_playwright(context, username, worker_id, page)
+                        labels["outcome"] = results[index][2]
+                        if page and results[index][2] in PAGE_RESET_OUTCOMES:
+                            with metrics.span("page_close", worker_id):
+                                await close_quietly(page)
+                            page = None
+                finally:
+                    if controller:
+                        await controller.release(is_congestion(results[index]), time.perf_counter() - started)
+                if journal:
+                    journal.append(*results[index])
+            finally:
+                queue.task_done()
+            # Pequeña pausa entre perfiles del mismo worker
+            with metrics.span("sleep", worker_id):
+                await asyncio.sleep(random.uniform(PROFILE_DELAY_MIN, PROFILE_DELAY_MAX))
+    finally:
+        if page and not page.is_closed():
+            with metrics.span("page_close", worker_id):
+                await page.close()
+
+async def close_quietly(page):
+    """Cierra una página que puede estar rota; un fallo al cerrarla no interrumpe al worker"""
+    try:
+        await page.close()
+    except Exception as e:
+        logger.debug(f"No se pudo cerrar la página: {e}")
+
+async def analyze_profiles_parallel(cookies_file, followers_list, max_workers, cache=None, journal=None,
+                                    context=None):
+    """
+    Analiza perfiles en paralelo (Playwright o HTTP según PROFILE_ENGINE)
+    Si se pasa una caché, solo visita los perfiles ausentes o expirados
+    Si se pasa un diario, omite los ya resueltos en él y anota cada resultado nuevo
+    Si se pasa un contexto de Playwright, los workers lo reutilizan (sin multiproceso)
+    Devuelve [(username, count)] en el orden de followers_list
+    """
+    logger.log("="*80)
+    logger.log(f"🚀 INICIANDO ANÁLISIS PARALELO CON {max_workers} WORKERS")
+    logger.log("="*80)
+    
+    # Reanudación: usuarios ya resueltos en una ejecución anterior
+    resumed = {
+        username: journal.completed[username]
+        for username in followers_list
+        if journal and username in journal.completed
+    }
+    if resumed:
+        logger.log(f"⏯️  Reanudando: {len(resumed)} usuarios ya resueltos en {journal.path}")
+    remaining = [username for username in followers_list if username not in resumed]
+    
+    # Seguidores que ya venían en el payload de la lista (LIST_EXTRACTION=api)
+    from_list = {
+        username: (list_counts[username], OUTCOME_FOUND) for username in remaining if username in list_counts
+    }
+    if from_list:
+        logger.log(f"📋 {len(from_list)} usuarios con seguidores ya incluidos en la lista")
+    remaining = [username for username in remaining if username not in from_list]
+    
+    # Consultar caché antes de abrir el navegador
+    cached = cache.get_fresh(remaining) if cache else {}
+    cached.update(resumed)
+    cached.update(from_list)
+    pending = [username for username in remaining if username not in cached]
+    if cache:
+        logger.log(f"💾 Caché: {len(cached) - len(resumed) - len(from_list)} aciertos, {len(pending)} por consultar")
+    
+    fetched = {}
+    if pending:
+        if PROCESS_SHARDS > 1 and len(pending) > 1 and context is None:
+            fetch_results = await fetch_profiles_sharded(
+                cookies_file, pending, max_workers, PROCESS_SHARDS, journal.path if journal else None
+            )
+        else:
+            fetch_results = await fetch_profiles(cookies_file, pending, max_workers, journal, context)
+        await retry_transient_failures(cookies_file, pending, fetch_results, max_workers, journal, context)
+        if cache:
+            cache.store(fetch_results)
+        fetched = {username: count for username, count, _ in fetch_results}
+    else:
+        logger.success("✓ Todos los perfiles servidos desde caché")
+    
+    return [
+        (username, cached[username][0] if username in cached else fetched.get(username))
+        for username in followers_list
+    ]
+
+# Resultados que indican congestión o bloqueo y recortan la concurrencia adaptativa
+CONGESTION_OUTCOMES = (OUTCOME_ERROR, OUTCOME_TIMEOUT, OUTCOME_THROTTLED, OUTCOME_NOT_FOUND)
+
+def is_congestion(result):
+    """Un resultado ausente (excepción) o de CONGESTION_OUTCOMES cuenta como congestión"""
+    return result is None or result[2] in CONGESTION_OUTCOMES
+
+# Máximo adaptativo de este proceso: cada shard recibe su parte de ADAPTIVE_MAX_WORKERS
+adaptive_max_workers = ADAPTIVE_MAX_WORKERS
+
+def worker_pool_size(max_workers, num_items=None):
+    """Workers a lanzar: MAX_WORKERS, o el máximo adaptativo si el control AIMD está activo"""
+    size = adaptive_max_workers if ADAPTIVE_CONCURRENCY else max_workers
+    return size if num_items is None else max(1, min(size, num_items))
+
+def make_concurrency_controller(max_workers):
+    """Crea el controlador AIMD (o None si está desactivado), arrancando en MAX_WORKERS"""
+    if not ADAPTIVE_CONCURRENCY:
+        return None
+    
+    def on_change(previous, current, reason):
+        logger.log(f"🎚️  Concurrencia: {previous} → {current} ({reason})")
+    
+    return AdaptiveConcurrency(
+        initial=max_workers,
+        minimum=min(ADAPTIVE_MIN_WORKERS, adaptive_max_workers),
+        maximum=adaptive_max_workers,
+        latency_target=ADAPTIVE_LATENCY_TARGET_S,
+        cooldown=ADAPTIVE_COOLDOWN_S,
+        on_change=on_change,
+    )
+
+def log_concurrency_summary(controller):
+    """Resume la evolución de la concurrencia adaptativa"""
+    if not controller:
+        return
+    levels = [level for _, level, _ in controller.history]
+    logger.log(
+        f"🎚️  Concurrencia final: {controller.current} "
+        f"(mín {min(levels)}, máx {max(levels)}, {len(levels) - 1} cambios)"
+    )
+
+def log_profile_timing():
+    """Desglose medido del tiempo por perfil (p50/p95 de cada span de los workers)"""
+    summary = metrics.summary()
+    if "profile" not in summary:
+        return
+    parts = [
+        f"{name} {summary[name]['p50']:.2f}/{summary[name]['p95']:.2f}"
+        for name in ("profile", "page_create", "goto", "request", "selector_wait", "parse", "sleep")
+        if name in summary
+    ]
+    logger.log(f"⏱️  Tiempo por perfil p50/p95 (s): {' | '.join(parts)}")
+
+def enqueue_profiles(followers_list, num_workers):
+    """Cola compartida con (index, username) y un centinela None por worker"""
+    queue = asyncio.Queue()
+    for index, username in enumerate(followers_list):
+        queue.put_nowait((index, username))
+    for _ in range(num_workers):
+        queue.put_nowait(None)
+    return queue
+
+async def run_playwright_workers(cookies_file, queue, results, num_workers, reuse_pages=None, journal=None,
+                                 controller=None):
+    """
+    Lanza navegador y contexto con las cookies y ejecuta num_workers sobre la cola
+    hasta que cada uno recibe su centinela. La cola puede seguir llenándose mientras tanto.
+    """
+    # Cargar cookies
+    with open(cookies_file, 'r', encoding='utf-8') as f:
+        selenium_cookies = json.load(f)
+    
+    async with async_playwright() as p:
+        # Lanzar navegador y crear contexto
+        browser, context = await launch_playwright_context(p)
+        
+        # Añadir cookies de Selenium a Playwright
+        await context.add_cookies(selenium_to_playwright_cookies(selenium_cookies))
+        logger.success("✓ Cookies cargadas en Playwright")
+        
+        # Rutas de bloqueo instaladas una sola vez para todas las páginas
+        await block_resources(context)
+        
+        await run_context_workers(context, queue, results, num_workers, reuse_pages, journal, controller)
+        
+        await browser.close()
+
+async def run_context_workers(context, queue, results, num_workers, reuse_pages=None, journal=None,
+                              controller=None):
+    """Ejecuta num_workers sobre un contexto ya autenticado (y con bloqueo instalado)"""
+    if reuse_pages is None:
+        reuse_pages = PAGE_POOL_ENABLED
+    
+    # Crear un worker por unidad de concurrencia y ejecutarlos en paralelo
+    await asyncio.gather(*[
+        profile_worker(context, queue, results, worker_id, reuse_pages, journal, controller)
+        for worker_id in range(1, num_workers + 1)
+    ])
+
+async def fetch_profiles_playwright(cookies_file, followers_list, max_workers, reuse_pages=None, journal=None,
+                                    context=None):
+    """
+    Visita los perfiles con Playwright
+    Con context reutiliza un contexto ya abierto (modo solo Playwright) en lugar de lanzar otro navegador
+    Devuelve [(username, count, outcome)]
+    """
+    # Cola compartida: cada worker toma el siguiente usuario libre
+    num_workers = worker_pool_size(max_workers, len(followers_list))
+    queue = enqueue_profiles(followers_list, num_workers)
+    results = [None] * len(followers_list)
+    controller = make_concurrency_controller(max_workers)
+    
+    logger.log(f"📦 {len(followers_list)} usuarios en cola para {num_workers} workers")
+    start_time = datetime.datetime.now()
+    
+    if context:
+        await run_context_workers(context, queue, results, num_workers, reuse_pages, journal, controller)
+    else:
+        await run_playwright_workers(cookies_file, queue, results, num_workers, reuse_pages, journal, controller)
+    log_concurrency_summary(controller)
+    
+    end_time = datetime.datetime.now()
+    elapsed = (end_time - start_time).total_seconds()
+    
+    logger.log("="*80)
+    logger.success("✅ ANÁLISIS PARALELO COMPLETADO")
+    logger.log(f"⏱️  Tiempo real: {elapsed/60:.1f} minutos")
+    logger.log(f"🚀 Velocidad: {len(results)/(elapsed/60):.1f} perfiles/minuto")
+    log_profile_timing()
+    logger.log("="*80)
+    
+    return results
+
+# ====================== HTTP: ANÁLISIS SIN NAVEGADOR ======================
+# Cabecera que la web de Instagram envía a su API interna
+IG_APP_ID = "936619743392459"
+
+# Meta og:description del HTML del perfil: "1,234 Followers, 150 Following, ..."
+OG_DESCRIPTION_RE = re.compile(r'<meta[^>]+property="og:description"[^>]+content="([^"]*)"', re.IGNORECASE)
+
+def load_http_cookies(cookies_file):
+    """Convierte las cookies guardadas por Selenium en cookies de httpx"""
+    with open(cookies_file, 'r', encoding='utf-8') as f:
+        selenium_cookies = json.load(f)
+    
+    cookies = httpx.Cookies()
+    for cookie in selenium_cookies:
+        cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie.get('path', '/'))
+    return cookies
+
+async def get_follower_count_http(client, username, worker_id):
+    """
+    Obtiene el número de seguidores sin navegador:
+    primero la API JSON del perfil y, si no responde JSON, el meta og:description del HTML.
+    Devuelve (username, count, outcome)
+    """
+    try:
+        with metrics.span("request", worker_id, source="api"):
+            response = await client.get(
+                f"{INSTAGRAM_BASE_URL}/api/v1/users/web_profile_info/",
+                params={"username": username},
+            )
+        bandwidth.record("allowed", "fetch", response.num_bytes_downloaded)
+        if response.status_code == 429 or '/accounts/login' in str(response.url):
+            logger.warning(f"  [HTTP {worker_id}] 🚦 {username}: limitado por Instagram")
+            return username, None, OUTCOME_THROTTLED
+        if response.status_code == 404:
+            logger.warning(f"  [HTTP {worker_id}] ⚠ {username} no existe/privado")
+            return username, None, OUTCOME_NOT_FOUND
+        if response.status_code == 200 and 'json' in response.headers.get('content-type', ''):
+            payload = response.json()
+            # Un cuerpo JSON que no es un objeto (lista, cadena) es una página que no se sabe leer
+            if not isinstance(payload, dict):
+                logger.debug(f"  [HTTP {worker_id}] ✗ {username}: JSON inesperado ({type(payload).__name__})")
+                return username, None, OUTCOME_PARSE_ERROR
+            user = (payload.get('data') or {}).get('user')
+            if user is None:
+                logger.warning(f"  [HTTP {worker_id}] ⚠ {username} no existe/privado")
+                return username, None, OUTCOME_NOT_FOUND
+            count = user['edge_followed_by']['count']
+            logger.success(f"  [HTTP {worker_id}] ✓ {username}: {count:,}")
+            return username, count, OUTCOME_FOUND
+        
+        # Alternativa: HTML del perfil
+        with metrics.span("request", worker_id, source="html"):
+            response = await client.get(f"{INSTAGRAM_BASE_URL}/{username}/")
+        bandwidth.record("allowed", "document", response.num_bytes_downloaded)
+        if response.status_code == 404 or "Sorry, this page" in response.text:
+            logger.warning(f"  [HTTP {worker_id}] ⚠ {username} no existe/privado")
+            return username, None, OUTCOME_NOT_FOUND
+        if response.status_code == 200:
+            with metrics.span("parse", worker_id, source="html"):
+                match = OG_DESCRIPTION_RE.search(response.text)
+                count = parse_follower_count(match.group(1)) if match else None
+            if count is not None:
+                logger.success(f"  [HTTP {worker_id}] ✓ {username}: {count:,} (html)")
+                return username, count, OUTCOME_FOUND
+            return username, None, OUTCOME_PARSE_ERROR
+        
+        logger.debug(f"  [HTTP {worker_id}] ✗ {username}: HTTP {response.status_code}")
+        return username, None, OUTCOME_ERROR
+        
+    except httpx.TimeoutException:
+        logger.debug(f"  [HTTP {worker_id}] ⏱ Timeout en {username}")
+        return username, None, OUTCOME_TIMEOUT
+    except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.debug(f"  [HTTP {worker_id}] ✗ Error en {username}: {str(e)}")
+        return username, None, OUTCOME_ERROR
+
+async def http_profile_worker(client, queue, results, worker_id, journal=None, controller=None):
+    """Worker HTTP: toma usuarios de la cola compartida hasta recibir el centinela None"""
+    while True:
+        item = await queue.get()
+        if item is None:
+            queue.task_done()
+            return
+        index, username = item
+        try:
+            if controller:
+                await controller.acquire()
+            started = time.perf_counter()
+            try:
+                with metrics.span("profile", worker_id) as labels:
+                    results[index] = await get_follower_count_http(client, username, worker_id)
+                    labels["outcome"] = results[index][2]
+            finally:
+                if controller:
+                    await controller.release(is_congestion(results[index]), time.perf_counter() - started)
+            if journal:
+                journal.append(*results[index])
+        finally:
+            queue.task_done()
+        with metrics.span("sleep", worker_id):
+            await asyncio.sleep(random.uniform(PROFILE_DELAY_MIN, PROFILE_DELAY_MAX))
+
+async def run_http_workers(cookies_file, queue, results, num_workers, journal=None, controller=None):
+    """
+    Ejecuta num_workers HTTP sobre la cola (hasta sus centinelas) con un cliente
+    asíncrono compartido (conexiones keep-alive reutilizadas)
+    """
+    async with httpx.AsyncClient(
+        cookies=load_http_cookies(cookies_file),
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'X-IG-App-ID': IG_APP_ID,
+        },
+        limits=httpx.Limits(max_connections=num_workers, max_keepalive_connections=num_workers),
+        timeout=15.0,
+        follow_redirects=True,
+    ) as client:
+        await asyncio.gather(*[
+            http_profile_worker(client, queue, results, worker_id, journal, controller)
+            for worker_id in range(1, num_workers + 1)
+        ])
+
+async def fetch_profiles_http(cookies_file, followers_list, max_workers, journal=None):
+    """
+    Visita los perfiles con un cliente HTTP asíncrono (sin navegador)
+    Devuelve [(username, count, outcome)]
+    """
+    num_workers = worker_pool_size(max_workers, len(followers_list))
+    queue = enqueue_profiles(followers_list, num_workers)
+    results = [None] * len(followers_list)
+    controller = make_concurrency_controller(max_workers)
+    
+    logger.log(f"🌐 Motor HTTP: {len(followers_list)} usuarios para {num_workers} workers")
+    
+    start_time = datetime.datetime.now()
+    await run_http_workers(cookies_file, queue, results, num_workers, journal, controller)
+    log_concurrency_summary(controller)
+    elapsed = (datetime.datetime.now() - start_time).total_seconds()
+    
+    logger.success(f"✅ Motor HTTP completado en {elapsed:.1f} s ({len(results)/max(elapsed, 1e-9):.1f} perfiles/s)")
+    log_profile_timing()
+    return results
+
+async def retry_failed_with_playwright(cookies_file, results, max_workers, journal=None, context=None):
+    """Respaldo por perfil del motor HTTP: reintenta con Playwright los no concluyentes"""
+    fallback = [
+        index for index, result in enumerate(results)
+        # Un hueco sin resultado (None) lo recoge retry_transient_failures, que lo cuenta como error
+        if result is not None and result[2] in (OUTCOME_ERROR, OUTCOME_TIMEOUT, OUTCOME_PARSE_ERROR)
+    ]
+    if fallback:
+        logger.warning(f"↩️  {len(fallback)} perfiles sin resultado por HTTP, reintentando con Playwright")
+        retried = await fetch_profiles_playwright(
+            cookies_file, [results[index][0] for index in fallback], max_workers, journal=journal, context=context
+        )
+        for index, result in zip(fallback, retried):
+            results[index] = result
+
+async def fetch_profiles(cookies_file, followers_list, max_workers, journal=None, context=None):
+    """
+    Visita los perfiles con el motor configurado (PROFILE_ENGINE).
+    En modo http, los perfiles que fallan se reintentan con Playwright.
+    Devuelve [(username, count, outcome)] en el orden de followers_list
+    """
+    if PROFILE_ENGINE != "http":
+        return await fetch_profiles_playwright(
+            cookies_file, followers_list, max_workers, journal=journal, context=context
+        )
+    
+    results = await fetch_profiles_http(cookies_file, followers_list, max_workers, journal)
+    await retry_failed_with_playwright(cookies_file, results, max_workers, journal, context)
+    return results
+
+# ====================== REINTENTOS: FALLOS TRANSITORIOS ======================
+# Clases de fallo: error (red o página caída), timeout (la página no cargó a tiempo), throttled (429 o login),
+# not_found (no existe o privado) y parse_error (página cargada pero número no reconocido).
+# Solo se reintentan las de RETRY_OUTCOMES
+FAILURE_CLASSES = (OUTCOME_ERROR, OUTCOME_TIMEOUT, OUTCOME_THROTTLED, OUTCOME_PARSE_ERROR)
+
+def failure_class(result):
+    """Outcome de un resultado; uno ausente (el worker no llegó a devolverlo) cuenta como error"""
+    return OUTCOME_ERROR if result is None else result[2]
+
+def retry_backoff(attempt):
+    """Espera antes de la pasada attempt (1, 2...): exponencial con tope, mitad fija y mitad aleatoria"""
+    delay = min(RETRY_BACKOFF_MAX_S, RETRY_BACKOFF_BASE_S * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+async def run_retry_pass(cookies_file, usernames, num_workers, journal=None, context=None):
+    """
+    Una pasada con num_workers fijos (sin control adaptativo) y el motor configurado.
+    Devuelve [(username, count, outcome)] en el orden de usernames
+    """
+    queue = enqueue_profiles(usernames, num_workers)
+    results = [None] * len(usernames)
+    if PROFILE_ENGINE == "http":
+        await run_http_workers(cookies_file, queue, results, num_workers, journal)
+        await retry_failed_with_playwright(cookies_file, results, num_workers, journal, context)
+    elif context:
+        await run_context_workers(context, queue, results, num_workers, journal=journal)
+    else:
+        await run_playwright_workers(cookies_file, queue, results, num_workers, journal=journal)
+    return results
+
+async def retry_transient_failures(cookies_file, usernames, results, max_workers, journal=None, context=None):
+    """
+    Pasada final sobre los perfiles con fallo transitorio (RETRY_OUTCOMES): hasta RETRY_MAX_PASSES
+    pasadas con RETRY_MAX_WORKERS workers como máximo y backoff con jitter antes de cada una.
+    Actualiza results ([(username, count, outcome)] alineado con usernames) en su sitio
+    y registra la tasa de resolución por clase de fallo
+    """
+    initial = [failure_class(result) for result in results]
+    for attempt in range(1, RETRY_MAX_PASSES + 1):
+        pending = [index for index, result in enumerate(results) if failure_class(result) in RETRY_OUTCOMES]
+        if not pending:
+            break
+        num_workers = max(1, min(RETRY_MAX_WORKERS, max_workers, len(pending)))
+        delay = retry_backoff(attempt)
+        logger.warning(
+            f"🔁 Reintento {attempt}/{RETRY_MAX_PASSES}: {len(pending)} perfiles con fallo transitorio, "
+            f"{num_workers} workers tras {delay:.1f} s de espera"
+        )
+        with metrics.span("retry_backoff", attempt=attempt):
+            await asyncio.sleep(delay)
+        with metrics.span("retry_pass", attempt=attempt):
+            retried = await run_retry_pass(
+                cookies_file, [usernames[index] for index in pending], num_workers, journal, context
+            )
+        for index, result in zip(pending, retried):
+            results[index] = result
+    log_retry_resolution(initial, results)
+
+def log_retry_resolution(initial, results):
+    """Por clase de fallo inicial: cuántos acabaron con dato, como no existe/privado o sin resolver"""
+    lines = []
+    for outcome in FAILURE_CLASSES:
+        indices = [index for index, initial_outcome in enumerate(initial) if initial_outcome == outcome]
+        if not indices:
+            continue
+        final = [failure_class(results[index]) for index in indices]
+        found = final.count(OUTCOME_FOUND)
+        not_found = final.count(OUTCOME_NOT_FOUND)
+        retried = "" if outcome in RETRY_OUTCOMES else " (no se reintenta)"
+        lines.append(
+            f"   - {outcome}{retried}: {len(indices)} → {found} con dato, {not_found} no existe/privado, "
+            f"{len(indices) - found - not_found} sin resolver ({(found + not_found) / len(indices) * 100:.0f}% resuelto)"
+        )
+    if lines:
+        logger.log("🔁 Resolución por clase de fallo:")
+        for line in lines:
+            logger.log(line)
+
+# ====================== PIPELINE: FASE 1 Y FASE 2 SOLAPADAS ======================
+async def run_pipeline(extract, cookies_file, max_workers, cache=None, journal=None, context=None):
+    """
+    Solapa la extracción de la lista con el análisis de perfiles:
+    cada username extraído entra en la cola que los workers ya están consumiendo.
+    extract(on_username) devuelve un awaitable que extrae la lista llamando a on_username
+    (Selenium en un hilo con asyncio.to_thread, o Playwright en el mismo bucle).
+    Con context, los workers de Playwright reutilizan ese contexto.
+    Devuelve (followers_list, [(username, count)])
+    """
+    loop = asyncio.get_running_loop()
+    loop_thread = threading.get_ident()
+    queue = asyncio.Queue()
+    followers_list = []
+    results = []
+    queued = []  # Índices que realmente se visitan (los únicos que se guardan en caché)
+    num_workers = worker_pool_size(max_workers)
+    controller = make_concurrency_controller(max_workers)
+    
+    def accept(username):
+        """Se ejecuta en el bucle de eventos por cada username nuevo"""
+        index = len(followers_list)
+        followers_list.append(username)
+        results.append(None)
+        
+        # Ya resuelto en el diario o en caché: no hace falta visitarlo
+        known = journal.completed.get(username) if journal else None
+        if known is None and username in list_counts:
+            known = (list_counts[username], OUTCOME_FOUND)
+        if known is None and cache:
+            known = cache.get_fresh([username]).get(username)
+        if known is not None:
+            results[index] = (username, *known)
+            return
+        queued.append(index)
+        queue.put_nowait((index, username))
+    
+    def on_username(username):
+        """Puede ejecutarse en el hilo de Selenium o en el propio bucle"""
+        if threading.get_ident() == loop_thread:
+            # Productor en el bucle (Playwright, API): encolar ya, antes de que produce() ponga los centinelas
+            accept(username)
+        else:
+            loop.call_soon_threadsafe(accept, username)
+    
+    async def produce():
+        try:
+            await extract(on_username)
+        finally:
+            # Los centinelas llegan después de todos los usernames: los del bucle ya están en la cola y los
+            # del hilo de Selenium se programaron antes de que asyncio.to_thread devolviera
+            for _ in range(num_workers):
+                queue.put_nowait(None)
+    
+    logger.log(f"🔀 Pipeline: extracción y análisis en paralelo con {num_workers} workers")
+    start_time = datetime.datetime.now()
+    
+    if PROFILE_ENGINE == "http":
+        consume = run_http_workers(cookies_file, queue, results, num_workers, journal, controller)
+    elif context:
+        consume = run_context_workers(context, queue, results, num_workers, journal=journal, controller=controller)
+    else:
+        consume = run_playwright_workers(
+            cookies_file, queue, results, num_workers, journal=journal, controller=controller
+        )
+    await asyncio.gather(produce(), consume)
+    log_concurrency_summary(controller)
+    
+    if PROFILE_ENGINE == "http":
+        await retry_failed_with_playwright(cookies_file, results, max_workers, journal, context)
+    await retry_transient_failures(cookies_file, followers_list, results, max_workers, journal, context)
+    
+    elapsed = (datetime.datetime.now() - start_time).total_seconds()
+    if cache:
+        cache.store([results[index] for index in queued if results[index] is not None])
+    
+    logger.log("="*80)
+    logger.success("✅ PIPELINE COMPLETADO")
+    logger.log(f"⏱️  Tiempo real: {elapsed/60:.1f} minutos ({len(results) - len(queued)} perfiles ya conocidos)")
+    logger.log(f"🚀 Velocidad: {len(results)/max(elapsed/60, 1e-9):.1f} perfiles/minuto")
+    logger.log("="*80)
+    
+    return followers_list, [
+        (username, result[1] if result else None)
+        for username, result in zip(followers_list, results)
+    ]
+
+# ====================== MULTIPROCESO: SHARDS DE PERFILES ======================
+def attach_shard_log(records):
+    """Inicializador de cada proceso: sus mensajes los escribe el padre (un solo fichero y una sola rotación)"""
+    logger.writer.attach(records)
+
+def run_profile_shard(shard_id, cookies_file, followers_list, max_workers, journal_path=None, adaptive_max=None):
+    """
+    Punto de entrada de cada proceso: bucle de eventos, navegador y contexto propios,
+    iniciados desde el fichero de cookies compartido.
+    Cada proceso abre su propio manejador del diario (escrituras en modo append)
+    y, con adaptive_max, limita a ese valor su concurrencia adaptativa.
+    Devuelve (shard_id, [(username, count, outcome)], segundos, spans, tráfico)
+    """
+    global adaptive_max_workers
+    if adaptive_max:
+        adaptive_max_workers = adaptive_max
+    journal = ResultJournal(journal_path, resume=True) if journal_path else None
+    # Con fork el proceso hereda los spans del padre: devolver solo los nuevos
+    first_span = len(metrics.spans)
+    bandwidth.reset()
+    start_time = datetime.datetime.now()
+    try:
+        results = asyncio.run(fetch_profiles(cookies_file, followers_list, max_workers, journal))
+    finally:
+        if journal:
+            journal.close()
+    elapsed = (datetime.datetime.now() - start_time).total_seconds()
+    return shard_id, results, elapsed, metrics.spans[first_span:], bandwidth.as_dict()
+
+async def fetch_profiles_sharded(cookies_file, followers_list, max_workers, num_shards, journal_path=None):
+    """
+    Reparte los usuarios (intercalados) entre num_shards procesos.
+    MAX_WORKERS (y ADAPTIVE_MAX_WORKERS con control AIMD) se mantiene como concurrencia total
+    repartida entre procesos.
+    Devuelve [(username, count, outcome)] en el orden de followers_list
+    """
+    num_shards = min(num_shards, len(followers_list))
+    workers_per_shard = max(1, max_workers // num_shards)
+    adaptive_per_shard = max(1, ADAPTIVE_MAX_WORKERS // num_shards)
+    shards = [list(range(i, len(followers_list), num_shards)) for i in range(num_shards)]
+    
+    adaptive_note = f", hasta {adaptive_per_shard} con AIMD" if ADAPTIVE_CONCURRENCY else ""
+    logger.log(
+        f"🧩 {len(followers_list)} usuarios en {num_shards} procesos ({workers_per_shard} workers c/u{adaptive_note})"
+    )
+    
+    loop = asyncio.get_running_loop()
+    start_time = datetime.datetime.now()
+    with ProcessPoolExecutor(
+        max_workers=num_shards, initializer=attach_shard_log, initargs=(logger.writer.share(),)
+    ) as pool:
+        shard_results = await asyncio.gather(*[
+            loop.run_in_executor(
+                pool, run_profile_shard, shard_id, cookies_file,
+                [followers_list[index] for index in indices], workers_per_shard, journal_path,
+                adaptive_per_shard,
+            )
+            for shard_id, indices in enumerate(shards, 1)
+        ])
+    elapsed = (datetime.datetime.now() - start_time).total_seconds()
+    
+    # Reunir resultados en el orden original
+    results = [None] * len(followers_list)
+    for shard_id, shard_result, shard_elapsed, shard_spans, shard_bandwidth in shard_results:
+        metrics.extend(shard_spans, worker_prefix=f"s{shard_id}")
+        bandwidth.merge(shard_bandwidth)
+        for index, result in zip(shards[shard_id - 1], shard_result):
+            results[index] = result
+        logger.log(
+            f"   Proceso {shard_id}: {len(shard_result)} perfiles en {shard_elapsed:.1f} s "
+            f"({len(shard_result)/(max(shard_elapsed, 1e-9)/60):.1f} perfiles/min)"
+        )
+    logger.success(
+        f"✅ {num_shards} procesos: {len(results)} perfiles en {elapsed:.1f} s "
+        f"({len(results)/(max(elapsed, 1e-9)/60):.1f} perfiles/min en total)"
+    )
+    return results
+
+# ====================== GUARDAR RESULTADOS ======================
+class ResultJournal:
+    """
+    Diario CSV (append-only) con cada resultado en cuanto termina.
+    Sirve de checkpoint: con resume=True carga los usuarios ya resueltos.
+    Junto a él, en <diario>.list, la lista extraída en la FASE 1 y las cookies con que se hizo.
+    """
+    HEADER = ['Username_Follower', 'Num_Followers', 'Outcome']
+    
+    def __init__(self, path, resume=False, flush_every=None):
+        self.path = path
+        self.list_path = os.path.splitext(path)[0] + '.list'
+        self.flush_every = flush_every or JOURNAL_FLUSH_EVERY
+        self.completed = self.load(path) if resume else {}
+        self.buffer = []
+        
+        # Fichero nuevo: se trunca y se escribe la cabecera antes de abrirlo como los demás escritores
+        if not resume or not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(self.encode([self.HEADER]))
+        # Escritura binaria sin buffer y siempre en modo append (O_APPEND): cada lote es una sola llamada
+        # write() al final del fichero, así varios procesos pueden compartirlo sin pisarse ni mezclar líneas
+        self.file = open(path, 'ab', buffering=0)
+    
+    @staticmethod
+    def load(path):
+        """Devuelve {username: (count, outcome)} con los resultados concluyentes del diario"""
+        completed = {}
+        if not os.path.exists(path):
+            return completed
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                outcome = row.get('Outcome')
+                # error, timeout y throttled no concluyen: esos perfiles se repiten al reanudar
+                if outcome in (OUTCOME_FOUND, OUTCOME_NOT_FOUND, OUTCOME_PARSE_ERROR):
+                    count = int(row['Num_Followers']) if row['Num_Followers'] else None
+                    completed[row['Username_Follower']] = (count, outcome)
+                else:
+                    # Un error posterior no invalida un resultado anterior; uno nuevo sí lo sustituye
+                    completed.setdefault(row['Username_Follower'], None)
+        return {username: value for username, value in completed.items() if value is not None}
+    
+    def save_lists(self, target_lists, cookies_file):
+        """Guarda {(cuenta, tipo, cantidad): [usernames]} y el fichero de cookies (escritura atómica)"""
+        data = {
+            'cookies_file': os.path.abspath(cookies_file),
+            'targets': [
+                {'account': target[0], 'page': target[1], 'count': target[2], 'usernames': usernames}
+                for target, usernames in target_lists.items()
+            ],
+        }
+        tmp_path = self.list_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.list_path)
+    
+    def load_lists(self, targets):
+        """
+        Devuelve (target_lists, cookies_file) guardados por una ejecución anterior,
+        o (None, None) si no hay lista, no cubre exactamente targets o faltan las cookies
+        """
+        try:
+            with open(self.list_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            target_lists = {
+                (entry['account'], entry['page'], entry['count']): entry['usernames']
+                for entry in data['targets']
+            }
+            cookies_file = data['cookies_file']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, None
+        if set(target_lists) != set(targets) or not os.path.exists(cookies_file):
+            return None, None
+        return target_lists, cookies_file
+    
+    @staticmethod
+    def encode(rows):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode('utf-8')
+    
+    def _write(self, rows):
+        self.file.write(self.encode(rows))
+    
+    def append(self, username, count, outcome):
+        self.buffer.append([username, '' if count is None else count, outcome])
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        if self.buffer:
+            self._write(self.buffer)
+            self.buffer = []
+    
+    def close(self):
+        self.flush()
+        self.file.close()
+
+def save_results(account_name, results_dict, page_type=None, csv_file=None, txt_file=None):
+    """
+    Guarda resultados en CSV, en el almacén Parquet y (opcional) en TXT
+    Por defecto usa PAGE_TYPE y los ficheros del logger; el modo job pasa los de cada objetivo
+    """
+    page_type = page_type or page
+    csv_file = csv_file or logger.csv_file
+    txt_file = txt_file or logger.txt_file
+    
+    # --- First_Digit vectorizado (None donde no hay número) ---
+    digits = first_digits(list(results_dict.values())).tolist()
+    results_list = [
+        [account_name, username, count, None if count is None else digit]
+        for (username, count), digit in zip(results_dict.items(), digits)
+    ]
+
+    # --- Guardar en CSV ---
+    try:
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
             writer.writerow(['Username', 'Username_Follower', 'Num_Followers', 'First_Digit'])
             writer.writerows(results_list)
-        logger.success(f"📊 CSV: {logger.csv_file}")
+        logger.success(f"📊 CSV: {csv_file}")
     except Exception as e:
         logger.error(f"Error CSV: {str(e)}")
 
+    # --- Añadir al almacén columnar (una partición por cuenta y fecha) ---
+    if RESULTS_STORE == "parquet":
+        if not ResultsStore.available:
+            logger.warning("⚠ RESULTS_STORE=parquet requiere pyarrow; se omite el almacén")
+        else:
+            try:
+                with metrics.span("results_store"):
+                    rows = ResultsStore(logger.results_store_dir).append(
+                        account_name, page_type, results_dict, run_id=logger.timestamp
+                    )
+                logger.success(f"🗄️  Parquet: {rows} filas en {logger.results_store_dir} (account={account_name})")
+            except Exception as e:
+                logger.error(f"Error Parquet: {str(e)}")
+
     # --- Guardar en TXT ---
+    if not WRITE_TXT:
+        return
     try:
-        with open(logger.txt_file, 'w', encoding='utf-8') as f:
+        with open(txt_file, 'w', encoding='utf-8') as f:
             f.write(f"{'='*100}\n")
             f.write(f"ANÁLISIS DE SEGUIDORES (HÍBRIDO) - {account_name}\n")
             f.write(f"Fecha: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -704,92 +2384,227 @@ def save_results(account_name, results_dict):
                 num_str = f"{num_followers:,}" if num_followers is not None else "N/A"
                 f.write(f"{username:<20} | {follower:<25} | {num_str:>15} | {str(first_digit):>12}\n")
 
-        logger.success(f"📄 TXT: {logger.txt_file}")
+        logger.success(f"📄 TXT: {txt_file}")
     except Exception as e:
         logger.error(f"Error TXT: {str(e)}")
 
 # ====================== MAIN ======================
+def run_selenium_phase(cookies_file, cache=None, journal=None, targets=targets):
+    """
+    FASE 1 del modo híbrido: login (o sesión guardada) y extracción de la lista de cada objetivo con Selenium.
+    Con PIPELINE=1 también analiza los perfiles (una vez por usuario) mientras se extraen las listas.
+    Deja las cookies en cookies_file para Playwright y cierra el driver.
+    Devuelve (target_lists, results), con results None si falta la FASE 2; (None, None) si falla
+    """
+    logger.log("\n" + "="*80)
+    logger.log("FASE 1: SELENIUM - LOGIN Y EXTRACCIÓN DE LISTA")
+    logger.log("="*80)
+    
+    driver = setup_selenium_driver()
+    logger.success("✓ Driver Selenium iniciado")
+    
+    try:
+        session_cookies = load_valid_session(logger.session_file) if SESSION_REUSE else None
+        if session_cookies:
+            with metrics.span("session_restore"):
+                restore_selenium_session(driver, session_cookies)
+        else:
+            with metrics.span("login") as labels:
+                labels["ok"] = selenium_login(driver)
+            if not labels["ok"]:
+                logger.error("❌ Login fallido")
+                return None, None
+            
+            with metrics.span("post_login_dialogs"):
+                handle_post_login_dialogs(driver)
+            
+            # Guardar la sesión recién iniciada para las próximas ejecuciones
+            if SESSION_REUSE:
+                save_selenium_cookies(driver, logger.session_file)
+        
+        results = None
+        if PIPELINE_MODE:
+            # Cookies entregadas a los workers en cuanto termina el login
+            if not save_selenium_cookies(driver, cookies_file):
+                logger.error("❌ No se pudieron guardar cookies")
+                return None, None
+            
+            logger.log("\n" + "="*80)
+            logger.log("FASE 1 + 2: EXTRACCIÓN Y ANÁLISIS SOLAPADOS (PIPELINE)")
+            logger.log("="*80)
+            target_lists = {}
+            
+            async def extract(on_username):
+                target_lists.update(
+                    await asyncio.to_thread(extract_targets_selenium, driver, targets, on_username)
+                )
+                if journal:
+                    journal.save_lists(target_lists, cookies_file)
+            
+            followers_list, results = asyncio.run(
+                run_pipeline(extract, cookies_file, MAX_CONCURRENT_WORKERS, cache, journal)
+            )
+        else:
+            target_lists = extract_targets_selenium(driver, targets)
+            followers_list = unique_usernames(target_lists)
+        
+        if not followers_list:
+            logger.error("❌ No se pudieron extraer seguidores")
+            return None, None
+        
+        # Guardar cookies para Playwright
+        if not PIPELINE_MODE and not save_selenium_cookies(driver, cookies_file):
+            logger.error("❌ No se pudieron guardar cookies")
+            return None, None
+        
+        # Lista y cookies junto al diario: --resume no repite esta fase
+        if journal and not PIPELINE_MODE:
+            journal.save_lists(target_lists, cookies_file)
+        
+        logger.success(f"✓ FASE 1 COMPLETADA: {len(followers_list)} usuarios extraídos")
+        
+        return target_lists, results
+    finally:
+        # Cerrar Selenium
+        try:
+            driver.quit()
+            logger.log("✓ Driver Selenium cerrado")
+        except Exception:
+            pass
+
+def run_benford_phase(results_dict, csv_file):
+    """FASE 4 de un objetivo: Benford en proceso sobre los resultados en memoria. Devuelve el informe o None"""
+    try:
+        # Import diferido: benford_analyzer y sus dependencias solo se cargan en la FASE 4
+        from benford_analyzer import analizar_conteos, resumen_informe  # Pruebas de Benford en proceso.
+        with metrics.span("benford"):
+            benford_report = analizar_conteos(
+                results_dict.values(),
+                ruta_base=os.path.splitext(csv_file)[0] + "_benford",
+                plot=BENFORD_PLOT,
+                bootstrap=BENFORD_BOOTSTRAP,
+                origen=csv_file,
+            )
+        if not benford_report["pruebas"]:
+            logger.warning("⚠ Sin números de seguidores válidos para Benford")
+            return None
+        for line in resumen_informe(benford_report):
+            logger.log(f"   {line}")
+        logger.success("✓ Benford Analyzer ejecutado exitosamente")
+        return benford_report
+    except Exception as e:
+        logger.error(f"Error en Benford Analyzer: {str(e)}")
+        return None
+
 def main():
-    driver = None
+    profile_cache = None
+    journal = None
     
     try:
         start_time = datetime.datetime.now()
         
         logger.log("="*80)
-        logger.log("🎯 SCRAPER HÍBRIDO: SELENIUM + PLAYWRIGHT PARALELO")
+        if SCRAPER_ENGINE == "playwright":
+            logger.log("🎯 SCRAPER SOLO PLAYWRIGHT: LOGIN, LISTA Y PERFILES EN UN NAVEGADOR")
+        else:
+            logger.log("🎯 SCRAPER HÍBRIDO: SELENIUM + PLAYWRIGHT PARALELO")
         logger.log("="*80)
         logger.log("📊 Configuración:")
-        logger.log(f"   - Cuenta objetivo: {account}")
-        logger.log(f"   - Tipo: {page}")
-        logger.log(f"   - Cantidad: {count}")
+        if JOB_MODE:
+            logger.log(f"   - Objetivos ({len(targets)}, una sola sesión):")
+            for target_account, target_page, target_count in targets:
+                logger.log(f"       {target_account} ({target_page}, {target_count})")
+        else:
+            logger.log(f"   - Cuenta objetivo: {account}")
+            logger.log(f"   - Tipo: {page}")
+            logger.log(f"   - Cantidad: {count}")
         logger.log(f"   - Workers paralelos: {MAX_CONCURRENT_WORKERS}")
+        if PROCESS_SHARDS > 1:
+            logger.log(f"   - Procesos: {PROCESS_SHARDS}")
         logger.log("="*80)
         
-        # FASE 1: SELENIUM - Login y extracción de lista
-        logger.log("\n" + "="*80)
-        logger.log("FASE 1: SELENIUM - LOGIN Y EXTRACCIÓN DE LISTA")
-        logger.log("="*80)
-        
-        driver = setup_selenium_driver()
-        logger.success("✓ Driver Selenium iniciado")
-        
-        if not selenium_login(driver):
-            logger.error("❌ Login fallido")
-            return
-        
-        handle_post_login_dialogs(driver)
-        
-        followers_list = extract_followers_list_selenium(driver, account, page, count)
+        # Abrir caché de perfiles
+        if PROFILE_CACHE_ENABLED:
+            profile_cache = ProfileCache(logger.cache_file, PROFILE_CACHE_TTLS)
+            logger.log(f"💾 Caché de perfiles: {logger.cache_file}")
+        
+        # Diario de resultados (checkpoint para --resume)
+        journal = ResultJournal(logger.journal_file, resume=RESUME)
+        logger.log(f"📝 Diario de resultados: {logger.journal_file}{' (reanudando)' if RESUME else ''}")
+        
+        # Con sesión reutilizable las cookies viven en un fichero estable; si no, uno por ejecución
+        cookies_file = logger.session_file if SESSION_REUSE else logger.cookies_file
+        
+        # Reanudación: con la lista guardada junto al diario no se repite la FASE 1
+        saved_lists, saved_cookies = journal.load_lists(targets) if RESUME else (None, None)
+        
+        if saved_lists is not None:
+            logger.log(f"⏭️  FASE 1 omitida: lista guardada en {journal.list_path}")
+            target_lists, results = saved_lists, None
+            cookies_file = saved_cookies
+        elif SCRAPER_ENGINE == "playwright":
+            # FASES 1 Y 2: un único navegador Playwright
+            logger.log("\n" + "="*80)
+            logger.log("FASE 1: PLAYWRIGHT - LOGIN Y EXTRACCIÓN DE LISTA")
+            logger.log("="*80)
+            
+            target_lists, results = asyncio.run(
+                run_playwright_only(cookies_file, targets, MAX_CONCURRENT_WORKERS, profile_cache, journal)
+            )
+            if target_lists is None:
+                return
+        else:
+            target_lists, results = run_selenium_phase(cookies_file, profile_cache, journal, targets)
+            if target_lists is None:
+                return
         
+        # Usuarios únicos de todos los objetivos (cada perfil se visita una sola vez)
+        followers_list = unique_usernames(target_lists)
         if not followers_list:
             logger.error("❌ No se pudieron extraer seguidores")
             return
         
-        # Guardar cookies para Playwright
-        if not save_selenium_cookies(driver, logger.cookies_file):
-            logger.error("❌ No se pudieron guardar cookies")
-            return
-        
-        logger.success(f"✓ FASE 1 COMPLETADA: {len(followers_list)} usuarios extraídos")
-        
-        # Cerrar Selenium
-        driver.quit()
-        logger.log("✓ Driver Selenium cerrado")
-        
-        # FASE 2: PLAYWRIGHT - Análisis paralelo
-        logger.log("\n" + "="*80)
-        logger.log("FASE 2: PLAYWRIGHT - ANÁLISIS PARALELO DE PERFILES")
-        logger.log("="*80)
-        
-        # Ejecutar análisis paralelo
-        results = asyncio.run(
-            analyze_profiles_parallel(logger.cookies_file, followers_list, MAX_CONCURRENT_WORKERS)
-        )
+        if results is None:
+            # FASE 2: PLAYWRIGHT - Análisis paralelo
+            logger.log("\n" + "="*80)
+            logger.log("FASE 2: PLAYWRIGHT - ANÁLISIS PARALELO DE PERFILES")
+            logger.log("="*80)
+            
+            # Ejecutar análisis paralelo
+            results = asyncio.run(
+                analyze_profiles_parallel(
+                    cookies_file, followers_list, MAX_CONCURRENT_WORKERS, profile_cache, journal
+                )
+            )
         
-        # Convertir resultados a diccionario
+        # Convertir resultados a diccionario (usuarios únicos) y repartirlos entre objetivos
         results_dict = {username: count for username, count in results}
+        target_results = fan_out_results(target_lists, results)
+        output_files = {
+            target: logger.result_files(target[0], target[1]) if JOB_MODE else (logger.csv_file, logger.txt_file)
+            for target in target_results
+        }
         
-        # FASE 3: Guardar resultados
+        # FASE 3: Guardar resultados (un CSV/TXT por objetivo)
         logger.log("\n" + "="*80)
         logger.log("FASE 3: GUARDANDO RESULTADOS")
         logger.log("="*80)
 
-        save_results(account, results_dict)
+        for target, target_dict in target_results.items():
+            with metrics.span("save_results"):
+                save_results(target[0], target_dict, target[1], *output_files[target])
 
         # FASE 4: Ejecutar Benford Analyzer
         logger.log("\n" + "="*80)
         logger.log("FASE 4: EJECUTANDO BENFORD ANALYZER")
         logger.log("="*80)
 
-        import subprocess
-        try:
-            logger.log(f"Ejecutando benford_analyzer.py con CSV: {logger.csv_file}")
-            subprocess.run(["python", "benford_analyzer.py", logger.csv_file], check=True)
-            logger.success("✓ Benford Analyzer ejecutado exitosamente")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error ejecutando benford_analyzer.py: {e}")
-        except FileNotFoundError:
-            logger.error("benford_analyzer.py no encontrado en el directorio actual")
+        # En proceso y sobre los resultados en memoria: el CSV es solo una salida
+        benford_reports = {}
+        for target, target_dict in target_results.items():
+            if JOB_MODE:
+                logger.log(f"🎯 {target[0]} ({target[1]})")
+            benford_reports[target] = run_benford_phase(target_dict, output_files[target][0])
         
         # RESUMEN FINAL
         end_time = datetime.datetime.now()
@@ -808,15 +2623,39 @@ def main():
         logger.log(f"   - ✓ Exitosos: {successful}")
         logger.log(f"   - ✗ Fallidos: {failed}")
         logger.log(f"   - Tasa de éxito: {successful/len(results_dict)*100:.1f}%")
+        if profile_cache:
+            logger.log(f"   - 💾 Caché: {profile_cache.hits} aciertos / {profile_cache.misses} fallos")
+        span_summary = metrics.summary()
+        if span_summary:
+            logger.log("⏱️  Tiempo por span (total | n | p50 | p95):")
+            for name, stats in span_summary.items():
+                logger.log(
+                    f"   - {name}: {stats['total']:.1f} s | {stats['count']} | "
+                    f"{stats['p50']:.2f} s | {stats['p95']:.2f} s"
+                )
+        log_bandwidth()
         logger.log("📁 Archivos generados:")
-        logger.log(f"   - CSV: {logger.csv_file}")
-        logger.log(f"   - TXT: {logger.txt_file}")
+        for target, (csv_file, txt_file) in output_files.items():
+            if JOB_MODE:
+                logger.log(f"   🎯 {target[0]} ({target[1]}): {len(target_results[target])} usuarios")
+            logger.log(f"   - CSV: {csv_file}")
+            if WRITE_TXT:
+                logger.log(f"   - TXT: {txt_file}")
+            benford_report = benford_reports.get(target)
+            if benford_report:
+                logger.log(f"   - BENFORD: {benford_report['json']}")
+                if benford_report["png"]:
+                    logger.log(f"   - GRÁFICO: {benford_report['png']}")
+        if RESULTS_STORE == "parquet" and ResultsStore.available:
+            logger.log(f"   - PARQUET: {logger.results_store_dir}")
         logger.log(f"   - LOG: {logger.log_file}")
+        if metrics.enabled:
+            logger.log(f"   - MÉTRICAS: {logger.metrics_file}")
         logger.log("="*80)
         
         # Estimación para 500 perfiles
-        if count < 500:
-            estimated_time = (total_elapsed / count) * 500 / 60
+        if len(results_dict) < 500:
+            estimated_time = (total_elapsed / len(results_dict)) * 500 / 60
             logger.log(f"\n💡 Estimación para 500 perfiles: ~{estimated_time:.1f} minutos")
         
     except KeyboardInterrupt:
@@ -826,11 +2665,14 @@ def main():
         import traceback
         logger.error(f"Traceback:\n{traceback.format_exc()}")
     finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        if profile_cache:
+            profile_cache.close()
+        if journal:
+            journal.close()
+        # Exportar los spans también si la ejecución se interrumpe
+        if metrics.spans:
+            metrics.export(logger.metrics_file, METRICS_FORMAT)
+            logger.debug(f"Métricas exportadas ({len(metrics.spans)} spans): {logger.metrics_file}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Escritor de logs no bloqueante.
+Los mensajes se encolan (QueueHandler) y un hilo (QueueListener) los escribe en
+consola y en un fichero rotativo con el manejador siempre abierto. El fichero se
+vacía por lotes, cuando la cola queda vacía, en lugar de abrir, escribir y cerrar
+en cada línea desde el bucle de eventos de los workers.
+Los procesos hijos (shards) no escriben el fichero: envían sus registros al padre
+por una cola multiproceso (share/attach), así solo un proceso lo rota.
+"""
+
+import logging  # Registros, niveles y formato. Usado en LogWriter.
+import multiprocessing  # Cola entre procesos. Usado en LogWriter.share.
+import os  # PID del proceso. Usado en LogWriter.write.
+import queue  # Cola entre el bucle de eventos y el hilo escritor. Usado en LogWriter.
+import sys  # Salida estándar. Usado en el manejador de consola.
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler  # Cola y rotación. Usado en LogWriter.
+
+# Nivel propio entre INFO y WARNING para los mensajes de éxito
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "SUCCESS": SUCCESS,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler sin flush por registro: lo vacía el listener al terminar cada lote"""
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+class BatchedQueueListener(QueueListener):
+    """QueueListener que vacía los manejadores cuando la cola queda vacía (fin de lote)"""
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                getattr(handler, "flush_batch", handler.flush)()
+            return self.queue.get(block)
+
+
+class LogWriter:
+    """
+    Escribe "[fecha] [NIVEL] mensaje" en consola y fichero desde un hilo propio.
+    Filtra por nivel y rota el fichero al superar max_bytes (backup_count copias).
+    """
+
+    def __init__(self, path, level="INFO", max_bytes=10 * 1024 * 1024, backup_count=5):
+        self.path = path
+        self.level = LEVELS.get(str(level).upper(), logging.INFO)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.listener = None
+        self.shared_listener = None
+        self.start()
+
+    def start(self):
+        """Crea la cola, los manejadores y el hilo escritor (también tras un fork)"""
+        formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s", "%Y-%m-%d %H:%M:%S")
+        file_handler = BatchedRotatingFileHandler(
+            self.path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8", delay=True
+        )
+        console_handler = logging.StreamHandler(sys.stdout)
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+
+        records = queue.SimpleQueue()
+        self.pid = os.getpid()
+        self.logger = logging.Logger(f"ig_scraper.{self.pid}", self.level)
+        self.logger.addHandler(QueueHandler(records))
+        self.listener = BatchedQueueListener(records, file_handler, console_handler)
+        self.listener.start()
+
+    def share(self):
+        """
+        Cola multiproceso cuyos registros escribe este proceso con sus mismos manejadores.
+        Se pasa a los hijos, que llaman a attach() con ella
+        """
+        if self.listener is None or os.getpid() != self.pid:
+            self.start()
+        if self.shared_listener is None:
+            self.shared_listener = BatchedQueueListener(multiprocessing.Queue(), *self.listener.handlers)
+            self.shared_listener.start()
+        return self.shared_listener.queue
+
+    def attach(self, records):
+        """En un proceso hijo: enviar los registros a la cola de share() en lugar de escribirlos"""
+        self.close()
+        self.listener = None
+        self.shared_listener = None
+        self.pid = os.getpid()
+        self.logger = logging.Logger(f"ig_scraper.{self.pid}", self.level)
+        self.logger.addHandler(QueueHandler(records))
+
+    def write(self, message, level="INFO"):
+        # Un proceso hijo (fork) hereda la cola pero no el hilo escritor: arrancar uno propio
+        if os.getpid() != self.pid:
+            self.start()
+        self.logger.log(LEVELS.get(level, logging.INFO), message)
+
+    def close(self):
+        """Escribe lo pendiente y cierra el fichero; write() vuelve a abrirlo si se usa después"""
+        if self.listener is None or os.getpid() != self.pid:
+            return
+        # Primero los registros de los hijos: comparten los manejadores que se cierran después
+        if self.shared_listener is not None:
+            self.shared_listener.stop()
+            self.shared_listener = None
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.listener = None
+        self.pid = None
+
+    def reopen(self, path):
+        """Cambia el fichero de destino"""
+        self.close()
+        self.path = path
+        self.start()
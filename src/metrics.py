@@ -0,0 +1,118 @@
+"""
+Métricas de tiempo por fase y por perfil (spans).
+Cada span guarda nombre, worker, inicio, duración y etiquetas. Se exportan como
+JSON lines (un span por línea) o como histogramas por span y worker en el formato
+de texto de Prometheus.
+"""
+
+import contextlib  # Context manager de spans. Usado en Metrics.span.
+import json  # Exportación JSON lines. Usado en Metrics.export_jsonl.
+import time  # Cronómetro y marcas de tiempo. Usado en Metrics.
+
+# Límites (segundos) de los buckets de los histogramas
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Metrics:
+    """Colector de spans en memoria; seguro para el hilo de Selenium y el bucle de eventos"""
+
+    def __init__(self, enabled=True, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.spans = []
+        # Convierte perf_counter a tiempo Unix para las marcas de inicio
+        self.epoch_offset = time.time() - time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name, worker=None, **labels):
+        """
+        Mide el bloque y lo registra como span. Devuelve el dict de etiquetas
+        para que el bloque añada las que solo conoce al final (p. ej. outcome).
+        """
+        start = time.perf_counter()
+        try:
+            yield labels
+        finally:
+            self.record(name, time.perf_counter() - start, worker, start, **labels)
+
+    def record(self, name, duration, worker=None, start=None, **labels):
+        """Registra un span ya medido (duración en segundos)"""
+        if not self.enabled:
+            return
+        if start is None:
+            start = time.perf_counter() - duration
+        # list.append es atómico: no hace falta lock entre hilos
+        self.spans.append({
+            "span": name,
+            "worker": worker,
+            "start": round(self.epoch_offset + start, 6),
+            "duration": round(duration, 6),
+            **labels,
+        })
+
+    def extend(self, spans, worker_prefix=None):
+        """
+        Añade spans de otro colector (p. ej. de un proceso shard). Con worker_prefix, los workers
+        pasan a "<prefijo>-<worker>" (y los spans sin worker a "<prefijo>"): los ids de cada shard
+        empiezan en 1 y sin prefijo se mezclarían en el mismo histograma
+        """
+        if not self.enabled:
+            return
+        if worker_prefix is not None:
+            spans = [
+                {**span, "worker": worker_prefix if span["worker"] is None else f"{worker_prefix}-{span['worker']}"}
+                for span in spans
+            ]
+        self.spans.extend(spans)
+
+    def summary(self):
+        """Devuelve {span: {"count", "total", "p50", "p95", "max"}} ordenado por tiempo total"""
+        durations = {}
+        for span in self.spans:
+            durations.setdefault(span["span"], []).append(span["duration"])
+
+        summary = {}
+        for name, values in durations.items():
+            values.sort()
+            summary[name] = {
+                "count": len(values),
+                "total": sum(values),
+                "p50": values[(len(values) - 1) // 2],
+                "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max": values[-1],
+            }
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def export_jsonl(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for span in self.spans:
+                f.write(json.dumps(span, ensure_ascii=False) + "\n")
+
+    def export_prometheus(self, path, metric="ig_scraper_span_seconds"):
+        """Un histograma por (span, worker); los spans sin worker usan worker="main" """
+        groups = {}
+        for span in self.spans:
+            worker = "main" if span["worker"] is None else str(span["worker"])
+            groups.setdefault((span["span"], worker), []).append(span["duration"])
+
+        lines = [
+            f"# HELP {metric} Duración de cada fase del scraper por worker",
+            f"# TYPE {metric} histogram",
+        ]
+        for (name, worker), values in sorted(groups.items()):
+            labels = f'span="{name}",worker="{worker}"'
+            for bound in self.buckets:
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {sum(1 for v in values if v <= bound)}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {len(values)}')
+            lines.append(f"{metric}_sum{{{labels}}} {sum(values):.6f}")
+            lines.append(f"{metric}_count{{{labels}}} {len(values)}")
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def export(self, path, fmt="jsonl"):
+        """Exporta en el formato indicado: "jsonl" o "prometheus" """
+        if fmt == "prometheus":
+            self.export_prometheus(path)
+        else:
+            self.export_jsonl(path)
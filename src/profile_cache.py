@@ -0,0 +1,93 @@
+"""
+Caché persistente (SQLite) de número de seguidores por perfil.
+Evita volver a visitar perfiles consultados recientemente entre ejecuciones.
+"""
+
+import sqlite3  # Base de datos en disco. Usado en ProfileCache.
+import time  # Marcas de tiempo. Usado para calcular expiración.
+
+# Resultados posibles de una consulta de perfil
+OUTCOME_FOUND = "found"  # Número de seguidores obtenido
+OUTCOME_NOT_FOUND = "not_found"  # Página "Sorry" (no existe / privado)
+OUTCOME_PARSE_ERROR = "parse_error"  # Página cargada pero número no reconocido
+OUTCOME_ERROR = "error"  # Error transitorio (red, página caída). Nunca se cachea.
+OUTCOME_TIMEOUT = "timeout"  # La página no mostró ningún indicador a tiempo. Nunca se cachea.
+OUTCOME_THROTTLED = "throttled"  # HTTP 429 o redirección al login. Nunca se cachea.
+
+# TTL por defecto (segundos) para cada resultado
+DEFAULT_TTLS = {
+    OUTCOME_FOUND: 24 * 3600,
+    OUTCOME_NOT_FOUND: 72 * 3600,
+    OUTCOME_PARSE_ERROR: 1 * 3600,
+}
+
+
+class ProfileCache:
+    """Caché de perfiles con TTL por resultado y caché negativa"""
+
+    def __init__(self, db_path, ttls=None):
+        self.db_path = db_path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                username TEXT PRIMARY KEY,
+                follower_count INTEGER,
+                outcome TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_fresh(self, usernames):
+        """
+        Devuelve {username: (count, outcome)} para las entradas no expiradas.
+        Actualiza los contadores de aciertos y fallos.
+        """
+        now = time.time()
+        fresh = {}
+        usernames = list(usernames)
+
+        # Consultar en bloques para no superar el límite de variables de SQLite
+        for i in range(0, len(usernames), 500):
+            chunk = usernames[i:i+500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT username, follower_count, outcome, fetched_at FROM profiles "
+                f"WHERE username IN ({placeholders})",
+                chunk,
+            )
+            for username, follower_count, outcome, fetched_at in rows:
+                ttl = self.ttls.get(outcome, 0)
+                if now - fetched_at < ttl:
+                    fresh[username] = (follower_count, outcome)
+
+        self.hits += len(fresh)
+        self.misses += len(usernames) - len(fresh)
+        return fresh
+
+    def store(self, results):
+        """Guarda una lista de (username, count, outcome). Ignora errores transitorios."""
+        now = time.time()
+        rows = [
+            (username, follower_count, outcome, now)
+            for username, follower_count, outcome in results
+            if outcome in self.ttls
+        ]
+        if rows:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO profiles (username, follower_count, outcome, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,105 @@
+"""
+Almacén columnar de resultados (Parquet) particionado por cuenta y fecha.
+Cada ejecución añade un fichero nuevo en account=<cuenta>/run_date=<AAAA-MM-DD>/
+sin reescribir los anteriores, con columnas tipadas. Leer un trimestre de una
+cuenta es una única lectura del dataset filtrada por partición, en lugar de
+buscar y parsear cientos de CSV.
+Requiere pyarrow (opcional): sin él, ResultsStore.available es False.
+"""
+
+import datetime  # Fecha de la partición y marca de la ejecución. Usado en ResultsStore.append.
+
+import numpy as np  # Columnas vectorizadas. Usado en ResultsStore.append.
+
+from benford_counts import first_digits  # Primer dígito vectorizado. Usado en ResultsStore.append.
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # Dependencia opcional
+    pa = ds = pq = None
+
+PARTITION_COLUMNS = ("account", "run_date")
+
+
+def results_schema():
+    return pa.schema([
+        ("account", pa.string()),
+        ("run_date", pa.string()),
+        ("run_id", pa.string()),
+        ("page_type", pa.string()),
+        ("scraped_at", pa.timestamp("s")),
+        ("username", pa.string()),
+        ("num_followers", pa.int64()),
+        ("first_digit", pa.int8()),
+    ])
+
+
+class ResultsStore:
+    """Dataset Parquet con particiones hive account=/run_date="""
+
+    available = pa is not None
+
+    def __init__(self, root):
+        if not self.available:
+            raise ImportError("pyarrow no está instalado (pip install pyarrow)")
+        self.root = root
+        self.schema = results_schema()
+        self.partitioning = ds.partitioning(
+            pa.schema([(column, pa.string()) for column in PARTITION_COLUMNS]), flavor="hive"
+        )
+
+    def append(self, account, page_type, results_dict, run_id, scraped_at=None):
+        """
+        Añade los resultados de una ejecución ({username: count|None}) como un fichero nuevo
+        de su partición. Devuelve el número de filas escritas.
+        """
+        scraped_at = scraped_at or datetime.datetime.now()
+        usernames = list(results_dict)
+        # None -> NaN al convertir a float64
+        counts = np.array(list(results_dict.values()), dtype=np.float64)
+        missing = np.isnan(counts)
+        rows = len(usernames)
+
+        table = pa.table({
+            "account": pa.array([account] * rows, pa.string()),
+            "run_date": pa.array([scraped_at.date().isoformat()] * rows, pa.string()),
+            "run_id": pa.array([run_id] * rows, pa.string()),
+            "page_type": pa.array([page_type] * rows, pa.string()),
+            "scraped_at": pa.array([scraped_at.replace(microsecond=0)] * rows, pa.timestamp("s")),
+            "username": pa.array(usernames, pa.string()),
+            "num_followers": pa.array(np.nan_to_num(counts).astype(np.int64), pa.int64(), mask=missing),
+            "first_digit": pa.array(first_digits(counts), pa.int8(), mask=missing),
+        }, schema=self.schema)
+
+        pq.write_to_dataset(
+            table,
+            self.root,
+            partitioning=self.partitioning,
+            # Un fichero por ejecución y tipo: en modo job una cuenta puede tener followers y following
+            basename_template=f"{run_id}-{page_type}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        return rows
+
+    def dataset(self):
+        return ds.dataset(self.root, schema=self.schema, format="parquet", partitioning=self.partitioning)
+
+    def read(self, account=None, since=None, until=None, columns=None):
+        """
+        Lee los resultados filtrando por partición: cuenta y rango de fechas (AAAA-MM-DD, inclusivo).
+        Devuelve una tabla de pyarrow (.to_pandas() para un DataFrame).
+        """
+        conditions = []
+        if account is not None:
+            conditions.append(ds.field("account") == account)
+        if since is not None:
+            conditions.append(ds.field("run_date") >= str(since))
+        if until is not None:
+            conditions.append(ds.field("run_date") <= str(until))
+
+        condition = None
+        for expression in conditions:
+            condition = expression if condition is None else condition & expression
+        return self.dataset().to_table(columns=columns, filter=condition)
@@ -0,0 +1,17 @@
+"""
+Fixtures compartidas. ig_scraper lee su configuración al importarse: se importa
+una sola vez, con el entorno de los benchmarks y apuntando a un puerto cerrado.
+"""
+
+import pytest
+
+from benchmarks.common import configure_env
+
+
+@pytest.fixture(scope="session")
+def ig_scraper(tmp_path_factory):
+    configure_env("http://127.0.0.1:9", METRICS_FORMAT="off", RESULTS_STORE="off")
+    import ig_scraper
+    # Los mensajes de los tests van a un log temporal, no a logs/
+    ig_scraper.logger.log_file = str(tmp_path_factory.mktemp("logs") / "test_log.txt")
+    return ig_scraper
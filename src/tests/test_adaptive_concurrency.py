@@ -0,0 +1,106 @@
+"""
+Tests de AdaptiveConcurrency: aumento aditivo, recorte multiplicativo con enfriamiento
+y saturated(), que decide cuándo un worker suelta su página antes de esperar hueco.
+"""
+
+import asyncio
+
+from adaptive_concurrency import AdaptiveConcurrency
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_initial_limit_is_clamped():
+    assert AdaptiveConcurrency(initial=50, minimum=2, maximum=10).current == 10
+    assert AdaptiveConcurrency(initial=0, minimum=2, maximum=10).current == 2
+
+
+def test_additive_increase_after_a_full_window():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=4, maximum=10)
+        # +1/límite por éxito: con límite 4, cinco éxitos pasan de 5 (4 no llegan: 4.92)
+        for _ in range(5):
+            await controller.acquire()
+            await controller.release(congested=False)
+        return controller
+
+    controller = run(scenario())
+    assert controller.current == 5
+    assert controller.history[-1][1:] == (5, "estable")
+
+
+def test_increase_stops_at_maximum():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=3, maximum=3)
+        for _ in range(10):
+            await controller.acquire()
+            await controller.release(congested=False)
+        return controller
+
+    assert run(scenario()).current == 3
+
+
+def test_congestion_halves_once_per_cooldown():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=16, minimum=2, cooldown=60)
+        for _ in range(3):
+            await controller.acquire()
+            await controller.release(congested=True)
+        return controller
+
+    controller = run(scenario())
+    assert controller.current == 8
+    assert [reason for _, _, reason in controller.history] == ["inicio", "congestión"]
+
+
+def test_congestion_never_goes_below_minimum():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=4, minimum=3, cooldown=0)
+        for _ in range(5):
+            await controller.acquire()
+            await controller.release(congested=True)
+        return controller
+
+    assert run(scenario()).current == 3
+
+
+def test_high_latency_holds_the_limit():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=2, maximum=10, latency_target=1.0)
+        for _ in range(6):
+            await controller.acquire()
+            await controller.release(congested=False, latency=5.0)
+        return controller
+
+    assert run(scenario()).current == 2
+
+
+def test_saturated_tracks_in_flight_against_limit():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=2, maximum=2)
+        states = [controller.saturated()]
+        await controller.acquire()
+        states.append(controller.saturated())
+        await controller.acquire()
+        states.append(controller.saturated())
+        await controller.release(congested=False)
+        states.append(controller.saturated())
+        return states
+
+    assert run(scenario()) == [False, False, True, False]
+
+
+def test_acquire_waits_until_release():
+    async def scenario():
+        controller = AdaptiveConcurrency(initial=1, maximum=1)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        blocked = not waiter.done()
+        await controller.release(congested=False)
+        await asyncio.wait_for(waiter, 1)
+        return blocked, controller.in_flight
+
+    assert run(scenario()) == (True, 1)
@@ -0,0 +1,36 @@
+"""
+Tests de la FASE 4 en ig_scraper: benford_analyzer (y pandas) no se cargan al arrancar el scraper,
+solo cuando run_benford_phase construye el informe.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRAPER = """
+import sys
+sys.modules["pyarrow"] = None  # Sin el almacén Parquet opcional, que carga pandas por su cuenta
+from benchmarks.common import configure_env
+configure_env("http://127.0.0.1:9", METRICS_FORMAT="off", RESULTS_STORE="off")
+import ig_scraper
+print(" ".join(name for name in ("benford_analyzer", "benford_stats", "pandas") if name in sys.modules))
+"""
+
+
+def test_import_does_not_load_benford_analyzer():
+    loaded = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRAPER],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    assert loaded == []
+
+
+def test_benford_phase_builds_the_report(ig_scraper, monkeypatch, tmp_path):
+    monkeypatch.setattr(ig_scraper, "BENFORD_PLOT", False)
+    monkeypatch.setattr(ig_scraper, "BENFORD_BOOTSTRAP", 0)
+    counts = {f"user_{i}": count for i, count in enumerate([1, 12, 130, 1400, 15, 160, 1700, 18, 190, 2] * 10)}
+    report = ig_scraper.run_benford_phase(counts, str(tmp_path / "results.csv"))
+    assert report is not None
+    assert report["pruebas"]
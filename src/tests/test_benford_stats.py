@@ -0,0 +1,143 @@
+"""
+Tests de benford_stats con valores de referencia: cuantiles tabulados de chi-cuadrado,
+proporciones teóricas de Benford y casos límite de los histogramas de dígitos.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from benford_stats import (
+    CHI_SQUARE_CRITICAL,
+    TEST_DIGITS,
+    benford_test,
+    chi_square_critical,
+    chi_square_p_value,
+    digit_histogram_for,
+    expected_proportions,
+    mad_conformity,
+    run_benford_tests,
+)
+
+
+@pytest.mark.parametrize("alpha", sorted(CHI_SQUARE_CRITICAL))
+@pytest.mark.parametrize("dof", [8, 9, 89])
+def test_p_value_at_tabulated_critical_values(alpha, dof):
+    # Los valores tabulados tienen 3 decimales: el p-valor coincide con alpha a 1e-4
+    assert chi_square_p_value(CHI_SQUARE_CRITICAL[alpha][dof], dof) == pytest.approx(alpha, abs=1e-4)
+
+
+def test_p_value_at_15_507_with_8_dof():
+    assert chi_square_p_value(15.507, 8) == pytest.approx(0.05, abs=1e-4)
+
+
+@pytest.mark.parametrize("statistic, dof, expected", [
+    # Q(1, x/2) = e^(-x/2) con 2 grados de libertad: comprueba las dos ramas (serie y fracción continua)
+    (0.5, 2, math.exp(-0.25)),
+    (3.0, 2, math.exp(-1.5)),
+    (40.0, 2, math.exp(-20)),
+    # Mediana de chi-cuadrado con 1 gl
+    (0.454936, 1, 0.5),
+])
+def test_p_value_closed_forms(statistic, dof, expected):
+    assert chi_square_p_value(statistic, dof) == pytest.approx(expected, rel=1e-6)
+
+
+def test_p_value_bounds():
+    assert chi_square_p_value(0.0, 8) == 1.0
+    assert chi_square_p_value(-1.0, 8) == 1.0
+    assert 0.0 <= chi_square_p_value(1e4, 8) < 1e-100
+
+
+def test_wilson_hilferty_close_to_table():
+    # Fuera de la tabla se aproxima; con 89 gl la aproximación está a menos de 0.05 del valor tabulado
+    table = CHI_SQUARE_CRITICAL[0.05][89]
+    assert chi_square_critical(89, 0.05) == table
+    approx = 89 * (1 - 2 / (9 * 89) + 1.6449 * math.sqrt(2 / (9 * 89))) ** 3
+    assert approx == pytest.approx(table, abs=0.05)
+    assert chi_square_p_value(chi_square_critical(20, 0.05), 20) == pytest.approx(0.05, abs=1e-3)
+
+
+@pytest.mark.parametrize("test", sorted(TEST_DIGITS))
+def test_expected_proportions_sum_to_one(test):
+    proportions = expected_proportions(test)
+    assert proportions.shape == TEST_DIGITS[test].shape
+    assert proportions.sum() == pytest.approx(1.0, abs=1e-12)
+
+
+def test_expected_proportions_golden_values():
+    assert expected_proportions("first")[0] == pytest.approx(0.30103, abs=1e-5)
+    assert expected_proportions("first")[8] == pytest.approx(0.04576, abs=1e-5)
+    assert expected_proportions("second")[0] == pytest.approx(0.11968, abs=1e-5)
+    assert expected_proportions("second")[9] == pytest.approx(0.08500, abs=1e-5)
+    assert expected_proportions("first_two")[0] == pytest.approx(0.04139, abs=1e-5)
+
+
+def test_histogram_ignores_zero_and_negatives():
+    histogram = digit_histogram_for([0, -5, -123, 1, 25, 300], "first")
+    assert histogram.tolist() == [1, 1, 1, 0, 0, 0, 0, 0, 0]
+
+
+def test_histogram_ignores_non_finite():
+    histogram = digit_histogram_for([np.nan, np.inf, -np.inf, 7], "first")
+    assert histogram.tolist() == [0, 0, 0, 0, 0, 0, 1, 0, 0]
+
+
+def test_one_digit_values_have_no_second_digit():
+    values = [1, 5, 9]
+    assert digit_histogram_for(values, "first").sum() == 3
+    assert digit_histogram_for(values, "second").sum() == 0
+    assert digit_histogram_for(values, "first_two").sum() == 0
+
+
+def test_second_and_first_two_digits():
+    values = [10, 19, 105, 1234, 99, 990]
+    assert digit_histogram_for(values, "second").tolist() == [2, 0, 1, 0, 0, 0, 0, 0, 0, 3]
+    first_two = digit_histogram_for(values, "first_two")
+    assert first_two.shape == (90,)
+    assert {index + 10: count for index, count in enumerate(first_two) if count} == {10: 2, 12: 1, 19: 1, 99: 2}
+
+
+def test_perfect_benford_sample_conforms():
+    counts = np.round(expected_proportions("first") * 100_000).astype(int)
+    result = benford_test(counts, "first", bootstrap=0)
+    assert result.chi_square < 0.1
+    assert result.chi_square_p_value > 0.99
+    assert not result.chi_square_reject
+    assert result.mad_conformity == "conformidad cercana"
+    assert result.chi_square_ci is None
+
+
+def test_uniform_sample_is_rejected():
+    result = benford_test([1000] * 9, "first", bootstrap=200, seed=1)
+    assert result.chi_square_reject
+    assert result.ks_reject
+    assert result.chi_square_p_value < 1e-100
+    assert result.mad_conformity == "sin conformidad"
+    low, high = result.chi_square_ci
+    assert low <= result.chi_square <= high
+    assert len(result.observed_ci) == 9
+
+
+def test_bootstrap_is_reproducible_with_seed():
+    counts = [30, 18, 12, 10, 8, 7, 6, 5, 4]
+    assert benford_test(counts, bootstrap=100, seed=7).mad_ci == benford_test(counts, bootstrap=100, seed=7).mad_ci
+
+
+def test_invalid_histograms():
+    with pytest.raises(ValueError):
+        benford_test([1, 2, 3], "first")
+    with pytest.raises(ValueError):
+        benford_test([0] * 9, "first")
+
+
+def test_mad_bands():
+    assert mad_conformity(0.006, "first") == "conformidad cercana"
+    assert mad_conformity(0.0061, "first") == "conformidad aceptable"
+    assert mad_conformity(0.02, "second") == "sin conformidad"
+
+
+def test_run_benford_tests_skips_empty_tests():
+    results = run_benford_tests([1, 2, 3, 4], bootstrap=0)
+    assert set(results) == {"first"}
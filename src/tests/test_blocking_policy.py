@@ -0,0 +1,121 @@
+"""
+Tests de BlockingPolicy y BandwidthStats: orden de las reglas, filtro de ruta
+(todo lo que decide() bloquea por URL tiene que pasar el filtro) y contabilidad de bytes.
+"""
+
+import asyncio
+
+import pytest
+
+from blocking_policy import DEFAULT_POLICY, BandwidthStats, BlockingPolicy
+
+# (url, tipo de recurso que le daría el navegador)
+REQUESTS = [
+    ("https://www.instagram.com/", "document"),
+    ("https://www.instagram.com/user_1/", "document"),
+    ("https://www.instagram.com/static/bundles/app.js", "script"),
+    ("https://www.instagram.com/logging_client_events?x=1", "fetch"),
+    ("https://www.instagram.com/ajax/bz", "xhr"),
+    ("https://www.instagram.com/api/v1/users/web_profile_info/?username=a", "fetch"),
+    ("https://scontent.cdninstagram.com/v/t51/photo.jpg?stp=dst", "image"),
+    ("https://scontent.cdninstagram.com/v/t51/clip.MP4", "media"),
+    ("https://static.cdninstagram.com/fonts/ig.woff2", "font"),
+    ("https://connect.facebook.net/en_US/sdk.js", "script"),
+    ("https://stats.g.doubleclick.net:443/collect", "image"),
+    ("https://user:pw@www.googletagmanager.com/gtm.js", "script"),
+    ("https://notdoubleclick.net/", "document"),
+    ("https://doubleclick.net.example.com/", "document"),
+]
+
+
+@pytest.fixture
+def policy():
+    return BlockingPolicy.from_dict(DEFAULT_POLICY)
+
+
+def test_rule_order(policy):
+    assert policy.decide("https://www.instagram.com/static/a.css", "stylesheet") == (False, "deny_pattern")
+    assert policy.decide("https://connect.facebook.net/sdk.js", "script") == (False, "deny_domain")
+    assert policy.decide("https://www.instagram.com/a.png", "image") == (False, "deny_type")
+    assert policy.decide("https://www.instagram.com/user/", "document") == (True, "default")
+
+    allowing = BlockingPolicy.from_dict({**DEFAULT_POLICY, "allow_patterns": ["*/static/keep/*"]})
+    assert allowing.decide("https://www.instagram.com/static/keep/a.js", "script") == (True, "allow_pattern")
+
+
+@pytest.mark.parametrize("url, resource_type", REQUESTS)
+def test_route_filter_covers_every_block(policy, url, resource_type):
+    allowed, _ = policy.decide(url, resource_type)
+    if not allowed:
+        assert policy.route_filter().search(url)
+
+
+def test_route_filter_skips_ordinary_requests(policy):
+    route_filter = policy.route_filter()
+    for url in ("https://www.instagram.com/user_1/", "https://www.instagram.com/api/v1/users/web_profile_info/",
+                "https://notdoubleclick.net/", "https://doubleclick.net.example.com/"):
+        assert not route_filter.search(url), url
+
+
+def test_route_filter_is_javascript_compatible(policy):
+    # Solo construcciones comunes a Python y JavaScript: ni (?s:, ni \Z, ni grupos con nombre
+    pattern = policy.route_filter().pattern
+    for construct in ("(?s", r"\Z", "(?P<", "(?#"):
+        assert construct not in pattern
+
+
+@pytest.mark.parametrize("override", [
+    {"allow_domains": ["instagram.com"]},
+    {"default": "deny"},
+    {"deny_types": ["script"]},
+    {"deny_patterns": ["*/static/[ab]*"]},
+])
+def test_route_filter_falls_back_to_all_requests(override):
+    assert BlockingPolicy.from_dict({**DEFAULT_POLICY, **override}).route_filter() is None
+
+
+def test_empty_policy_intercepts_nothing():
+    route_filter = BlockingPolicy().route_filter()
+    assert not route_filter.search("https://www.instagram.com/a.png")
+
+
+class FakeRequest:
+    def __init__(self, resource_type, sizes=None, error=None):
+        self.resource_type = resource_type
+        self._sizes = sizes
+        self._error = error
+
+    async def sizes(self):
+        if self._error:
+            raise self._error
+        return self._sizes
+
+
+def test_record_finished_counts_received_bytes():
+    stats = BandwidthStats()
+
+    async def scenario():
+        await stats.record_finished(FakeRequest("document", {"responseBodySize": 1000, "responseHeadersSize": 200}))
+        await stats.record_finished(FakeRequest("fetch", {"responseBodySize": 0, "responseHeadersSize": 0}))
+        await stats.record_finished(FakeRequest("script", error=RuntimeError("sin respuesta")))
+
+    asyncio.run(scenario())
+    assert stats.bytes[("allowed", "document")] == 1200
+    assert stats.total("allowed") == 3
+    assert stats.unsized == 2
+    assert "2 respuestas sin tamaño" in stats.summary_lines()[0]
+
+
+def test_merge_and_reset():
+    shard = BandwidthStats()
+    shard.record("allowed", "document", 500)
+    shard.record("blocked", "image")
+    shard.unsized = 3
+    total = BandwidthStats()
+    total.merge(shard.as_dict())
+    total.merge(shard.as_dict())
+    assert total.bytes[("allowed", "document")] == 1000
+    assert total.total("blocked") == 2
+    assert total.unsized == 6
+    total.reset()
+    assert total.summary_lines() == []
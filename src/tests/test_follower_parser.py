@@ -0,0 +1,86 @@
+"""
+Tests del parser multidioma de seguidores: separadores, sufijos, conectores
+y el camino de textos largos (búsqueda por palabra clave).
+"""
+
+import pytest
+
+from follower_parser import SHORT_TEXT_LENGTH, FollowerCountParser, number_to_int, parse_follower_count
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1,234 followers", 1_234),
+    ("3.223 seguidores", 3_223),
+    ("12 345 abonnés", 12_345),
+    ("12\u202f345 abonnés", 12_345),  # Espacio fino
+    ("1 follower", 1),
+    ("10.5K followers", 10_500),
+    ("1,2 mil seguidores", 1_200),
+    ("3 M seguidores", 3_000_000),
+    ("1.2B followers", 1_200_000_000),
+    ("4,5 mill. seguidores", 4_500_000),
+    ("2 mil millones de seguidores", 2_000_000_000),
+    ("2 mil millones seguidores", 2_000_000_000),
+    ("1,5 mil millones de seguidores", 1_500_000_000),
+    ("3 millones de seguidores", 3_000_000),
+    ("1 millón de seguidores", 1_000_000),
+    ("1,5 mi seguidores", 1_500_000),
+    ("2 mil milhões de seguidores", 2_000_000_000),
+    ("1,2 milhões de seguidores", 1_200_000),
+    ("3 bi seguidores", 3_000_000_000),
+    ("1,2 Mio. Follower", 1_200_000),
+    ("7 Mrd. Follower", 7_000_000_000),
+    ("2,3 Md abonnés", 2_300_000_000),
+    ("5 mln follower", 5_000_000),
+])
+def test_parses_each_locale(text, expected):
+    assert parse_follower_count(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    None,
+    "no numbers here",
+    "1,234 following",
+    "1.234 de seguidores",  # El conector solo vale detrás de un sufijo
+    "123 unfollowers",
+])
+def test_returns_none_without_a_count(text):
+    assert parse_follower_count(text) is None
+
+
+def test_first_count_wins():
+    assert parse_follower_count("1,000 followers · 200 following · 5 followers") == 1_000
+
+
+def test_long_text_uses_keyword_search():
+    text = "x " * SHORT_TEXT_LENGTH + "2 mil millones de seguidores " + "y " * 100
+    assert len(text) > SHORT_TEXT_LENGTH
+    assert parse_follower_count(text) == 2_000_000_000
+
+
+def test_long_text_without_keyword():
+    assert parse_follower_count("1,234 " * 200) is None
+
+
+def test_number_to_int_is_exact():
+    assert number_to_int("1,234") == 1_234
+    assert number_to_int("12.5") == 12
+    assert number_to_int("10.5", 1_000) == 10_500
+    assert number_to_int("1.23456", 1_000_000) == 1_234_560
+
+
+def test_custom_locale_table():
+    parser = FollowerCountParser({
+        "xx": {"keywords": ("fans",), "suffixes": {"kilo": 1_000}, "connectors": ("of",)},
+    })
+    assert parser.parse("3 kilo of fans") == 3_000
+    assert parser.parse("3 kilo followers") is None
+
+
+def test_conflicting_suffix_multipliers_are_rejected():
+    with pytest.raises(ValueError):
+        FollowerCountParser({
+            "a": {"keywords": ("x",), "suffixes": {"m": 1_000_000}},
+            "b": {"keywords": ("y",), "suffixes": {"m": 1_000}},
+        })
@@ -0,0 +1,43 @@
+"""
+Tests de get_follower_count_http con un transporte falso de httpx: cada respuesta rara
+debe acabar en un outcome, nunca en una excepción que tumbe al worker.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+
+def fetch(ig_scraper, api_body, content_type="application/json", status=200):
+    def handler(request):
+        if request.url.path.startswith("/api/"):
+            return httpx.Response(status, content=api_body, headers={"content-type": content_type})
+        return httpx.Response(200, text="<html></html>")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await ig_scraper.get_follower_count_http(client, "someone", 1)
+
+    return asyncio.run(run())
+
+
+def test_profile_json(ig_scraper):
+    body = json.dumps({"data": {"user": {"edge_followed_by": {"count": 1234}}}})
+    assert fetch(ig_scraper, body) == ("someone", 1234, ig_scraper.OUTCOME_FOUND)
+
+
+def test_null_user_is_not_found(ig_scraper):
+    body = json.dumps({"data": {"user": None}})
+    assert fetch(ig_scraper, body) == ("someone", None, ig_scraper.OUTCOME_NOT_FOUND)
+
+
+@pytest.mark.parametrize("body", [json.dumps([1, 2]), json.dumps("checkpoint"), json.dumps(None)])
+def test_json_that_is_not_an_object_is_a_parse_error(ig_scraper, body):
+    assert fetch(ig_scraper, body) == ("someone", None, ig_scraper.OUTCOME_PARSE_ERROR)
+
+
+@pytest.mark.parametrize("body", [json.dumps({"data": ["x"]}), json.dumps({"data": {"user": {}}}), "{"])
+def test_unexpected_schema_is_an_error(ig_scraper, body):
+    assert fetch(ig_scraper, body) == ("someone", None, ig_scraper.OUTCOME_ERROR)
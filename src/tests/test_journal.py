@@ -0,0 +1,47 @@
+"""
+Tests de ResultJournal: el diario lo comparten el proceso principal y los shards (cada uno con su
+propio descriptor), así que todos deben escribir al final del fichero.
+"""
+
+
+def test_parent_and_shard_appends_interleave(ig_scraper, tmp_path):
+    path = str(tmp_path / "journal.csv")
+    found = ig_scraper.OUTCOME_FOUND
+    parent = ig_scraper.ResultJournal(path, flush_every=1)
+    # Un shard abre el mismo diario como en run_profile_shard
+    shard = ig_scraper.ResultJournal(path, resume=True, flush_every=1)
+
+    shard.append("shard_1", 10, found)
+    shard.append("shard_2", 20, found)
+    parent.append("parent_1", 30, found)
+    shard.append("shard_3", 40, found)
+    shard.close()
+    parent.append("parent_2", None, ig_scraper.OUTCOME_NOT_FOUND)
+    parent.close()
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert lines == [
+        "Username_Follower,Num_Followers,Outcome",
+        "shard_1,10,found",
+        "shard_2,20,found",
+        "parent_1,30,found",
+        "shard_3,40,found",
+        "parent_2,,not_found",
+    ]
+    assert len(ig_scraper.ResultJournal.load(path)) == 5
+
+
+def test_fresh_journal_truncates_the_previous_run(ig_scraper, tmp_path):
+    path = str(tmp_path / "journal.csv")
+    old = ig_scraper.ResultJournal(path)
+    old.append("old", 1, ig_scraper.OUTCOME_FOUND)
+    old.close()
+
+    ig_scraper.ResultJournal(path).close()
+    assert ig_scraper.ResultJournal.load(path) == {}
+
+    resumed = ig_scraper.ResultJournal(path, resume=True)
+    resumed.append("new", 2, ig_scraper.OUTCOME_FOUND)
+    resumed.close()
+    assert ig_scraper.ResultJournal.load(path) == {"new": (2, ig_scraper.OUTCOME_FOUND)}
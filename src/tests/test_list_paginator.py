@@ -0,0 +1,143 @@
+"""
+Tests de FollowerListPaginator sin navegador: se le dan respuestas (status, body)
+como las del mock de Instagram y se comprueban las URLs y el estado.
+"""
+
+import json
+
+import pytest
+
+
+def profile_body(user_id="42"):
+    return json.dumps({"data": {"user": {"id": user_id}}})
+
+
+def page_body(usernames, next_max_id=None, counts=None):
+    users = []
+    for username in usernames:
+        user = {"username": username}
+        if counts and username in counts:
+            user["follower_count"] = counts[username]
+        users.append(user)
+    return json.dumps({"users": users, "next_max_id": next_max_id})
+
+
+@pytest.fixture
+def paginator(ig_scraper):
+    def make(target_count=10, **kwargs):
+        return ig_scraper.FollowerListPaginator("acc", "followers", target_count, **kwargs)
+    return make
+
+
+def test_resolves_id_then_follows_cursor(ig_scraper, paginator):
+    pager = paginator(target_count=10)
+    assert pager.next_url().endswith("/api/v1/users/web_profile_info/?username=acc")
+    assert pager.accept(200, profile_body("42")) == []
+
+    first = pager.next_url()
+    assert f"/api/v1/friendships/42/followers/?count={ig_scraper.LIST_API_PAGE_SIZE}" in first
+    assert "max_id" not in first
+    assert pager.accept(200, page_body(["a", "b"], next_max_id="c1")) == ["a", "b"]
+    assert pager.next_url().endswith("&max_id=c1")
+
+    assert pager.accept(200, page_body(["c"])) == ["c"]
+    assert pager.exhausted
+    assert pager.next_url() is None
+    assert pager.result() == ["a", "b", "c"]
+    assert pager.pages == 2
+
+
+def test_stops_at_target_count(paginator):
+    pager = paginator(target_count=3)
+    pager.accept(200, profile_body())
+    assert pager.accept(200, page_body(["a", "b", "c", "d", "e"], next_max_id="c1")) == ["a", "b", "c"]
+    assert pager.next_url() is None
+    assert pager.result() == ["a", "b", "c"]
+
+
+def test_skips_duplicates_and_the_account_itself(paginator):
+    seen = []
+    pager = paginator(on_username=seen.append)
+    pager.accept(200, profile_body())
+    pager.accept(200, page_body(["a", "acc", "b"], next_max_id="c1"))
+    assert pager.accept(200, page_body(["b", "c", None], next_max_id="c2")) == ["c"]
+    assert seen == ["a", "b", "c"]
+
+
+def test_repeated_cursor_ends_the_list(paginator):
+    pager = paginator()
+    pager.accept(200, profile_body())
+    pager.accept(200, page_body(["a"], next_max_id="same"))
+    assert not pager.exhausted
+    pager.accept(200, page_body(["b"], next_max_id="same"))
+    assert pager.exhausted
+
+
+def test_records_list_counts(ig_scraper, paginator):
+    pager = paginator()
+    pager.accept(200, profile_body())
+    pager.accept(200, page_body(["counted", "uncounted"], counts={"counted": 1234}))
+    assert ig_scraper.list_counts["counted"] == 1234
+    assert "uncounted" not in ig_scraper.list_counts
+
+
+@pytest.mark.parametrize("status, body", [(404, ""), (200, json.dumps({"data": {"user": None}}))])
+def test_missing_account_ends_without_failing(paginator, status, body):
+    pager = paginator()
+    pager.accept(status, body)
+    assert pager.exhausted and not pager.failed
+    assert pager.next_url() is None
+    assert pager.result() == []
+
+
+def test_consecutive_errors_fail_with_backoff(ig_scraper, paginator):
+    pager = paginator()
+    pager.accept(200, profile_body())
+    assert pager.delay() == (1.0, 2.0)
+    for attempt in range(1, ig_scraper.LIST_API_MAX_ERRORS):
+        pager.accept(500, "")
+        backoff = 5 * 2 ** (attempt - 1)
+        assert pager.delay() == (backoff, backoff * 1.5)
+        assert not pager.failed and pager.next_url() is not None
+    pager.accept(200, "not json")
+    assert pager.failed
+    assert pager.next_url() is None
+    # None: quien la usa vuelve al modo dom
+    assert pager.result() is None
+
+
+def test_success_resets_the_error_count(ig_scraper, paginator):
+    pager = paginator()
+    pager.accept(200, profile_body())
+    for _ in range(ig_scraper.LIST_API_MAX_ERRORS - 1):
+        pager.accept(429, "")
+    assert pager.errors == ig_scraper.LIST_API_MAX_ERRORS - 1
+    pager.accept(200, page_body(["a"], next_max_id="c1"))
+    assert pager.errors == 0
+    # La cuenta vuelve a empezar: otros MAX - 1 fallos seguidos no bastan para abandonar la API
+    for _ in range(ig_scraper.LIST_API_MAX_ERRORS - 1):
+        pager.accept(500, "")
+    assert pager.errors == ig_scraper.LIST_API_MAX_ERRORS - 1
+    assert not pager.failed and not pager.exhausted
+    assert pager.next_url() is not None
+
+
+@pytest.mark.parametrize("body", [json.dumps({"no_users": []}), json.dumps({"users": None}), json.dumps([1, 2])])
+def test_page_without_users_counts_as_an_error(ig_scraper, paginator, body):
+    pager = paginator()
+    pager.accept(200, profile_body())
+    pager.accept(200, page_body(["a"], next_max_id="c1"))
+    for _ in range(ig_scraper.LIST_API_MAX_ERRORS):
+        assert not pager.exhausted
+        pager.accept(200, body)
+    # No se trunca la lista como si la cuenta no existiera: se vuelve al modo dom
+    assert pager.failed and not pager.exhausted
+    assert pager.result() is None
+
+
+@pytest.mark.parametrize("body", [json.dumps({"status": "fail"}), json.dumps({"data": {"user": {}}})])
+def test_profile_without_user_id_counts_as_an_error(paginator, body):
+    pager = paginator()
+    pager.accept(200, body)
+    assert pager.errors == 1
+    assert not pager.exhausted and pager.user_id is None
@@ -0,0 +1,49 @@
+"""
+Tests de LogWriter: los procesos hijos envían sus registros al padre (share/attach)
+y solo el padre escribe y rota el fichero.
+"""
+
+import glob
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from log_writer import LogWriter
+
+writer = None
+
+
+def write_lines(prefix, count):
+    for i in range(count):
+        writer.write(f"{prefix}-{i:04d}", "INFO")
+    return prefix
+
+
+def test_child_records_reach_parent_file(tmp_path):
+    global writer
+    writer = LogWriter(str(tmp_path / "run.txt"), max_bytes=4096, backup_count=50)
+    writer.write("padre", "INFO")
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(
+        max_workers=3, mp_context=context, initializer=writer.attach, initargs=(writer.share(),)
+    ) as pool:
+        assert sorted(pool.map(write_lines, ["a", "b", "c"], [300] * 3)) == ["a", "b", "c"]
+    writer.close()
+
+    lines = []
+    for path in glob.glob(str(tmp_path / "run.txt*")):
+        with open(path, encoding="utf-8") as f:
+            lines += [line.rstrip("\n").rsplit(" ", 1)[-1] for line in f]
+    # Todas las líneas, una sola vez, pese a las rotaciones
+    expected = {"padre"} | {f"{prefix}-{i:04d}" for prefix in "abc" for i in range(300)}
+    assert sorted(lines) == sorted(expected)
+    assert len(glob.glob(str(tmp_path / "run.txt.*"))) > 1
+
+
+def test_write_after_close_reopens(tmp_path):
+    path = tmp_path / "run.txt"
+    log = LogWriter(str(path))
+    log.share()
+    log.close()
+    log.write("otra vez", "WARNING")
+    log.close()
+    assert "[WARNING] otra vez" in path.read_text(encoding="utf-8")
@@ -0,0 +1,40 @@
+"""Tests de Metrics: spans de varios shards y su exportación como histogramas por worker."""
+
+from metrics import Metrics
+
+
+def shard_spans(worker_durations):
+    shard = Metrics()
+    shard.record("profile", 0.5)
+    for worker, duration in worker_durations:
+        shard.record("profile", duration, worker)
+    return shard.spans
+
+
+def test_shard_workers_are_prefixed_on_merge():
+    merged = Metrics()
+    merged.record("profile", 0.1, 1)
+    merged.extend(shard_spans([(1, 0.2), (2, 0.3)]), worker_prefix="s1")
+    merged.extend(shard_spans([(1, 0.4)]), worker_prefix="s2")
+    assert [span["worker"] for span in merged.spans] == [1, "s1", "s1-1", "s1-2", "s2", "s2-1"]
+
+
+def test_extend_does_not_modify_the_shard_spans():
+    spans = shard_spans([(1, 0.2)])
+    Metrics().extend(spans, worker_prefix="s1")
+    assert [span["worker"] for span in spans] == [None, 1]
+
+
+def test_prometheus_keeps_one_histogram_per_shard_worker(tmp_path):
+    merged = Metrics()
+    merged.extend(shard_spans([(1, 0.2)]), worker_prefix="s1")
+    merged.extend(shard_spans([(1, 0.4)]), worker_prefix="s2")
+    path = tmp_path / "metrics.prom"
+    merged.export(str(path), "prometheus")
+    counts = [line for line in path.read_text(encoding="utf-8").splitlines() if "_count{" in line]
+    assert counts == [
+        'ig_scraper_span_seconds_count{span="profile",worker="s1"} 1',
+        'ig_scraper_span_seconds_count{span="profile",worker="s1-1"} 1',
+        'ig_scraper_span_seconds_count{span="profile",worker="s2"} 1',
+        'ig_scraper_span_seconds_count{span="profile",worker="s2-1"} 1',
+    ]
@@ -0,0 +1,64 @@
+"""
+Tests de run_pipeline sin navegador: un productor en el propio bucle (como la extracción con
+Playwright o por API) y workers HTTP falsos que resuelven cada username de la cola.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def pipeline(ig_scraper, monkeypatch):
+    """run_pipeline con el motor HTTP sustituido por workers que cuentan len(username)"""
+    async def fake_http_workers(cookies_file, queue, results, num_workers, journal=None, controller=None):
+        async def worker():
+            while (item := await queue.get()) is not None:
+                index, username = item
+                results[index] = (username, len(username), ig_scraper.OUTCOME_FOUND)
+        await asyncio.gather(*[worker() for _ in range(num_workers)])
+
+    monkeypatch.setattr(ig_scraper, "PROFILE_ENGINE", "http")
+    monkeypatch.setattr(ig_scraper, "RETRY_MAX_PASSES", 0)
+    monkeypatch.setattr(ig_scraper, "run_http_workers", fake_http_workers)
+    return ig_scraper
+
+
+def test_in_loop_producer_queues_every_username_before_the_sentinels(pipeline):
+    usernames = [f"user_{i}" for i in range(20)]
+
+    async def extract(on_username):
+        # Sin await después del último on_username: produce() pone los centinelas justo a continuación
+        for username in usernames:
+            on_username(username)
+
+    followers_list, results = asyncio.run(pipeline.run_pipeline(extract, "cookies.json", 4))
+
+    assert followers_list == usernames
+    assert results == [(username, len(username)) for username in usernames]
+
+
+def test_thread_producer_queues_every_username(pipeline):
+    usernames = [f"user_{i}" for i in range(20)]
+
+    def extract_in_thread(on_username):
+        for username in usernames:
+            on_username(username)
+
+    async def extract(on_username):
+        await asyncio.to_thread(extract_in_thread, on_username)
+
+    followers_list, results = asyncio.run(pipeline.run_pipeline(extract, "cookies.json", 4))
+
+    assert followers_list == usernames
+    assert results == [(username, len(username)) for username in usernames]
+
+
+def test_http_fallback_skips_empty_slots(ig_scraper, monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("no hay perfiles que reintentar")
+
+    monkeypatch.setattr(ig_scraper, "fetch_profiles_playwright", fail)
+    results = [None, ("a", 10, ig_scraper.OUTCOME_FOUND), None]
+    asyncio.run(ig_scraper.retry_failed_with_playwright("cookies.json", results, 4))
+    assert results == [None, ("a", 10, ig_scraper.OUTCOME_FOUND), None]
@@ -0,0 +1,119 @@
+"""
+Tests de ProfileCache: TTL por resultado, caché negativa y resultados transitorios
+(error, timeout, throttled) que nunca se guardan.
+"""
+
+import pytest
+
+import profile_cache
+from profile_cache import (
+    DEFAULT_TTLS,
+    OUTCOME_ERROR,
+    OUTCOME_FOUND,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_PARSE_ERROR,
+    OUTCOME_THROTTLED,
+    OUTCOME_TIMEOUT,
+    ProfileCache,
+)
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(profile_cache.time, "time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ProfileCache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+
+def test_default_ttls():
+    assert DEFAULT_TTLS == {
+        OUTCOME_FOUND: 24 * 3600,
+        OUTCOME_NOT_FOUND: 72 * 3600,
+        OUTCOME_PARSE_ERROR: 1 * 3600,
+    }
+
+
+@pytest.mark.parametrize("outcome, count", [
+    (OUTCOME_FOUND, 1234),
+    (OUTCOME_NOT_FOUND, None),
+    (OUTCOME_PARSE_ERROR, None),
+])
+def test_entry_expires_after_its_ttl(cache, clock, outcome, count):
+    cache.store([("user", count, outcome)])
+    ttl = DEFAULT_TTLS[outcome]
+
+    clock.now += ttl - 1
+    assert cache.get_fresh(["user"]) == {"user": (count, outcome)}
+    clock.now += 1
+    assert cache.get_fresh(["user"]) == {}
+
+
+@pytest.mark.parametrize("outcome", [OUTCOME_ERROR, OUTCOME_TIMEOUT, OUTCOME_THROTTLED])
+def test_transient_outcomes_are_never_cached(cache, clock, outcome):
+    cache.store([("user", None, outcome)])
+    assert cache.get_fresh(["user"]) == {}
+
+
+def test_transient_outcome_keeps_previous_entry(cache, clock):
+    cache.store([("user", 10, OUTCOME_FOUND)])
+    cache.store([("user", None, OUTCOME_TIMEOUT)])
+    assert cache.get_fresh(["user"]) == {"user": (10, OUTCOME_FOUND)}
+
+
+def test_new_result_replaces_old_one(cache, clock):
+    cache.store([("user", 10, OUTCOME_FOUND)])
+    clock.now += 60
+    cache.store([("user", None, OUTCOME_NOT_FOUND)])
+    # El TTL cuenta desde la última escritura y es el del nuevo resultado
+    clock.now += DEFAULT_TTLS[OUTCOME_FOUND]
+    assert cache.get_fresh(["user"]) == {"user": (None, OUTCOME_NOT_FOUND)}
+
+
+def test_custom_ttls_override_defaults(tmp_path, clock):
+    cache = ProfileCache(str(tmp_path / "cache.db"), {OUTCOME_FOUND: 10, OUTCOME_PARSE_ERROR: 0})
+    cache.store([("a", 1, OUTCOME_FOUND), ("b", None, OUTCOME_PARSE_ERROR), ("c", None, OUTCOME_NOT_FOUND)])
+    clock.now += 5
+    assert cache.get_fresh(["a", "b", "c"]) == {"a": (1, OUTCOME_FOUND), "c": (None, OUTCOME_NOT_FOUND)}
+    clock.now += 5
+    assert set(cache.get_fresh(["a", "b", "c"])) == {"c"}
+    cache.close()
+
+
+def test_hit_and_miss_counters(cache, clock):
+    cache.store([("a", 1, OUTCOME_FOUND)])
+    cache.get_fresh(["a", "b"])
+    cache.get_fresh(["a"])
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_lookup_in_chunks_beyond_sqlite_variable_limit(cache, clock):
+    usernames = [f"user{i}" for i in range(1_200)]
+    cache.store([(username, i, OUTCOME_FOUND) for i, username in enumerate(usernames)])
+    fresh = cache.get_fresh(usernames + ["missing"])
+    assert len(fresh) == 1_200
+    assert fresh["user1199"] == (1_199, OUTCOME_FOUND)
+
+
+def test_entries_persist_across_instances(tmp_path, clock):
+    path = str(tmp_path / "cache.db")
+    first = ProfileCache(path)
+    first.store([("user", 5, OUTCOME_FOUND)])
+    first.close()
+    second = ProfileCache(path)
+    assert second.get_fresh(["user"]) == {"user": (5, OUTCOME_FOUND)}
+    second.close()
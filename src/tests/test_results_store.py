@@ -0,0 +1,46 @@
+"""
+Tests del almacén Parquet: particiones por cuenta y fecha y varios objetivos
+de la misma cuenta en una ejecución.
+"""
+
+import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from results_store import ResultsStore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultsStore(str(tmp_path / "store"))
+
+
+def test_two_page_types_of_one_account_in_the_same_run(store):
+    scraped_at = datetime.datetime(2025, 1, 15, 12, 0, 0)
+    store.append("acc", "followers", {"a": 10, "b": None}, "run1", scraped_at)
+    store.append("acc", "following", {"c": 300}, "run1", scraped_at)
+
+    table = store.read(account="acc").sort_by("username")
+    assert table.column("username").to_pylist() == ["a", "b", "c"]
+    assert table.column("page_type").to_pylist() == ["followers", "followers", "following"]
+    assert table.column("num_followers").to_pylist() == [10, None, 300]
+    assert table.column("first_digit").to_pylist() == [1, None, 3]
+
+
+def test_runs_append_without_rewriting(store):
+    day = datetime.datetime(2025, 1, 15, 9, 0, 0)
+    store.append("acc", "followers", {"a": 1}, "run1", day)
+    store.append("acc", "followers", {"a": 2}, "run2", day + datetime.timedelta(hours=1))
+    assert sorted(store.read(account="acc").column("run_id").to_pylist()) == ["run1", "run2"]
+
+
+def test_read_filters_by_account_and_date(store):
+    store.append("acc", "followers", {"a": 1}, "run1", datetime.datetime(2025, 1, 1))
+    store.append("acc", "followers", {"b": 2}, "run2", datetime.datetime(2025, 2, 1))
+    store.append("other", "followers", {"c": 3}, "run3", datetime.datetime(2025, 2, 1))
+
+    assert store.read(account="acc", since="2025-01-15").column("username").to_pylist() == ["b"]
+    assert store.read(until="2025-01-31").column("username").to_pylist() == ["a"]
+    assert store.read().num_rows == 3
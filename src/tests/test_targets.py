@@ -0,0 +1,40 @@
+"""Tests de parse_targets (modo job): formato, validación y objetivos repetidos."""
+
+import pytest
+
+
+def test_full_specs(ig_scraper):
+    assert ig_scraper.parse_targets("a:followers:10, b:following:5") == [
+        ("a", "followers", 10),
+        ("b", "following", 5),
+    ]
+
+
+def test_defaults_come_from_page_and_count(ig_scraper):
+    assert ig_scraper.parse_targets("a") == [("a", ig_scraper.page, ig_scraper.count)]
+
+
+def test_same_account_and_page_keeps_the_largest_count(ig_scraper):
+    assert ig_scraper.parse_targets("a:followers:50,b:followers:5,a:followers:100,a:followers:20") == [
+        ("a", "followers", 100),
+        ("b", "followers", 5),
+    ]
+
+
+def test_same_account_with_both_pages_is_two_targets(ig_scraper):
+    assert ig_scraper.parse_targets("a:followers:50,a:following:50,a:followers:50") == [
+        ("a", "followers", 50),
+        ("a", "following", 50),
+    ]
+
+
+def test_output_files_are_distinct_per_target(ig_scraper):
+    targets = ig_scraper.parse_targets("a:followers:50,a:followers:100,a:following:10")
+    files = [ig_scraper.logger.result_files(target_account, target_page) for target_account, target_page, _ in targets]
+    assert len(set(files)) == len(targets)
+
+
+@pytest.mark.parametrize("spec", ["a:likes:10", ":followers:10", "a:followers:10:x", "a:followers:diez"])
+def test_invalid_specs(ig_scraper, spec):
+    with pytest.raises(ValueError):
+        ig_scraper.parse_targets(spec)